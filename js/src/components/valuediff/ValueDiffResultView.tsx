@@ -194,6 +194,8 @@ function _ValueDiffResultView(
         Model: {params.model}, {result.summary.total} total (
         {result.summary.total - result.summary.added - result.summary.removed}{" "}
         common, {result.summary.added} added, {result.summary.removed} removed)
+        {result.method === "sample" &&
+          ` estimated from a ${(result.sample_percent ?? 0).toFixed(2)}% sample of ${result.sampled_rows} rows`}
       </Box>
 
       <ScreenshotDataGrid
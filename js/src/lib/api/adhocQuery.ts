@@ -12,7 +12,12 @@ export interface QueryPreviewChangeParams {
   primary_keys?: string[];
 }
 
-export interface QueryRunParams {
+export interface QueryPageParams {
+  page_size?: number;
+  page_token?: string;
+}
+
+export interface QueryRunParams extends QueryPageParams {
   sql_template: string;
 }
 
@@ -23,7 +28,7 @@ export interface QueryViewOptions {
 
 export type QueryResult = DataFrame;
 
-export interface QueryDiffParams {
+export interface QueryDiffParams extends QueryPageParams {
   sql_template: string;
   base_sql_template?: string;
   primary_keys?: string[];
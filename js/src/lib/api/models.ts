@@ -7,10 +7,15 @@ export interface RowCount {
   curr: number | null;
 }
 
+export type RowCountMethod = "count" | "metadata";
+
 export interface RowCountDiff {
   name?: string;
   base: number | null;
   curr: number | null;
+  // Set by the "metadata" strategy. The counts read from the metadata are estimates.
+  method?: { base: RowCountMethod; curr: RowCountMethod };
+  estimated?: boolean;
 }
 
 export interface QueryRowCountResult {
@@ -34,6 +34,10 @@ export interface TopKResult {
   values: (string | number | undefined)[];
   counts: number[];
   valids: number;
+  total?: number;
+  // Set when the counts are scaled up from a table sample: the 95% intervals of the total and valid rows
+  total_interval?: [number, number];
+  valids_interval?: [number, number];
 }
 
 export interface TopKDiffResult {
@@ -48,6 +48,7 @@ export interface DataFrame {
   data: RowData[];
   limit?: number;
   more?: boolean;
+  next_page_token?: string;
 }
 
 // ============================================================================
@@ -133,6 +134,7 @@ interface BaseRun {
   };
   error?: string;
   status?: "finished" | "failed" | "cancelled" | "running";
+  queue_position?: number;
 }
 
 export type Run =
@@ -8,12 +8,17 @@ export interface ValueDiffResult {
     removed: number;
   };
   data: DataFrame;
+  scans_saved?: number;
+  method?: "exact" | "sample";
+  sample_percent?: number;
+  sampled_rows?: number;
 }
 
 export interface ValueDiffParams {
   model: string;
   primary_key: string | string[];
   columns?: string[];
+  sample_percent?: number;
 }
 
 export async function submitValueDiff(
@@ -35,6 +35,7 @@ import {
   stateMetadata,
 } from "../api/info";
 import { aggregateRuns, RunsAggregated } from "../api/runs";
+import { Run } from "../api/types";
 import { trackSingleEnvironment } from "../api/track";
 import { PUBLIC_API_URL } from "../const";
 import { useIdleTimeout } from "./IdleTimeoutContext";
@@ -69,6 +70,9 @@ export interface LineageGraphContextType {
 
   runsAggregated?: RunsAggregated;
   refetchRunsAggregated?: () => void;
+
+  // The server pushes run progress and completion while connected
+  connectionStatus?: LineageWatcherStatus;
 }
 
 const defaultLineageGraphsContext: LineageGraphContextType = {
@@ -86,6 +90,14 @@ interface WebSocketRefreshEvent {
   srcPath: string;
 }
 
+interface WebSocketRunEvent {
+  runId: string;
+  status?: Run["status"] | null;
+  progress?: Run["progress"] | null;
+  queuePosition?: number | null;
+  error?: string | null;
+}
+
 interface WebSocketBroadcastEvent {
   id: string;
   title?: string;
@@ -109,6 +121,10 @@ type WebSocketPayload =
   | {
       command: "relaunch";
     }
+  | {
+      command: "run_progress" | "run_completed";
+      event: WebSocketRunEvent;
+    }
   | {
       command: "broadcast";
       event: WebSocketBroadcastEvent;
@@ -193,6 +209,26 @@ function useLineageWatcher() {
           invalidateCaches();
         } else if (data.command === "relaunch") {
           setEnvStatus("relaunch");
+        } else if (data.command === "run_progress") {
+          const { runId, status, progress, queuePosition } = data.event;
+          queryClient.setQueryData<Run>(cacheKeys.run(runId), (run) =>
+            run
+              ? {
+                  ...run,
+                  status: status ?? run.status,
+                  progress: progress ?? undefined,
+                  queue_position: queuePosition ?? undefined,
+                }
+              : run,
+          );
+        } else if (data.command === "run_completed") {
+          void queryClient.invalidateQueries({
+            queryKey: cacheKeys.run(data.event.runId),
+          });
+          void queryClient.invalidateQueries({
+            queryKey: cacheKeys.runs(),
+            exact: true,
+          });
         } else {
           // Handle broadcast events
           const { id, title, description, status, duration } = data.event;
@@ -224,7 +260,7 @@ function useLineageWatcher() {
 
       ref.current.ws = undefined;
     };
-  }, [invalidateCaches]);
+  }, [invalidateCaches, queryClient]);
 
   useEffect(() => {
     const refObj = ref.current;
@@ -384,6 +420,7 @@ export function LineageGraphContextProvider({ children }: LineageGraphProps) {
           refetchRunsAggregated: () => {
             void queryRunAggregated.refetch();
           },
+          connectionStatus,
         }}
       >
         {children}
@@ -8,7 +8,10 @@ import {
 import { cacheKeys } from "@/lib/api/cacheKeys";
 import { cancelRun, waitRun } from "@/lib/api/runs";
 import { Run } from "../api/types";
-import { useRunsAggregated } from "./LineageGraphContext";
+import {
+  useLineageGraphContext,
+  useRunsAggregated,
+} from "./LineageGraphContext";
 
 interface UseRunResult {
   run?: Run;
@@ -23,14 +26,18 @@ export const useRun = (runId?: string): UseRunResult => {
   const [isRunning, setIsRunning] = useState(false);
   const [aborting, setAborting] = useState(false);
   const [, refetchRunsAggregated] = useRunsAggregated();
+  // While connected, the progress and the completion of the run are pushed over the websocket. Poll only as a
+  // fallback.
+  const { connectionStatus } = useLineageGraphContext();
+  const isPushed = connectionStatus === "connected";
 
   const { error, data: run } = useQuery({
     queryKey: cacheKeys.run(runId ?? ""),
     queryFn: async () => {
-      return await waitRun(runId ?? "", isRunning ? 2 : 0);
+      return await waitRun(runId ?? "", isRunning && !isPushed ? 2 : 0);
     },
     enabled: !!runId,
-    refetchInterval: isRunning ? 50 : false,
+    refetchInterval: isRunning ? (isPushed ? 5000 : 50) : false,
     retry: false,
   });
 
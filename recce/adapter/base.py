@@ -11,6 +11,8 @@ logger = logging.getLogger("uvicorn")
 
 
 class BaseAdapter(ABC):
+    # Bumped whenever the loaded artifacts change, so results computed from older artifacts can be told apart
+    artifacts_version: int = 0
 
     @classmethod
     def load(cls, **kwargs):
@@ -90,6 +92,12 @@ class BaseAdapter(ABC):
     def refresh(self, refresh_file_path: str = None):
         pass
 
+    def close(self):
+        """
+        Release the resources held by the adapter, e.g. worker processes. Called when the command or server ends.
+        """
+        pass
+
     def export_artifacts(self) -> ArtifactsRoot:
         return ArtifactsRoot(base={}, current={})
 
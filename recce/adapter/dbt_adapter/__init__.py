@@ -1,13 +1,19 @@
 import json
 import logging
+import multiprocessing
 import os
+import re
+import threading
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import contextmanager
 from copy import deepcopy
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, field, fields
 from errno import ENOENT
 from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
@@ -22,19 +28,33 @@ from typing import (
     Union,
 )
 
+from sqlglot import __version__ as sqlglot_version
+
+from recce import __version__ as recce_version
 from recce.event import log_performance
 from recce.exceptions import RecceException
-from recce.util.cll import CLLPerformanceTracking, cll
+from recce.util.cache import DiskCache, LRUCache, TTLCache
+from recce.util.cll import (
+    CLLPerformanceTracking,
+    cll_worker,
+    dump_cll_outcome,
+    load_cll_outcome,
+)
 from recce.util.lineage import (
+    GraphIndex,
     build_column_key,
     filter_dependency_maps,
     find_downstream,
-    find_upstream,
 )
 from recce.util.perf_tracking import LineagePerfTracker
 
 from ...tasks.profile import ProfileTask
-from ...util.breaking import BreakingPerformanceTracking, parse_change_category
+from ...util.breaking import (
+    BreakingPerformanceTracking,
+    dump_change_category_outcome,
+    load_change_category_outcome,
+    parse_change_category_worker,
+)
 
 try:
     import agate
@@ -73,6 +93,7 @@ from ...tasks import (
     ValueDiffTask,
 )
 from .dbt_version import DbtVersion
+from .manifest_index import ManifestIndex
 
 dbt_supported_registry: Dict[RunType, Type[Task]] = {
     RunType.QUERY: QueryTask,
@@ -144,6 +165,10 @@ def silence_no_nodes_warning():
 
 logger = logging.getLogger("uvicorn")
 MIN_DBT_NODE_COMPOSITION = 3
+# The minimum number of uncached nodes before the sqlglot work is sent to the process pool
+PROCESS_POOL_MIN_NODES = 8
+# The number of rows read at a time when skipping the rows before a page of query results
+QUERY_OFFSET_CHUNK_SIZE = 1000
 
 
 class ArtifactsEventHandler(FileSystemEventHandler):
@@ -212,6 +237,29 @@ def as_manifest(m: WritableManifest) -> Manifest:
         return Manifest.from_writable_manifest(m)
 
 
+def _warm_lookups(manifest: Manifest) -> Manifest:
+    """
+    Build the ref, source and doc lookups of a shared manifest from its current nodes, so that its overlays share them
+    instead of each building their own.
+    """
+    manifest.rebuild_ref_lookup()
+    manifest.rebuild_source_lookup()
+    manifest.rebuild_doc_lookup()
+    return manifest
+
+
+def _overlay_manifest(manifest: Manifest) -> Manifest:
+    """
+    Return a shallow copy of the manifest with its own `nodes` dict, so nodes can be added to it without touching the
+    original. Everything else, including the lookups already built, is shared with the original.
+    """
+    # `copy.copy` goes through `Manifest.__reduce_ex__`, which shares the `nodes` dict and drops the lookups
+    overlay = object.__new__(Manifest)
+    overlay.__dict__.update(manifest.__dict__)
+    overlay.nodes = dict(manifest.nodes)
+    return overlay
+
+
 def load_manifest(path: str = None, data: dict = None):
     if path is not None:
         if not os.path.isfile(path):
@@ -265,6 +313,187 @@ def default_profiles_dir():
         return os.path.expanduser("~/.dbt/")
 
 
+@dataclass
+class _CllJob:
+    """
+    A node whose SQL is compiled and ready to be parsed by `cll`. Everything needed by `cll` is picklable.
+    """
+
+    node: CllNode
+    parent_list: List[str]
+    table_id_map: Dict[str, str]
+    sql: str
+    schema: Dict[str, Dict[str, str]]
+    dialect: str
+
+
+def _apply_all_columns(node: CllNode, parent_list: List[str], transformation_type) -> CllData:
+    cll_data = CllData()
+    cll_data.nodes[node.id] = node
+    cll_data.parent_map[node.id] = set(parent_list)
+    for col in node.columns.values():
+        column_id = f"{node.id}_{col.name}"
+        col.transformation_type = transformation_type
+        cll_data.columns[column_id] = col
+        cll_data.parent_map[column_id] = set()
+    return cll_data
+
+
+def _build_cll_data(job: _CllJob, m2c, c2c_map) -> CllData:
+    node = job.node
+    table_id_map = job.table_id_map
+
+    # Add cll dependency to the node.
+    cll_data = CllData()
+    cll_data.nodes[node.id] = node
+    cll_data.columns = {f"{node.id}_{col.name}": col for col in node.columns.values()}
+
+    # parent map for node
+    depends_on = set(job.parent_list)
+    for d in m2c:
+        parent_key = f"{table_id_map[d.node.lower()]}_{d.column}"
+        depends_on.add(parent_key)
+    cll_data.parent_map[node.id] = depends_on
+
+    # parent map for columns
+    for name, column in node.columns.items():
+        depends_on = set()
+        column_id = f"{node.id}_{name}"
+        if name in c2c_map:
+            for d in c2c_map[name].depends_on:
+                parent_key = f"{table_id_map[d.node.lower()]}_{d.column}"
+                depends_on.add(parent_key)
+            column.transformation_type = c2c_map[name].transformation_type
+        cll_data.parent_map[column_id] = set(depends_on)
+
+    return cll_data
+
+
+@dataclass
+class _ChangeAnalysisJob:
+    """
+    A modified node whose base and current SQL are compiled and ready to be classified by `parse_change_category`.
+    """
+
+    node_diff: NodeDiff
+    base_sql: str
+    curr_sql: str
+    base_schema: Dict[str, Dict[str, str]]
+    curr_schema: Dict[str, Dict[str, str]]
+    dialect: str
+    columns_names: Set[str]
+
+
+_READ_ONLY_SQL_PATTERN = re.compile(r"^\s*(--[^\n]*\n\s*|/\*.*?\*/\s*)*(select|with)\b", re.IGNORECASE | re.DOTALL)
+
+
+def _is_read_only_sql(sql: str) -> bool:
+    """
+    Whether the statement is a query that can be served from the query cache.
+    """
+    return _READ_ONLY_SQL_PATTERN.match(sql) is not None
+
+
+def _get_parent_schema(lineage, node_id: str) -> Dict[str, Dict[str, str]]:
+    schema = {}
+    nodes = lineage["nodes"]
+    parent_list = lineage["parent_map"].get(node_id, [])
+    for parent_id in parent_list:
+        parent_node = nodes.get(parent_id)
+        if parent_node is None:
+            continue
+        columns = parent_node.get("columns") or {}
+        name = parent_node.get("name")
+        if parent_node.get("resource_type") == "source":
+            parts = parent_id.split(".")
+            source = parts[2]
+            table = parts[3]
+            source = source.replace("-", "_")
+            name = f"__{source}__{table}"
+        schema[name] = {name: column.get("type") for name, column in columns.items()}
+    return schema
+
+
+def _apply_node_change(job: _ChangeAnalysisJob, change: NodeChange) -> NodeDiff:
+    # Make sure that the case of the column names are the same
+    changed_columns = {column.lower(): change_status for column, change_status in (change.columns or {}).items()}
+    changed_columns_names = set(changed_columns)
+    changed_columns_final = {}
+
+    for column_name in job.columns_names:
+        if column_name.lower() in changed_columns_names:
+            changed_columns_final[column_name] = changed_columns[column_name.lower()]
+
+    change.columns = changed_columns_final
+    job.node_diff.change = change
+    return job.node_diff
+
+
+# The fields of a manifest node that affect its lineage, CLL and change analysis
+_NODE_SIGNATURE_KEYS = (
+    "checksum",
+    "name",
+    "package_name",
+    "resource_type",
+    "language",
+    "source_name",
+    "config",
+    "depends_on",
+)
+
+
+def _node_signature(node: Optional[dict]) -> Optional[dict]:
+    if node is None:
+        return None
+    return {key: node.get(key) for key in _NODE_SIGNATURE_KEYS}
+
+
+def _changed_manifest_nodes(old_manifest_dict, new_manifest_dict) -> Optional[Set[str]]:
+    """
+    Find the nodes whose definition differs between two manifests, by checksum and dependencies.
+
+    Returns None if the difference cannot be attributed to nodes, e.g. when a macro has changed.
+    """
+    if old_manifest_dict is None or new_manifest_dict is None:
+        return None
+
+    old_macros = {k: v.get("macro_sql") for k, v in old_manifest_dict["macros"].items()}
+    new_macros = {k: v.get("macro_sql") for k, v in new_manifest_dict["macros"].items()}
+    if old_macros != new_macros:
+        return None
+
+    changed = set()
+    for key in ["nodes", "sources", "exposures", "metrics", "semantic_models"]:
+        old_resources = old_manifest_dict.get(key) or {}
+        new_resources = new_manifest_dict.get(key) or {}
+        for unique_id in old_resources.keys() | new_resources.keys():
+            if _node_signature(old_resources.get(unique_id)) != _node_signature(new_resources.get(unique_id)):
+                changed.add(unique_id)
+    return changed
+
+
+def _changed_catalog_nodes(old_catalog, new_catalog) -> Optional[Set[str]]:
+    """
+    Find the nodes whose columns differ between two catalogs. Returns None if either catalog is missing.
+    """
+    if old_catalog is None or new_catalog is None:
+        return None
+
+    def _columns(table):
+        if table is None:
+            return None
+        return {name: column.type for name, column in table.columns.items()}
+
+    changed = set()
+    for key in ["nodes", "sources"]:
+        old_tables = getattr(old_catalog, key)
+        new_tables = getattr(new_catalog, key)
+        for unique_id in old_tables.keys() | new_tables.keys():
+            if _columns(old_tables.get(unique_id)) != _columns(new_tables.get(unique_id)):
+                changed.add(unique_id)
+    return changed
+
+
 @dataclass()
 class DbtArgs:
     """
@@ -305,6 +534,37 @@ class DbtAdapter(BaseAdapter):
     # Watch the base environment ready
     base_env_observer = Observer()
 
+    # Per-artifact caches derived from the manifests. Reset by `_invalidate_artifact_caches`
+    _manifest_dicts: Dict[str, Tuple[WritableManifest, Any]] = field(default_factory=dict)
+    _manifest_indexes: Dict[str, Tuple[WritableManifest, ManifestIndex]] = field(default_factory=dict)
+    _graph_indexes: Dict[str, Tuple[WritableManifest, GraphIndex]] = field(default_factory=dict)
+    _cll_graph_indexes: LRUCache = field(default_factory=lambda: LRUCache(capacity=8))
+    _runtime_manifests: Dict[str, Tuple[WritableManifest, Manifest, MacroManifest]] = field(default_factory=dict)
+    _runtime_manifest_lock: threading.RLock = field(default_factory=threading.RLock)
+    artifacts_version: int = 0
+
+    # `cll_workers` greater than 1 enables parsing the SQL of the nodes in a process pool
+    cll_workers: int = 1
+    # The directory of the disk cache of the sqlglot results. None disables the disk cache
+    cache_dir: Optional[str] = None
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_pool_lock: threading.Lock = field(default_factory=threading.Lock)
+    _cll_cache: LRUCache = field(default_factory=lambda: LRUCache(capacity=128))
+    _change_analysis_cache: Dict[str, Optional[NodeDiff]] = field(default_factory=dict)
+
+    # `query_cache_ttl` greater than 0 caches the results of read-only queries for that many seconds
+    query_cache_ttl: float = 0
+    query_cache_size: int = 128
+    # Drop the cached query results when the artifacts are reloaded, e.g. after `dbt run`
+    query_cache_invalidate_on_refresh: bool = True
+    _query_cache: Optional[TTLCache] = None
+
+    # `max_concurrent_statements` greater than 0 caps the statements running on the warehouse at the same time, across
+    # all runs and connections
+    max_concurrent_statements: int = 0
+    _statement_semaphore: Optional[threading.BoundedSemaphore] = None
+    _statement_semaphore_lock: threading.Lock = field(default_factory=threading.Lock)
+
     def support_tasks(self):
         support_map = {run_type.value: True for run_type in dbt_supported_registry}
 
@@ -370,6 +630,11 @@ class DbtAdapter(BaseAdapter):
                 adapter=adapter,
                 review_mode=review,
                 base_path=target_base_path,
+                cll_workers=kwargs.get("cll_workers") or 1,
+                cache_dir=kwargs.get("cache_dir"),
+                query_cache_ttl=kwargs.get("query_cache_ttl") or 0,
+                query_cache_size=kwargs.get("query_cache_size") or 128,
+                max_concurrent_statements=kwargs.get("max_concurrent_statements") or 0,
             )
         except DbtProjectError as e:
             raise e
@@ -399,12 +664,12 @@ class DbtAdapter(BaseAdapter):
                 get_columns_macro, kwargs={"relation": relation}, manifest=self.manifest
             )
         else:
-            from dbt.context.providers import generate_runtime_macro_context
-
-            macro_manifest = MacroManifest(self.manifest.macros)
-            self.adapter.set_macro_resolver(macro_manifest)
-            self.adapter.set_macro_context_generator(generate_runtime_macro_context)
-            columns = self.adapter.execute_macro(get_columns_macro, kwargs={"relation": relation})
+            # The macros are passed explicitly, since the macro resolver of the adapter is shared with `generate_sql`
+            macro_manifest = self._get_macro_manifest(self.get_runtime_manifest(base=False))
+            self._set_macro_resolver(macro_manifest)
+            columns = self.adapter.execute_macro(
+                get_columns_macro, macro_resolver=macro_manifest, kwargs={"relation": relation}
+            )
 
         if self.adapter.connections.TYPE == "databricks":
             # reference: get_columns_in_relation (dbt/adapters/databricks/impl.py)
@@ -427,8 +692,7 @@ class DbtAdapter(BaseAdapter):
             return columns
 
     def get_model(self, model_id: str, base=False):
-        manifest = self.curr_manifest if base is False else self.base_manifest
-        manifest_dict = manifest.to_dict()
+        manifest_dict = self.get_manifest_dict(base)
 
         node = manifest_dict["nodes"].get(model_id)
         if node is None:
@@ -504,9 +768,10 @@ class DbtAdapter(BaseAdapter):
         self.curr_catalog = curr_catalog
         self.base_manifest = base_manifest
         self.base_catalog = base_catalog
+        self._invalidate_artifact_caches()
 
-        # set the manifest
-        self.manifest = as_manifest(curr_manifest)
+        # set the manifest. It is the cached runtime manifest, so the current manifest is converted only once
+        self.manifest = self.get_runtime_manifest(base=False)
         self.previous_state = previous_state(
             Path(target_base_path),
             Path(self.runtime_config.target_path),
@@ -530,13 +795,11 @@ class DbtAdapter(BaseAdapter):
         return False
 
     def find_node_by_name(self, node_name, base=False) -> Optional[ManifestNode]:
-        manifest = self.curr_manifest if base is False else self.base_manifest
-
-        for key, node in manifest.nodes.items():
-            if node.name == node_name:
-                return node
+        index = self.get_manifest_index(base)
+        if index is None:
+            return None
 
-        return None
+        return index.find_node_by_name(node_name)
 
     def get_node_name_by_id(self, unique_id):
         if unique_id.startswith("source."):
@@ -569,6 +832,116 @@ class DbtAdapter(BaseAdapter):
     def get_manifest(self, base: bool):
         return self.curr_manifest if base is False else self.base_manifest
 
+    def get_manifest_dict(self, base: bool = False, perf_tracker: LineagePerfTracker = None):
+        """
+        Get the dict representation of the base or current manifest.
+
+        Serializing a large manifest is expensive, so the result is memoized per artifact and reused until the
+        artifacts are reloaded. The returned mapping is shared by all callers and must be treated as read-only. Only
+        the top level is frozen; the nested node, config and map values are plain dicts and lists, so anything handed
+        out of the adapter is copied first.
+        """
+        manifest = self.get_manifest(base)
+        if manifest is None:
+            return None
+
+        key = "base" if base else "current"
+        cached = self._manifest_dicts.get(key)
+        if cached is not None and cached[0] is manifest:
+            if perf_tracker is not None:
+                perf_tracker.increment_manifest_serializations_avoided()
+            return cached[1]
+
+        manifest_dict = MappingProxyType(manifest.to_dict())
+        self._manifest_dicts[key] = (manifest, manifest_dict)
+        return manifest_dict
+
+    def get_manifest_index(self, base: bool = False) -> Optional[ManifestIndex]:
+        """
+        Get the name, ref and source lookup index of the base or current manifest.
+
+        The index is built on first use and only rebuilt for the environment whose manifest has been replaced.
+        """
+        manifest = self.get_manifest(base)
+        if manifest is None:
+            return None
+
+        key = "base" if base else "current"
+        cached = self._manifest_indexes.get(key)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+
+        index = ManifestIndex(manifest)
+        self._manifest_indexes[key] = (manifest, index)
+        return index
+
+    def get_graph_index(self, base: bool = False) -> Optional[GraphIndex]:
+        """
+        Get the index of the node-level parent and child maps of the base or current manifest, used to find the
+        upstream and downstream nodes.
+
+        The index is built on first use and only rebuilt for the environment whose manifest has been replaced.
+        """
+        manifest = self.get_manifest(base)
+        if manifest is None:
+            return None
+
+        key = "base" if base else "current"
+        cached = self._graph_indexes.get(key)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+
+        manifest_dict = self.get_manifest_dict(base)
+        index = GraphIndex(manifest_dict.get("parent_map") or {}, manifest_dict.get("child_map") or {})
+        self._graph_indexes[key] = (manifest, index)
+        return index
+
+    def get_runtime_manifest(self, base: bool = False) -> Optional[Manifest]:
+        """
+        Get the base or current manifest converted to dbt's `Manifest`, which is what the parser and compiler need.
+
+        The conversion walks every node of the manifest, so it is done once per loaded artifact and the result is
+        shared by all callers.
+        """
+        manifest = self.get_manifest(base)
+        if manifest is None:
+            return None
+
+        key = "base" if base else "current"
+        with self._runtime_manifest_lock:
+            cached = self._runtime_manifests.get(key)
+            if cached is not None and cached[0] is manifest:
+                return cached[1]
+
+            runtime_manifest = _warm_lookups(as_manifest(manifest))
+            macro_manifest = MacroManifest(runtime_manifest.macros)
+            self._runtime_manifests[key] = (manifest, runtime_manifest, macro_manifest)
+            return runtime_manifest
+
+    def _get_macro_manifest(self, manifest: Manifest) -> MacroManifest:
+        for _, runtime_manifest, macro_manifest in list(self._runtime_manifests.values()):
+            if runtime_manifest is manifest:
+                return macro_manifest
+        return MacroManifest(manifest.macros)
+
+    def _invalidate_artifact_caches(self, keep_node_caches: bool = False):
+        """
+        Drop everything derived from the loaded artifacts. Must be called whenever a manifest or catalog is replaced.
+
+        :param keep_node_caches: Keep the cached CLL and change analysis of the nodes, for a caller that drops the ones
+            of the changed nodes with `_invalidate_node_caches`
+        """
+        if not keep_node_caches:
+            self._invalidate_node_caches(None, base=False, child_maps=[])
+        self._manifest_dicts.clear()
+        self._manifest_indexes.clear()
+        self._graph_indexes.clear()
+        self._cll_graph_indexes.clear()
+        self._runtime_manifests.clear()
+        self.artifacts_version += 1
+        if self.query_cache_invalidate_on_refresh and self._query_cache is not None:
+            self._query_cache.clear()
+
     def generate_sql(
         self,
         sql_template: str,
@@ -578,8 +951,7 @@ class DbtAdapter(BaseAdapter):
     ):
         if context is None:
             context = {}
-        manifest = provided_manifest if provided_manifest is not None else as_manifest(self.get_manifest(base))
-        parser = SqlBlockParser(self.runtime_config, manifest, self.runtime_config)
+        manifest = provided_manifest if provided_manifest is not None else self.get_runtime_manifest(base)
 
         if dbt_version >= dbt_version.parse("v1.8"):
             from dbt_common.context import (
@@ -591,45 +963,128 @@ class DbtAdapter(BaseAdapter):
             get_invocation_context()._env = dict(os.environ)
 
         node_id = str("generated_" + uuid.uuid4().hex)
+        # The parser registers the generated node in the manifest it is given, so each call parses, compiles and renders
+        # against its own overlay of the shared manifest. Concurrent calls never see each other's nodes.
+        manifest = _overlay_manifest(manifest)
+        parser = SqlBlockParser(self.runtime_config, manifest, self.runtime_config)
         node = parser.parse_remote(sql_template, node_id)
         process_node(self.runtime_config, manifest, node)
-
         if dbt_version < dbt_version.parse("v1.8"):
             compiler = self.adapter.get_compiler()
             compiler.compile_node(node, manifest, context)
             return node.compiled_code
         else:
             from dbt.clients import jinja
-            from dbt.context.providers import (
-                generate_runtime_macro_context,
-                generate_runtime_model_context,
-            )
+            from dbt.context.providers import generate_runtime_model_context
 
             # Set up macro resolver for dbt >= 1.8
-            macro_manifest = MacroManifest(manifest.macros)
-            self.adapter.set_macro_resolver(macro_manifest)
-            self.adapter.set_macro_context_generator(generate_runtime_macro_context)
+            self._set_macro_resolver(self._get_macro_manifest(manifest))
 
             jinja_ctx = generate_runtime_model_context(node, self.runtime_config, manifest)
             jinja_ctx.update(context)
             compiled_code = jinja.get_rendered(sql_template, jinja_ctx, node)
             return compiled_code
 
+    def _set_macro_resolver(self, macro_manifest: MacroManifest):
+        """
+        Set the macros that the shared adapter resolves when it runs a macro by itself, e.g. for
+        `adapter.get_columns_in_relation` in a template.
+        """
+        from dbt.context.providers import generate_runtime_macro_context
+
+        with self._runtime_manifest_lock:
+            self.adapter.set_macro_resolver(macro_manifest)
+            self.adapter.set_macro_context_generator(generate_runtime_macro_context)
+
     def execute(
         self,
         sql: str,
         auto_begin: bool = False,
         fetch: bool = False,
         limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[any, agate.Table]:
+        query_cache = self._get_query_cache() if fetch and _is_read_only_sql(sql) else None
+        if query_cache is not None:
+            cache_key = (self.runtime_config.profile_name, self.runtime_config.target_name, sql, limit, offset)
+            result = query_cache.get(cache_key)
+            if result is not None:
+                return result
+
+        with self._statement_slot():
+            if fetch and offset > 0:
+                result = self._execute_with_offset(sql, auto_begin=auto_begin, limit=limit, offset=offset)
+            elif dbt_version < dbt_version.parse("v1.6"):
+                result = self.adapter.execute(sql, auto_begin=auto_begin, fetch=fetch)
+            else:
+                result = self.adapter.execute(sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+
+        if query_cache is not None:
+            query_cache.put(cache_key, result)
+        return result
+
+    @contextmanager
+    def _statement_slot(self):
+        """
+        Wait until fewer than `max_concurrent_statements` statements are running.
+        """
+        if not self.max_concurrent_statements or self.max_concurrent_statements <= 0:
+            yield
+            return
+        if self._statement_semaphore is None:
+            with self._statement_semaphore_lock:
+                if self._statement_semaphore is None:
+                    self._statement_semaphore = threading.BoundedSemaphore(self.max_concurrent_statements)
+        with self._statement_semaphore:
+            yield
+
+    def _execute_with_offset(
+        self, sql: str, auto_begin: bool, limit: Optional[int], offset: int
     ) -> Tuple[any, agate.Table]:
+        """
+        Fetch `limit` rows of the result after skipping the first `offset` rows.
+
+        The rows are only skipped in the same order on every call if the query has an ORDER BY on a unique key.
+
+        On adapters with a DB-API cursor, the skipped rows are read from the cursor in chunks and dropped, so at most
+        one page of rows is held in memory. Other adapters fetch the first `offset + limit` rows and slice them.
+        """
+        from dbt.adapters.sql import SQLConnectionManager
+
+        connections = self.adapter.connections
+        if isinstance(connections, SQLConnectionManager) and dbt_version >= dbt_version.parse("v1.6"):
+            # The query comment is added as `connections.execute` does
+            if connections.query_header is not None:
+                sql = connections.query_header.add(sql)
+            _, cursor = connections.add_query(sql, auto_begin)
+            response = connections.get_response(cursor)
+            skipped = 0
+            while cursor.description is not None and skipped < offset:
+                rows = cursor.fetchmany(min(offset - skipped, QUERY_OFFSET_CHUNK_SIZE))
+                if not rows:
+                    break
+                skipped += len(rows)
+            return response, connections.get_result_from_cursor(cursor, limit)
+
         if dbt_version < dbt_version.parse("v1.6"):
-            return self.adapter.execute(sql, auto_begin=auto_begin, fetch=fetch)
+            response, table = self.adapter.execute(sql, auto_begin=auto_begin, fetch=True)
+        else:
+            response, table = self.adapter.execute(
+                sql, auto_begin=auto_begin, fetch=True, limit=offset + limit if limit else None
+            )
+        return response, table.limit(offset, offset + limit if limit else None)
 
-        return self.adapter.execute(sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+    def _get_query_cache(self) -> Optional[TTLCache]:
+        if not self.query_cache_ttl or self.query_cache_ttl <= 0:
+            return None
+        if self._query_cache is None:
+            self._query_cache = TTLCache(capacity=self.query_cache_size, ttl=self.query_cache_ttl)
+        return self._query_cache
 
-    def build_parent_map(self, nodes: Dict, base: Optional[bool] = False) -> Dict[str, List[str]]:
-        manifest = self.curr_manifest if base is False else self.base_manifest
-        manifest_dict = manifest.to_dict()
+    def build_parent_map(
+        self, nodes: Dict, base: Optional[bool] = False, perf_tracker: LineagePerfTracker = None
+    ) -> Dict[str, List[str]]:
+        manifest_dict = self.get_manifest_dict(base, perf_tracker=perf_tracker)
 
         node_ids = nodes.keys()
         parent_map = {}
@@ -641,11 +1096,10 @@ class DbtAdapter(BaseAdapter):
         return parent_map
 
     def build_parent_list_per_node(self, node_id: str, base: Optional[bool] = False) -> List[str]:
-        manifest = self.curr_manifest if base is False else self.base_manifest
-        manifest_dict = manifest.to_dict()
+        manifest_dict = self.get_manifest_dict(base)
 
         if node_id in manifest_dict["parent_map"]:
-            return manifest_dict["parent_map"][node_id]
+            return list(manifest_dict["parent_map"][node_id])
 
     def get_lineage(self, base: Optional[bool] = False):
         manifest = self.curr_manifest if base is False else self.base_manifest
@@ -666,6 +1120,7 @@ class DbtAdapter(BaseAdapter):
 
     @lru_cache(maxsize=2)
     def get_lineage_cached(self, base: Optional[bool] = False, cache_key=0):
+        perf_tracker = None
         if base is False:
             perf_tracker = LineagePerfTracker()
             perf_tracker.start_lineage()
@@ -676,7 +1131,7 @@ class DbtAdapter(BaseAdapter):
         manifest_metadata = manifest.metadata if manifest is not None else None
         catalog_metadata = catalog.metadata if catalog is not None else None
 
-        manifest_dict = manifest.to_dict()
+        manifest_dict = self.get_manifest_dict(base, perf_tracker=perf_tracker)
 
         nodes = {}
 
@@ -693,8 +1148,8 @@ class DbtAdapter(BaseAdapter):
                 "resource_type": node["resource_type"],
                 "package_name": node["package_name"],
                 "schema": node["schema"],
-                "config": node["config"],
-                "checksum": node["checksum"],
+                "config": deepcopy(node["config"]),
+                "checksum": deepcopy(node["checksum"]),
                 "raw_code": node["raw_code"],
             }
 
@@ -748,7 +1203,7 @@ class DbtAdapter(BaseAdapter):
                 "source_name": source["source_name"],
                 "resource_type": source["resource_type"],
                 "package_name": source["package_name"],
-                "config": source["config"],
+                "config": deepcopy(source["config"]),
             }
 
             if catalog is not None and unique_id in catalog.sources:
@@ -763,7 +1218,7 @@ class DbtAdapter(BaseAdapter):
                 "name": exposure["name"],
                 "resource_type": exposure["resource_type"],
                 "package_name": exposure["package_name"],
-                "config": exposure["config"],
+                "config": deepcopy(exposure["config"]),
             }
         for metric in manifest_dict["metrics"].values():
             nodes[metric["unique_id"]] = {
@@ -771,7 +1226,7 @@ class DbtAdapter(BaseAdapter):
                 "name": metric["name"],
                 "resource_type": metric["resource_type"],
                 "package_name": metric["package_name"],
-                "config": metric["config"],
+                "config": deepcopy(metric["config"]),
             }
 
         if "semantic_models" in manifest_dict:
@@ -781,10 +1236,10 @@ class DbtAdapter(BaseAdapter):
                     "name": semantic_models["name"],
                     "resource_type": semantic_models["resource_type"],
                     "package_name": semantic_models["package_name"],
-                    "config": semantic_models["config"],
+                    "config": deepcopy(semantic_models["config"]),
                 }
 
-        parent_map = self.build_parent_map(nodes, base)
+        parent_map = self.build_parent_map(nodes, base, perf_tracker=perf_tracker)
 
         if base is False:
             perf_tracker.end_lineage()
@@ -822,9 +1277,86 @@ class DbtAdapter(BaseAdapter):
             diff=diff,
         )
 
-    @lru_cache(maxsize=128)
     def get_change_analysis_cached(self, node_id: str):
+        return self._get_change_analysis_many([node_id])[node_id]
+
+    def analyze_modified_nodes(self) -> Dict[str, NodeDiff]:
+        """
+        Run the change analysis of all the nodes in the lineage diff up front and populate the cache.
+
+        The base and current SQL of the nodes missing from the cache is compiled in this process and classified by
+        `_run_sqlglot_jobs`, in the process pool if `cll_workers` is greater than 1.
+        """
+        return self._get_change_analysis_many(list(self.get_lineage_diff().diff.keys()))
+
+    def _get_change_analysis_many(self, node_ids: List[str]) -> Dict[str, Optional[NodeDiff]]:
+        diff = self.get_lineage_diff().diff
+        results = {}
+        pending = []
+        for node_id in node_ids:
+            if node_id not in self._change_analysis_cache:
+                pending.append(node_id)
+                continue
+
+            cached, node_diff = self._change_analysis_cache[node_id], diff.get(node_id)
+            if cached is not node_diff:
+                # The lineage diff has been rebuilt since the node was analyzed
+                if cached is None or node_diff is None or cached.change_status != node_diff.change_status:
+                    pending.append(node_id)
+                    continue
+                node_diff.change = cached.change
+                self._change_analysis_cache[node_id] = node_diff
+            results[node_id] = node_diff
+
+        if not pending:
+            return results
+
         breaking_perf_tracker = BreakingPerformanceTracking()
+        jobs: Dict[str, _ChangeAnalysisJob] = {}
+        for node_id in pending:
+            job = self._prepare_change_analysis_job(node_id, breaking_perf_tracker)
+            if isinstance(job, _ChangeAnalysisJob):
+                jobs[node_id] = job
+            else:
+                results[node_id] = job
+        breaking_perf_tracker.record_checkpoint("compile")
+
+        outcomes = self._run_sqlglot_jobs(
+            "change_analysis",
+            parse_change_category_worker,
+            [(job.base_sql, job.curr_sql, job.base_schema, job.curr_schema, job.dialect) for job in jobs.values()],
+            dump=dump_change_category_outcome,
+            load=load_change_category_outcome,
+        )
+        breaking_perf_tracker.record_checkpoint("parse")
+
+        for (node_id, job), (change, error) in zip(jobs.items(), outcomes):
+            if error == "sqlglot":
+                breaking_perf_tracker.increment_sqlglot_error_nodes()
+            elif error is not None:
+                breaking_perf_tracker.increment_other_error_nodes()
+            results[node_id] = _apply_node_change(job, change)
+
+        for node_id in pending:
+            self._change_analysis_cache[node_id] = results[node_id]
+
+        if breaking_perf_tracker.modified_nodes:
+            breaking_perf_tracker.end_lineage_diff()
+            log_performance(
+                "change analysis per node" if len(pending) == 1 else "change analysis batch",
+                breaking_perf_tracker.to_dict(),
+            )
+        breaking_perf_tracker.reset()
+        return results
+
+    def _prepare_change_analysis_job(
+        self, node_id: str, breaking_perf_tracker: BreakingPerformanceTracking
+    ) -> Union[None, NodeDiff, _ChangeAnalysisJob]:
+        """
+        Compile the base and current SQL of a modified node for `parse_change_category`.
+
+        Returns the final `NodeDiff` if the node does not need to be parsed, or a `_ChangeAnalysisJob`.
+        """
         lineage_diff = self.get_lineage_diff()
         diff = lineage_diff.diff
 
@@ -832,13 +1364,14 @@ class DbtAdapter(BaseAdapter):
             return diff.get(node_id)
 
         breaking_perf_tracker.increment_modified_nodes()
-        breaking_perf_tracker.start_lineage_diff()
+        if breaking_perf_tracker.lineage_diff_start is None:
+            breaking_perf_tracker.start_lineage_diff()
 
         base = lineage_diff.base
         current = lineage_diff.current
 
-        base_manifest = as_manifest(self.get_manifest(True))
-        curr_manifest = as_manifest(self.get_manifest(False))
+        base_manifest = self.get_runtime_manifest(True)
+        curr_manifest = self.get_runtime_manifest(False)
         breaking_perf_tracker.record_checkpoint("manifest")
 
         def ref_func(*args):
@@ -861,84 +1394,43 @@ class DbtAdapter(BaseAdapter):
 
         base_node = base.get("nodes", {}).get(node_id)
         curr_node = current.get("nodes", {}).get(node_id)
-        change = NodeChange(category="unknown")
+        node_diff = diff.get(node_id)
         if (
-            curr_node.get("resource_type") in ["model", "snapshot"]
-            and curr_node.get("raw_code") is not None
-            and base_node.get("raw_code") is not None
+            curr_node.get("resource_type") not in ["model", "snapshot"]
+            or curr_node.get("raw_code") is None
+            or base_node.get("raw_code") is None
         ):
-            try:
-
-                def _get_schema(lineage):
-                    schema = {}
-                    nodes = lineage["nodes"]
-                    parent_list = lineage["parent_map"].get(node_id, [])
-                    for parent_id in parent_list:
-                        parent_node = nodes.get(parent_id)
-                        if parent_node is None:
-                            continue
-                        columns = parent_node.get("columns") or {}
-                        name = parent_node.get("name")
-                        if parent_node.get("resource_type") == "source":
-                            parts = parent_id.split(".")
-                            source = parts[2]
-                            table = parts[3]
-                            source = source.replace("-", "_")
-                            name = f"__{source}__{table}"
-                        schema[name] = {name: column.get("type") for name, column in columns.items()}
-                    return schema
-
-                base_sql = self.generate_sql(
-                    base_node.get("raw_code"),
-                    context=jinja_context,
-                    provided_manifest=base_manifest,
-                )
-                curr_sql = self.generate_sql(
-                    curr_node.get("raw_code"),
-                    context=jinja_context,
-                    provided_manifest=curr_manifest,
-                )
-                base_schema = _get_schema(base)
-                curr_schema = _get_schema(current)
-                dialect = self.adapter.connections.TYPE
-                if curr_manifest.metadata.adapter_type is not None:
-                    dialect = curr_manifest.metadata.adapter_type
-
-                change = parse_change_category(
-                    base_sql,
-                    curr_sql,
-                    old_schema=base_schema,
-                    new_schema=curr_schema,
-                    dialect=dialect,
-                    perf_tracking=breaking_perf_tracker,
-                )
-
-                # Make sure that the case of the column names are the same
-                changed_columns = {
-                    column.lower(): change_status for column, change_status in (change.columns or {}).items()
-                }
-                changed_columns_names = set(changed_columns)
-                changed_columns_final = {}
-
-                base_columns = base_node.get("columns") or {}
-                curr_columns = curr_node.get("columns") or {}
-                columns_names = set(base_columns) | set(curr_columns)
-
-                for column_name in columns_names:
-                    if column_name.lower() in changed_columns_names:
-                        changed_columns_final[column_name] = changed_columns[column_name.lower()]
-
-                change.columns = changed_columns_final
-            except Exception:
-                # TODO: telemetry
-                pass
+            node_diff.change = NodeChange(category="unknown")
+            return node_diff
 
-        breaking_perf_tracker.end_lineage_diff()
-        log_performance("change analysis per node", breaking_perf_tracker.to_dict())
-        breaking_perf_tracker.reset()
-        node_diff = diff.get(node_id)
-        node_diff.change = change
-        return node_diff
+        try:
+            base_sql = self.generate_sql(
+                base_node.get("raw_code"),
+                context=jinja_context,
+                provided_manifest=base_manifest,
+            )
+            curr_sql = self.generate_sql(
+                curr_node.get("raw_code"),
+                context=jinja_context,
+                provided_manifest=curr_manifest,
+            )
+            dialect = self.adapter.connections.TYPE
+            if curr_manifest.metadata.adapter_type is not None:
+                dialect = curr_manifest.metadata.adapter_type
+        except Exception:
+            # TODO: telemetry
+            node_diff.change = NodeChange(category="unknown")
+            return node_diff
+
+        return _ChangeAnalysisJob(
+            node_diff=node_diff,
+            base_sql=base_sql,
+            curr_sql=curr_sql,
+            base_schema=_get_parent_schema(base, node_id),
+            curr_schema=_get_parent_schema(current, node_id),
+            dialect=dialect,
+            columns_names=set(base_node.get("columns") or {}) | set(curr_node.get("columns") or {}),
+        )
 
     def get_cll(
         self,
@@ -962,7 +1454,6 @@ class DbtAdapter(BaseAdapter):
         cll_tracker.start_column_lineage()
 
         manifest = self.curr_manifest
-        manifest_dict = manifest.to_dict()
 
         # Find related model nodes
         if node_id is not None:
@@ -970,6 +1461,9 @@ class DbtAdapter(BaseAdapter):
         else:
             lineage_diff = self.get_lineage_diff()
             cll_node_ids = set(lineage_diff.diff.keys())
+            if change_analysis:
+                # Classify all the modified nodes in one batch instead of one by one below
+                self.analyze_modified_nodes()
 
         cll_tracker.set_init_nodes(len(cll_node_ids))
 
@@ -978,10 +1472,11 @@ class DbtAdapter(BaseAdapter):
         parent_map = {}
         child_map = {}
 
+        graph_index = self.get_graph_index(False)
         if not no_upstream:
-            cll_node_ids = cll_node_ids.union(find_upstream(cll_node_ids, manifest_dict.get("parent_map")))
+            cll_node_ids = cll_node_ids.union(graph_index.find_upstream(cll_node_ids))
         if not no_downstream:
-            cll_node_ids = cll_node_ids.union(find_downstream(cll_node_ids, manifest_dict.get("child_map")))
+            cll_node_ids = cll_node_ids.union(graph_index.find_downstream(cll_node_ids))
 
         if not no_cll:
             allowed_related_nodes = set()
@@ -991,10 +1486,11 @@ class DbtAdapter(BaseAdapter):
             if hasattr(manifest, "semantic_models"):
                 attr = getattr(manifest, "semantic_models")
                 allowed_related_nodes.update(set(attr.keys()))
-            for cll_node_id in cll_node_ids:
-                if cll_node_id not in allowed_related_nodes:
-                    continue
-                cll_data_one = deepcopy(self.get_cll_cached(cll_node_id, base=False))
+            cll_data_map = self.get_cll_cached_many(
+                [cll_node_id for cll_node_id in cll_node_ids if cll_node_id in allowed_related_nodes], base=False
+            )
+            for cll_node_id, cll_data_one in cll_data_map.items():
+                cll_data_one = deepcopy(cll_data_one)
                 cll_tracker.increment_cll_nodes()
                 if cll_data_one is None:
                     continue
@@ -1149,10 +1645,18 @@ class DbtAdapter(BaseAdapter):
 
         cll_tracker.set_anchor_nodes(len(anchor_node_ids))
         result_node_ids = set(anchor_node_ids)
+        if not no_upstream or not no_downstream:
+            # The column-level graph only depends on the artifacts and the related nodes, so the index is reused
+            # across requests, e.g. when selecting different columns of the same model.
+            cll_graph_key = (id(self.curr_manifest), id(self.curr_catalog), frozenset(cll_node_ids), no_cll)
+            cll_graph_index = self._cll_graph_indexes.get(cll_graph_key)
+            if cll_graph_index is None:
+                cll_graph_index = GraphIndex(parent_map, child_map)
+                self._cll_graph_indexes.put(cll_graph_key, cll_graph_index)
         if not no_upstream:
-            result_node_ids = result_node_ids.union(find_upstream(anchor_node_ids, parent_map))
+            result_node_ids = result_node_ids.union(cll_graph_index.find_upstream(anchor_node_ids))
         if not no_downstream:
-            result_node_ids = result_node_ids.union(find_downstream(anchor_node_ids, child_map))
+            result_node_ids = result_node_ids.union(cll_graph_index.find_downstream(anchor_node_ids))
 
         # Filter the nodes and columns based on the anchor nodes
         if not no_filter:
@@ -1181,47 +1685,175 @@ class DbtAdapter(BaseAdapter):
             child_map=child_map,
         )
 
-    @lru_cache(maxsize=128)
     def get_cll_cached(self, node_id: str, base: Optional[bool] = False) -> Optional[CllData]:
+        return self.get_cll_cached_many([node_id], base=base)[node_id]
+
+    def get_cll_cached_many(self, node_ids: List[str], base: Optional[bool] = False) -> Dict[str, Optional[CllData]]:
+        """
+        Get the cached CLL of several nodes at once.
+
+        The SQL of the nodes missing from the cache is compiled in this process and parsed by `_run_sqlglot_jobs`.
+        """
+        results = {}
+        pending = []
+        for node_id in node_ids:
+            if (node_id, base) in self._cll_cache:
+                results[node_id] = self._cll_cache.get((node_id, base))
+            else:
+                pending.append(node_id)
+
+        if not pending:
+            return results
+
         cll_tracker = CLLPerformanceTracking()
+        cll_tracker.set_total_nodes(len(pending))
+        cll_tracker.start_column_lineage()
 
+        jobs: Dict[str, _CllJob] = {}
+        for node_id in pending:
+            job = self._prepare_cll_job(node_id, base, cll_tracker)
+            if isinstance(job, _CllJob):
+                jobs[node_id] = job
+            else:
+                results[node_id] = job
+
+        outcomes = self._run_sqlglot_jobs(
+            "cll",
+            cll_worker,
+            [(job.sql, job.schema, job.dialect) for job in jobs.values()],
+            dump=dump_cll_outcome,
+            load=load_cll_outcome,
+        )
+
+        for (node_id, job), (result, error) in zip(jobs.items(), outcomes):
+            if error == "sqlglot":
+                cll_tracker.increment_sqlglot_error_nodes()
+                results[node_id] = _apply_all_columns(job.node, job.parent_list, "unknown")
+            elif error is not None:
+                cll_tracker.increment_other_error_nodes()
+                results[node_id] = _apply_all_columns(job.node, job.parent_list, "unknown")
+            else:
+                m2c, c2c_map = result
+                results[node_id] = _build_cll_data(job, m2c, c2c_map)
+
+        for node_id in pending:
+            self._cll_cache.put((node_id, base), results[node_id])
+
+        if jobs:
+            cll_tracker.end_column_lineage()
+            log_performance(
+                "column level lineage per node" if len(pending) == 1 else "column level lineage batch",
+                cll_tracker.to_dict(),
+            )
+        cll_tracker.reset()
+        return results
+
+    def _run_sqlglot_jobs(
+        self,
+        namespace: str,
+        func: Callable,
+        args: List[Tuple],
+        dump: Callable[[Any], dict],
+        load: Callable[[dict], Any],
+    ) -> List[Any]:
+        """
+        Run `func` over `args` and return the outcomes in order.
+
+        Outcomes are looked up in the disk cache first. The misses run in the process pool when `cll_workers` is
+        greater than 1 and there are enough of them, otherwise in this process. New outcomes are written back to the
+        disk cache.
+        """
+        disk_cache = self._get_disk_cache(namespace)
+        outcomes = [None] * len(args)
+        misses = []
+        for i, arg in enumerate(args):
+            data = disk_cache.get(arg) if disk_cache is not None else None
+            if data is not None:
+                try:
+                    outcomes[i] = load(data)
+                    continue
+                except Exception:
+                    pass
+            misses.append(i)
+
+        miss_args = [args[i] for i in misses]
+        if self.cll_workers > 1 and len(miss_args) >= PROCESS_POOL_MIN_NODES:
+            miss_outcomes = self._map_in_process_pool(func, miss_args)
+        else:
+            miss_outcomes = [func(arg) for arg in miss_args]
+
+        for i, outcome in zip(misses, miss_outcomes):
+            outcomes[i] = outcome
+            if disk_cache is not None:
+                disk_cache.put(args[i], dump(outcome))
+        return outcomes
+
+    def _get_disk_cache(self, namespace: str) -> Optional[DiskCache]:
+        if self.cache_dir is None:
+            return None
+        return DiskCache(self.cache_dir, namespace, salt=f"recce={recce_version},sqlglot={sqlglot_version}")
+
+    def _map_in_process_pool(self, func: Callable, args: List[Any]) -> List[Any]:
+        try:
+            pool = self._get_process_pool()
+            chunksize = max(1, len(args) // (self.cll_workers * 4))
+            return list(pool.map(func, args, chunksize=chunksize))
+        except BrokenProcessPool:
+            logger.warning("The process pool is broken. Fall back to run in the main process.")
+            self._shutdown_process_pool()
+            return [func(arg) for arg in args]
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # Use spawn to avoid forking a process that holds database connections and watchdog threads
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.cll_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+    def close(self):
+        self._shutdown_process_pool()
+
+    def _shutdown_process_pool(self):
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
+                self._process_pool = None
+
+    def _prepare_cll_job(
+        self, node_id: str, base: Optional[bool], cll_tracker: CLLPerformanceTracking
+    ) -> Union[None, CllData, _CllJob]:
+        """
+        Resolve everything needed to compute the CLL of a node except the sqlglot parsing.
+
+        Returns the final `CllData` if the node does not need parsing, or a `_CllJob` to be passed to `cll`.
+        """
         node, parent_list = self.get_cll_node(node_id, base=base)
         if node is None:
             return None
 
-        cll_tracker.set_total_nodes(1)
-        cll_tracker.start_column_lineage()
-
-        def _apply_all_columns(node: CllNode, transformation_type):
-            cll_data = CllData()
-            cll_data.nodes[node.id] = node
-            cll_data.parent_map[node.id] = set(parent_list)
-            for col in node.columns.values():
-                column_id = f"{node.id}_{col.name}"
-                col.transformation_type = transformation_type
-                cll_data.columns[column_id] = col
-                cll_data.parent_map[column_id] = set()
-            return cll_data
-
-        manifest = as_manifest(self.get_manifest(base))
-        catalog = self.curr_catalog if base is False else self.base_catalog
         resource_type = node.resource_type
         if resource_type not in {"model", "seed", "source", "snapshot"}:
-            return _apply_all_columns(node, "unknown")
+            return _apply_all_columns(node, parent_list, "unknown")
 
         if resource_type == "source" or resource_type == "seed":
-            return _apply_all_columns(node, "source")
+            return _apply_all_columns(node, parent_list, "source")
 
         if node.raw_code is None or self.is_python_model(node.id, base=base):
-            return _apply_all_columns(node, "unknown")
+            return _apply_all_columns(node, parent_list, "unknown")
 
         if node.name == "metricflow_time_spine":
-            return _apply_all_columns(node, "source")
+            return _apply_all_columns(node, parent_list, "source")
 
         if not node.columns:
-            return _apply_all_columns(node, "unknown")
+            return _apply_all_columns(node, parent_list, "unknown")
 
+        manifest = self.get_runtime_manifest(base)
+        catalog = self.curr_catalog if base is False else self.base_catalog
         table_id_map = {}
+        manifest_index = self.get_manifest_index(base)
 
         def ref_func(*args):
             node_name: str = None
@@ -1233,34 +1865,26 @@ class DbtAdapter(BaseAdapter):
                 project_or_package = args[0]
                 node_name = args[1]
 
-            for key, n in manifest.nodes.items():
-                if n.name != node_name:
-                    continue
-                if project_or_package is not None and n.package_name != project_or_package:
-                    continue
-
-                # replace id "." to "_"
-                unique_id = n.unique_id
-                table_name = unique_id.replace(".", "_")
-                table_id_map[table_name.lower()] = unique_id
-                return table_name
+            n = manifest_index.resolve_ref(node_name, package_name=project_or_package)
+            if n is None:
+                raise ValueError(f"Cannot find node {node_name} in the manifest")
 
-            raise ValueError(f"Cannot find node {node_name} in the manifest")
+            # replace id "." to "_"
+            unique_id = n.unique_id
+            table_name = unique_id.replace(".", "_")
+            table_id_map[table_name.lower()] = unique_id
+            return table_name
 
         def source_func(source_name, name):
-            for key, n in manifest.sources.items():
-                if n.source_name != source_name:
-                    continue
-                if n.name != name:
-                    continue
+            n = manifest_index.resolve_source(source_name, name)
+            if n is None:
+                raise ValueError(f"Cannot find source {source_name}.{name} in the manifest")
 
-                # replace id "." to "_"
-                unique_id = n.unique_id
-                table_name = unique_id.replace(".", "_")
-                table_id_map[table_name.lower()] = unique_id
-                return table_name
-
-            raise ValueError(f"Cannot find source {source_name}.{name} in the manifest")
+            # replace id "." to "_"
+            unique_id = n.unique_id
+            table_name = unique_id.replace(".", "_")
+            table_id_map[table_name.lower()] = unique_id
+            return table_name
 
         raw_code = node.raw_code
         jinja_context = dict(
@@ -1286,41 +1910,21 @@ class DbtAdapter(BaseAdapter):
             dialect = self.adapter.type()
             if self.get_manifest(base).metadata.adapter_type is not None:
                 dialect = self.get_manifest(base).metadata.adapter_type
-            m2c, c2c_map = cll(compiled_sql, schema=schema, dialect=dialect)
         except RecceException:
             cll_tracker.increment_sqlglot_error_nodes()
-            return _apply_all_columns(node, "unknown")
+            return _apply_all_columns(node, parent_list, "unknown")
         except Exception:
             cll_tracker.increment_other_error_nodes()
-            return _apply_all_columns(node, "unknown")
-
-        # Add cll dependency to the node.
-        cll_data = CllData()
-        cll_data.nodes[node.id] = node
-        cll_data.columns = {f"{node.id}_{col.name}": col for col in node.columns.values()}
-
-        # parent map for node
-        depends_on = set(parent_list)
-        for d in m2c:
-            parent_key = f"{table_id_map[d.node.lower()]}_{d.column}"
-            depends_on.add(parent_key)
-        cll_data.parent_map[node_id] = depends_on
-
-        # parent map for columns
-        for name, column in node.columns.items():
-            depends_on = set()
-            column_id = f"{node.id}_{name}"
-            if name in c2c_map:
-                for d in c2c_map[name].depends_on:
-                    parent_key = f"{table_id_map[d.node.lower()]}_{d.column}"
-                    depends_on.add(parent_key)
-                column.transformation_type = c2c_map[name].transformation_type
-            cll_data.parent_map[column_id] = set(depends_on)
-
-        cll_tracker.end_column_lineage()
-        log_performance("column level lineage per node", cll_tracker.to_dict())
-        cll_tracker.reset()
-        return cll_data
+            return _apply_all_columns(node, parent_list, "unknown")
+
+        return _CllJob(
+            node=node,
+            parent_list=parent_list,
+            table_id_map=table_id_map,
+            sql=compiled_sql,
+            schema=schema,
+            dialect=dialect,
+        )
 
     def get_cll_node(self, node_id: str, base: Optional[bool] = False) -> Tuple[Optional[CllNode], list[str]]:
         manifest = self.curr_manifest if base is False else self.base_manifest
@@ -1448,6 +2052,14 @@ class DbtAdapter(BaseAdapter):
         self.manifest = manifest
         self.curr_catalog = curr_catalog
         self.base_catalog = base_catalog
+        self._invalidate_artifact_caches()
+        # `manifest` is the current manifest already converted, so it serves as the runtime manifest as well
+        with self._runtime_manifest_lock:
+            self._runtime_manifests["current"] = (
+                curr_manifest,
+                _warm_lookups(manifest),
+                MacroManifest(manifest.macros),
+            )
         self.previous_state = previous_state(
             Path(self.base_path),
             Path(self.runtime_config.target_path),
@@ -1473,22 +2085,56 @@ class DbtAdapter(BaseAdapter):
         # we capture the original manifest as base and only update the current
         target_type = os.path.basename(os.path.dirname(refresh_file_path))
         if self.target_path and target_type == os.path.basename(self.target_path):
-            if refresh_file_path.endswith("manifest.json"):
-                self.curr_manifest = load_manifest(path=refresh_file_path)
-                self.manifest = as_manifest(self.curr_manifest)
-                self.get_cll_cached.cache_clear()
-                self.get_change_analysis_cached.cache_clear()
-            elif refresh_file_path.endswith("catalog.json"):
-                self.curr_catalog = load_catalog(path=refresh_file_path)
-                self.get_cll_cached.cache_clear()
-                self.get_change_analysis_cached.cache_clear()
+            base = False
         elif self.base_path and target_type == os.path.basename(self.base_path):
-            if refresh_file_path.endswith("manifest.json"):
+            base = True
+        else:
+            self._invalidate_artifact_caches()
+            return
+
+        # Only the nodes changed by the new artifact and their downstream nodes lose their cached CLL and change analysis
+        old_manifest_dict = self.get_manifest_dict(base)
+        if refresh_file_path.endswith("manifest.json"):
+            if base:
                 self.base_manifest = load_manifest(path=refresh_file_path)
-                self.get_change_analysis_cached.cache_clear()
-            elif refresh_file_path.endswith("catalog.json"):
+            else:
+                self.curr_manifest = load_manifest(path=refresh_file_path)
+            self._invalidate_artifact_caches(keep_node_caches=True)
+            if not base:
+                self.manifest = self.get_runtime_manifest(base=False)
+            new_manifest_dict = self.get_manifest_dict(base)
+            changed_node_ids = _changed_manifest_nodes(old_manifest_dict, new_manifest_dict)
+            child_maps = [m["child_map"] for m in (old_manifest_dict, new_manifest_dict) if m is not None]
+        elif refresh_file_path.endswith("catalog.json"):
+            old_catalog = self.base_catalog if base else self.curr_catalog
+            if base:
                 self.base_catalog = load_catalog(path=refresh_file_path)
-                self.get_change_analysis_cached.cache_clear()
+            else:
+                self.curr_catalog = load_catalog(path=refresh_file_path)
+            self._invalidate_artifact_caches(keep_node_caches=True)
+            changed_node_ids = _changed_catalog_nodes(old_catalog, self.base_catalog if base else self.curr_catalog)
+            child_maps = [old_manifest_dict["child_map"]] if old_manifest_dict is not None else []
+        else:
+            self._invalidate_artifact_caches()
+            return
+
+        self._invalidate_node_caches(changed_node_ids, base, child_maps)
+
+    def _invalidate_node_caches(self, node_ids: Optional[Set[str]], base: bool, child_maps: List[Dict[str, List[str]]]):
+        """
+        Drop the cached CLL and change analysis of the given nodes and all their downstream nodes. `None` drops all.
+        """
+        if node_ids is None:
+            self._cll_cache.clear()
+            self._change_analysis_cache.clear()
+            return
+
+        affected_node_ids = set(node_ids)
+        for child_map in child_maps:
+            affected_node_ids |= find_downstream(node_ids, child_map)
+        for node_id in affected_node_ids:
+            self._cll_cache.pop((node_id, base))
+            self._change_analysis_cache.pop(node_id, None)
 
     def create_relation(self, model, base=False):
         node = self.find_node_by_name(model, base)
@@ -1634,8 +2280,9 @@ class DbtAdapter(BaseAdapter):
         self.curr_manifest = _select_artifact(self.curr_manifest, load_manifest(data=artifacts.current.get("manifest")))
         self.base_catalog = _select_artifact(self.base_catalog, load_catalog(data=artifacts.base.get("catalog")))
         self.curr_catalog = _select_artifact(self.curr_catalog, load_catalog(data=artifacts.current.get("catalog")))
+        self._invalidate_artifact_caches()
 
-        self.manifest = as_manifest(self.curr_manifest)
+        self.manifest = self.get_runtime_manifest(base=False)
         self.previous_state = previous_state(
             Path(self.base_path),
             Path(self.runtime_config.target_path),
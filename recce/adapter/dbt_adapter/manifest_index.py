@@ -0,0 +1,43 @@
+from typing import Any, Dict, Optional, Tuple
+
+
+class ManifestIndex:
+    """
+    Lookup tables over a single manifest, used to resolve nodes by name, `ref()` and `source()` without scanning
+    `manifest.nodes` or `manifest.sources`.
+
+    The first match in manifest order wins, so lookups return the same node as a linear scan would.
+    """
+
+    def __init__(self, manifest):
+        # name -> unique_id
+        self.name_to_unique_id: Dict[str, str] = {}
+        # (package_name, name) -> unique_id
+        self.package_name_to_unique_id: Dict[Tuple[str, str], str] = {}
+        # (source_name, table_name) -> unique_id
+        self.source_to_unique_id: Dict[Tuple[str, str], str] = {}
+
+        self._nodes = manifest.nodes
+        self._sources = manifest.sources
+
+        for unique_id, node in manifest.nodes.items():
+            self.name_to_unique_id.setdefault(node.name, unique_id)
+            self.package_name_to_unique_id.setdefault((node.package_name, node.name), unique_id)
+
+        for unique_id, source in manifest.sources.items():
+            self.source_to_unique_id.setdefault((source.source_name, source.name), unique_id)
+
+    def find_node_by_name(self, name: str) -> Optional[Any]:
+        unique_id = self.name_to_unique_id.get(name)
+        return self._nodes.get(unique_id) if unique_id is not None else None
+
+    def resolve_ref(self, name: str, package_name: Optional[str] = None) -> Optional[Any]:
+        if package_name is None:
+            return self.find_node_by_name(name)
+
+        unique_id = self.package_name_to_unique_id.get((package_name, name))
+        return self._nodes.get(unique_id) if unique_id is not None else None
+
+    def resolve_source(self, source_name: str, table_name: str) -> Optional[Any]:
+        unique_id = self.source_to_unique_id.get((source_name, table_name))
+        return self._sources.get(unique_id) if unique_id is not None else None
@@ -125,13 +125,19 @@ class SqlmeshAdapter(BaseAdapter):
         return expression
 
     def fetchdf_with_limit(
-        self, sql: t.Union[Expression, str], base: Optional[bool] = None, limit: Optional[int] = None
+        self,
+        sql: t.Union[Expression, str],
+        base: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> (pd.DataFrame, bool):
         expression = self.replace_virtual_tables(sql, base=base)
         if limit:
             expression = (
                 select("*").from_("__QUERY").with_("__QUERY", as_=expression).limit(limit + 1 if limit else None)
             )
+            if offset:
+                expression = expression.offset(offset)
         df = self.context.fetchdf(expression)
         if limit and len(df) > limit:
             df = df.head(limit)
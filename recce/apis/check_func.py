@@ -87,7 +87,7 @@ def create_check_from_run(
         is_checked=is_checked,
     )
     new_check = CheckDAO().create(check)
-    run.check_id = new_check.check_id
+    RunDAO().set_check_id(run, new_check.check_id)
 
     return new_check
 
@@ -1,14 +1,20 @@
-import asyncio
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 
-from recce.apis.run_func import cancel_run, materialize_run_results, submit_run
+from recce.apis.run_func import (
+    cancel_run,
+    materialize_run_results,
+    submit_run,
+    wait_run,
+)
+from recce.apis.run_scheduler import RunPriority
 from recce.event import log_api_event
 from recce.exceptions import RecceException
 from recce.models import RunDAO
+from recce.tasks.dataframe import DataFrame
 
 run_router = APIRouter(tags=["run"])
 
@@ -19,6 +25,8 @@ class CreateRunIn(BaseModel):
     check_id: Optional[str] = None
     nowait: Optional[bool] = False
     track_props: Optional[dict] = None
+    # Defaults to the priority of the run type
+    priority: Optional[Literal["interactive", "batch"]] = None
 
 
 @run_router.post("/runs", status_code=201)
@@ -31,7 +39,8 @@ async def create_run_handler(input: CreateRunIn):
         ),
     )
     try:
-        run, future = submit_run(input.type, input.params)
+        priority = RunPriority[input.priority.upper()] if input.priority else None
+        run, future = submit_run(input.type, input.params, priority=priority)
     except RecceException as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -56,12 +65,44 @@ async def wait_run_handler(run_id: UUID, timeout: int = Query(None, description=
     if run is None:
         raise HTTPException(status_code=404, detail="Not Found")
 
-    start_time = asyncio.get_event_loop().time()
-    while run.result is None and run.error is None:
-        await asyncio.sleep(1)
-        if timeout is not None and (asyncio.get_event_loop().time() - start_time) > timeout:
-            break
-    return run
+    return await wait_run(run, timeout)
+
+
+def _get_data_frame(result, part: Optional[str] = None) -> Optional[DataFrame]:
+    # The result is the task's model until the run is reloaded from the state file
+    if part is not None:
+        result = getattr(result, part, None) if isinstance(result, BaseModel) else result.get(part)
+    if isinstance(result, DataFrame):
+        return result
+    if isinstance(result, dict) and "columns" in result and "data" in result:
+        return DataFrame(**result)
+    return None
+
+
+@run_router.get("/runs/{run_id}/result")
+async def get_run_result_handler(
+    run_id: UUID,
+    format: Literal["columnar", "arrow"] = Query("columnar", description="Columnar JSON or Arrow IPC stream"),
+    part: Optional[str] = Query(None, description="The data frame of the result, e.g. base, current or diff"),
+):
+    run = RunDAO().find_run_by_id(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if run.result is None:
+        raise HTTPException(status_code=404, detail="The run has no result")
+
+    df = _get_data_frame(run.result, part)
+    if df is None:
+        raise HTTPException(status_code=400, detail="The result is not a data frame")
+
+    if format == "arrow":
+        try:
+            content = df.to_arrow_ipc()
+        except ImportError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return Response(content=content, media_type="application/vnd.apache.arrow.stream")
+
+    return df.to_columnar()
 
 
 @run_router.get("/runs", status_code=200)
@@ -1,7 +1,12 @@
 import asyncio
+import hashlib
+import json
 import logging
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
 
+from recce.apis.run_scheduler import RunPriority, RunScheduler, get_run_priority
 from recce.core import default_context
 from recce.exceptions import RecceException
 from recce.models import Run, RunDAO, RunType
@@ -10,6 +15,49 @@ from recce.models.types import RunStatus
 running_tasks = {}
 logger = logging.getLogger("uvicorn")
 
+# The completion events of the submitted runs, set once the run finishes, fails or is cancelled
+run_events: Dict[UUID, asyncio.Event] = {}
+
+# Called on the event loop with "progress" or "completed" and the run, e.g. to push the run to the web clients
+RunListener = Callable[[str, Run], Awaitable[None]]
+run_listeners: List[RunListener] = []
+
+
+def add_run_listener(listener: RunListener):
+    run_listeners.append(listener)
+
+
+def remove_run_listener(listener: RunListener):
+    if listener in run_listeners:
+        run_listeners.remove(listener)
+
+
+def _notify_run_listeners(event: str, run: Run):
+    for listener in list(run_listeners):
+        asyncio.ensure_future(listener(event, run))
+
+
+def _complete_run(run: Run):
+    event = run_events.pop(run.run_id, None)
+    if event is not None:
+        event.set()
+    _notify_run_listeners("completed", run)
+
+
+async def wait_run(run: Run, timeout: Optional[float] = None) -> Run:
+    """
+    Wait until the run completes, or for at most `timeout` seconds.
+    """
+    event = run_events.get(run.run_id)
+    if event is None or run.result is not None or run.error is not None:
+        # The run has completed, or was not submitted by this process
+        return run
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    return run
+
 
 def _get_ref_model(sql_template: str) -> Optional[str]:
     import re
@@ -91,7 +139,44 @@ def create_task(run_type: RunType, params: dict):
     return taskClz(params)
 
 
-def submit_run(type, params, check_id=None):
+def get_run_scheduler() -> RunScheduler:
+    context = default_context()
+    if context.run_scheduler is None:
+        context.run_scheduler = RunScheduler(max_workers=context.max_concurrent_runs)
+    return context.run_scheduler
+
+
+@dataclass
+class _Flight:
+    """
+    A task in flight and the runs waiting for its result.
+    """
+
+    key: str
+    task: Any
+    future: Optional[asyncio.Future] = None
+    runs: List[Run] = field(default_factory=list)
+
+
+# The tasks in flight by the key of `get_flight_key`. Identical runs submitted while a task is in flight attach to it
+# instead of executing again.
+inflight_runs: Dict[str, _Flight] = {}
+
+
+def get_flight_key(run_type: RunType, params: Optional[dict]) -> str:
+    """
+    The canonical hash of a run. Runs with the same type and params on the same artifacts return the same result.
+    """
+    adapter = default_context().adapter
+    payload = {
+        "type": run_type.value,
+        "params": params,
+        "artifacts_version": getattr(adapter, "artifacts_version", 0),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def submit_run(type, params, check_id=None, priority: Optional[RunPriority] = None):
     try:
         run_type = RunType(type)
     except ValueError:
@@ -114,26 +199,44 @@ def submit_run(type, params, check_id=None):
     run.name = generate_run_name(run)
     RunDAO().create(run)
 
+    # Attach to the identical run in flight. The run gets the shared result, but keeps its own record.
+    key = get_flight_key(run_type, params)
+    run_events[run.run_id] = asyncio.Event()
+    flight = inflight_runs.get(key)
+    if flight is not None and not flight.future.done():
+        flight.runs.append(run)
+        running_tasks[run.run_id] = flight.task
+        run.queue_position = flight.runs[0].queue_position
+        if flight.runs[0].progress is not None:
+            run.progress = dict(flight.runs[0].progress)
+        return run, flight.future
+
+    flight = _Flight(key=key, task=task, runs=[run])
+
     loop = asyncio.get_running_loop()
     running_tasks[run.run_id] = task
 
     def progress_listener(message=None, percentage=None):
-        run.progress = {"message": message, "percentage": percentage}
+        for r in list(flight.runs):
+            r.progress = {"message": message, "percentage": percentage}
+            loop.call_soon_threadsafe(_notify_run_listeners, "progress", r)
 
     task.progress_listener = progress_listener
 
     async def update_run_result(run_id, result, error):
-        if run is None:
-            return
-        if result is not None:
-            run.result = result
-            run.status = RunStatus.FINISHED
-        if error is not None:
-            failed_reason = str(error) if str(error) != "None" else repr(error)
-            run.error = failed_reason
-            if run.status != RunStatus.CANCELLED:
-                run.status = RunStatus.FAILED
-        run.progress = None
+        if inflight_runs.get(key) is flight:
+            del inflight_runs[key]
+        for r in flight.runs:
+            if result is not None:
+                r.result = result
+                r.status = RunStatus.FINISHED
+            if error is not None:
+                failed_reason = str(error) if str(error) != "None" else repr(error)
+                r.error = failed_reason
+                if r.status != RunStatus.CANCELLED:
+                    r.status = RunStatus.FAILED
+            r.progress = None
+            _complete_run(r)
 
     def fn():
         try:
@@ -152,8 +255,22 @@ def submit_run(type, params, check_id=None):
             logger.error(f"Failed to execute {run_type} task: {failed_reason}")
             return None
 
-    future = loop.run_in_executor(None, fn)
-    return run, future
+    if priority is None:
+        priority = get_run_priority(run_type)
+
+    def queue_listener(r: Run):
+        loop.call_soon_threadsafe(_notify_run_listeners, "progress", r)
+
+    flight.future = get_run_scheduler().submit(run, fn, priority, runs=flight.runs, listener=queue_listener)
+    inflight_runs[key] = flight
+    return run, flight.future
+
+
+def _find_flight(run: Run) -> Optional[_Flight]:
+    for flight in inflight_runs.values():
+        if run in flight.runs:
+            return flight
+    return None
 
 
 def cancel_run(run_id):
@@ -165,9 +282,28 @@ def cancel_run(run_id):
     if task is None:
         raise RecceException(f"Run task for Run ID '{run_id}' not found")
 
+    flight = _find_flight(run)
+    if flight is not None and len(flight.runs) > 1:
+        # Other runs still wait for the shared task, so only this run is cancelled
+        flight.runs.remove(run)
+        run.status = RunStatus.CANCELLED
+        run.error = "Cancelled"
+        run.queue_position = None
+        run.progress = None
+        _complete_run(run)
+        return
+
     task.cancel()
     run.status = RunStatus.CANCELLED
 
+    # A queued run never starts
+    if get_run_scheduler().cancel(run_id):
+        run.error = "Cancelled"
+        run.progress = None
+        if flight is not None and inflight_runs.get(flight.key) is flight:
+            del inflight_runs[flight.key]
+        _complete_run(run)
+
 
 def materialize_run_results(runs: List[Run], nodes: List[str] = None):
     """
@@ -0,0 +1,166 @@
+import asyncio
+import bisect
+import itertools
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+from recce.models import Run, RunType
+
+DEFAULT_MAX_CONCURRENT_RUNS = 4
+
+
+class RunPriority(IntEnum):
+    """
+    Queued runs start in priority order, then in submission order.
+    """
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+# Run types that scan whole relations and are usually run in bulk, e.g. by `recce run` or over many nodes
+BATCH_RUN_TYPES = {
+    RunType.ROW_COUNT,
+    RunType.ROW_COUNT_DIFF,
+    RunType.VALUE_DIFF,
+    RunType.PROFILE,
+    RunType.PROFILE_DIFF,
+}
+
+
+def get_run_priority(run_type: RunType) -> RunPriority:
+    return RunPriority.BATCH if run_type in BATCH_RUN_TYPES else RunPriority.INTERACTIVE
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    seq: int
+    run: Run = field(compare=False)
+    fn: Callable[[], Any] = field(compare=False)
+    runs: List[Run] = field(compare=False)
+    listener: Optional[Callable[[Run], None]] = field(compare=False, default=None)
+    future: Future = field(compare=False, default_factory=Future)
+
+
+class RunScheduler:
+    """
+    Execute runs on a bounded pool of worker threads.
+
+    Runs wait in a queue ordered by priority and then by submission. While a run waits, its `queue_position` is the
+    number of runs that start before it plus one, and its progress message shows the position. Batch runs never take
+    the last worker, so an interactive run does not wait behind long batch runs. With a single worker, batch runs take
+    the only worker, and interactive runs only go ahead of the queued batch runs.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_CONCURRENT_RUNS):
+        self.max_workers = max(max_workers or 1, 1)
+        # Keep a worker for the interactive runs, unless it is the only one and the batch runs would never start
+        self.max_batch_workers = max(self.max_workers - 1, 1)
+        self._queue: List[_Job] = []
+        self._running: Dict[RunPriority, int] = {priority: 0 for priority in RunPriority}
+        self._condition = threading.Condition()
+        self._seq = itertools.count()
+        self._workers: List[threading.Thread] = []
+
+    def submit(
+        self,
+        run: Run,
+        fn: Callable[[], Any],
+        priority: RunPriority = RunPriority.INTERACTIVE,
+        runs: Optional[List[Run]] = None,
+        listener: Optional[Callable[[Run], None]] = None,
+    ) -> asyncio.Future:
+        """
+        Queue the run. `fn` executes it on a worker thread.
+        :param runs: The runs waiting for the result of `fn`, which report the queue position. Default to `[run]`. The
+            list may grow while the run is queued.
+        :param listener: Called with each of the runs whenever its queue position changes. It is called with the lock
+            held, so it must not block.
+        :return: A future of the event loop, resolved with the return value of `fn`
+        """
+        runs = runs if runs is not None else [run]
+        job = _Job(priority=int(priority), seq=next(self._seq), run=run, fn=fn, runs=runs, listener=listener)
+        with self._condition:
+            bisect.insort(self._queue, job)
+            self._update_queue_positions()
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, name=f"recce-run-{len(self._workers)}", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._condition.notify_all()
+        return asyncio.wrap_future(job.future)
+
+    def cancel(self, run_id, result: Any = None) -> bool:
+        """
+        Remove the run from the queue and resolve its future with `result`. Return False if the run is not queued, i.e.
+        it has already started.
+        """
+        with self._condition:
+            for job in self._queue:
+                if any(str(r.run_id) == str(run_id) for r in list(job.runs)):
+                    self._queue.remove(job)
+                    self._update_queue_positions()
+                    break
+            else:
+                return False
+
+        for r in list(job.runs):
+            r.queue_position = None
+        job.future.set_result(result)
+        return True
+
+    def queued(self) -> List[Run]:
+        """
+        The queued runs, in the order they start.
+        """
+        with self._condition:
+            return [job.run for job in self._queue]
+
+    def _take(self) -> Optional[_Job]:
+        # Must be called with the lock held
+        for job in self._queue:
+            if job.priority == RunPriority.BATCH and self._running[RunPriority.BATCH] >= self.max_batch_workers:
+                continue
+            self._queue.remove(job)
+            self._running[RunPriority(job.priority)] += 1
+            self._update_queue_positions()
+            return job
+        return None
+
+    def _update_queue_positions(self):
+        # Must be called with the lock held
+        for position, job in enumerate(self._queue, start=1):
+            for run in list(job.runs):
+                if run.queue_position == position:
+                    continue
+                run.queue_position = position
+                run.progress = {"message": f"Queued at position {position}", "percentage": None}
+                if job.listener is not None:
+                    job.listener(run)
+
+    def _work(self):
+        while True:
+            with self._condition:
+                job = self._take()
+                while job is None:
+                    self._condition.wait()
+                    job = self._take()
+
+            for run in list(job.runs):
+                run.queue_position = None
+                run.progress = None
+                run.mark_started()
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        job.future.set_result(job.fn())
+                    except BaseException as e:
+                        job.future.set_exception(e)
+            finally:
+                with self._condition:
+                    self._running[RunPriority(job.priority)] -= 1
+                    self._condition.notify_all()
@@ -245,6 +245,59 @@ recce_dbt_artifact_dir_options = [
     ),
 ]
 
+recce_performance_options = [
+    click.option(
+        "--cll-workers",
+        help="Number of worker processes used to compute column-level lineage and change analysis. "
+        "1 computes them in the main process.",
+        type=click.IntRange(min=1),
+        envvar="RECCE_CLL_WORKERS",
+        default=1,
+        show_default=True,
+    ),
+    click.option(
+        "--cache-dir",
+        help="Directory of the disk cache of column-level lineage and change analysis results, shared by later runs. "
+        "Entries unused for 30 days are removed. The results are only cached in memory if not set.",
+        type=click.Path(),
+        envvar="RECCE_CACHE_DIR",
+    ),
+    click.option(
+        "--query-cache-ttl",
+        help="Seconds to cache the results of warehouse queries, so that re-running a check returns instantly. "
+        "The cache is dropped when the artifacts are reloaded. 0 disables the cache.",
+        type=click.FloatRange(min=0),
+        envvar="RECCE_QUERY_CACHE_TTL",
+        default=0,
+        show_default=True,
+    ),
+    click.option(
+        "--query-cache-size",
+        help="Maximum number of query results in the query cache.",
+        type=click.IntRange(min=1),
+        envvar="RECCE_QUERY_CACHE_SIZE",
+        default=128,
+        show_default=True,
+    ),
+    click.option(
+        "--max-concurrent-runs",
+        help="Maximum number of runs executed at the same time. Other runs wait in a queue, interactive runs first. "
+        "One worker is kept for interactive runs unless the maximum is 1.",
+        type=click.IntRange(min=1),
+        envvar="RECCE_MAX_CONCURRENT_RUNS",
+        default=4,
+        show_default=True,
+    ),
+    click.option(
+        "--max-concurrent-statements",
+        help="Maximum number of statements running on the warehouse at the same time. 0 means no limit.",
+        type=click.IntRange(min=0),
+        envvar="RECCE_MAX_CONCURRENT_STATEMENTS",
+        default=0,
+        show_default=True,
+    ),
+]
+
 recce_hidden_options = [
     click.option(
         "--mode",
@@ -493,6 +546,7 @@ def diff(sql, primary_keys: List[str] = None, keep_shape: bool = False, keep_equ
 @add_options(recce_dbt_artifact_dir_options)
 @add_options(recce_cloud_options)
 @add_options(recce_cloud_auth_options)
+@add_options(recce_performance_options)
 @add_options(recce_hidden_options)
 def server(host, port, lifetime, idle_timeout=0, state_file=None, **kwargs):
     """
@@ -674,6 +728,15 @@ DEFAULT_RECCE_STATE_FILE = "recce_state.json"
 @click.option("--summary", help="Path of the summary markdown file.", type=click.Path())
 @click.option("--skip-query", is_flag=True, help="Skip running the queries for the checks.")
 @click.option("--skip-check", is_flag=True, help="Skip running the checks.")
+@click.option(
+    "--concurrency",
+    help="Number of checks to run at the same time. 1 runs the checks one after another. "
+    "It overrides --max-concurrent-runs.",
+    type=click.IntRange(min=1),
+    envvar="RECCE_RUN_CONCURRENCY",
+    default=1,
+    show_default=True,
+)
 @click.option(
     "--git-current-branch",
     help="The git branch of the current environment.",
@@ -692,6 +755,7 @@ DEFAULT_RECCE_STATE_FILE = "recce_state.json"
 @add_options(recce_dbt_artifact_dir_options)
 @add_options(recce_cloud_options)
 @add_options(recce_cloud_auth_options)
+@add_options(recce_performance_options)
 @add_options(recce_hidden_options)
 def run(output, **kwargs):
     """
@@ -1743,6 +1807,7 @@ def read_only(ctx, state_file=None, **kwargs):
 @add_options(recce_dbt_artifact_dir_options)
 @add_options(recce_cloud_options)
 @add_options(recce_cloud_auth_options)
+@add_options(recce_performance_options)
 @add_options(recce_hidden_options)
 def mcp_server(sse, host, port, **kwargs):
     """
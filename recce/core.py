@@ -6,7 +6,9 @@ from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from recce.adapter.base import BaseAdapter
+from recce.apis.run_scheduler import DEFAULT_MAX_CONCURRENT_RUNS, RunScheduler
 from recce.models import Check, Run
+from recce.models.store import CheckStore, RunStore
 from recce.models.types import LineageDiff
 from recce.state import (
     GitRepoInfo,
@@ -26,8 +28,11 @@ class RecceContext:
     adapter_type: str = None
     adapter: BaseAdapter = None
     state_loader: RecceStateLoader = None
-    runs: List[Run] = field(default_factory=list)
-    checks: List[Check] = field(default_factory=list)
+    runs: List[Run] = field(default_factory=RunStore)
+    checks: List[Check] = field(default_factory=CheckStore)
+    # The number of runs executed at the same time. The scheduler is created on the first run.
+    max_concurrent_runs: int = DEFAULT_MAX_CONCURRENT_RUNS
+    run_scheduler: Optional[RunScheduler] = None
 
     @classmethod
     def load(cls, **kwargs):
@@ -37,6 +42,7 @@ class RecceContext:
         context = cls(
             review_mode=is_review_mode,
             state_loader=state_loader,
+            max_concurrent_runs=kwargs.get("max_concurrent_runs") or DEFAULT_MAX_CONCURRENT_RUNS,
         )
 
         # Initiate the adapter
@@ -100,6 +106,10 @@ class RecceContext:
     def stop_monitor_artifacts(self):
         self.adapter.stop_monitor_artifacts()
 
+    def close(self):
+        if self.adapter is not None:
+            self.adapter.close()
+
     def refresh_manifest(self, refresh_file_path: str = None):
         self.adapter.refresh(refresh_file_path)
 
@@ -208,7 +218,7 @@ class RecceContext:
             else:
                 checks.append(imported)
                 imports += 1
-        self.checks = checks
+        self.checks = CheckStore(checks)
         return imports
 
     def _merge_runs(self, import_runs: list[Run]):
@@ -222,7 +232,7 @@ class RecceContext:
                 imports += 1
 
         runs.sort(key=lambda x: x.run_at)
-        self.runs = runs
+        self.runs = RunStore(runs)
         return imports
 
     def import_state(self, import_state: RecceState, merge: bool = True):
@@ -238,9 +248,9 @@ class RecceContext:
             import_runs = self._merge_runs(import_state.runs)
             import_checks = self._merge_checks(import_state.checks)
         else:
-            self.runs = list(import_state.runs)
+            self.runs = RunStore(import_state.runs)
             import_runs = len(self.runs)
-            self.checks = list(import_state.checks)
+            self.checks = CheckStore(import_state.checks)
             import_checks = len(self.checks)
 
         # always merge for artifacts
@@ -260,7 +270,7 @@ class RecceContext:
         if merge:
             import_checks = self._merge_checks(import_state.checks)
         else:
-            self.checks = list(import_state.checks)
+            self.checks = CheckStore(import_state.checks)
             import_checks = len(self.checks)
 
         return import_checks
@@ -331,4 +341,8 @@ def set_default_context(context: RecceContext):
     """
 
     global recce_context
+    # The adapter of the replaced context is no longer used, so release its resources
+    previous = recce_context
+    if previous is not None and previous is not context and previous.adapter is not getattr(context, "adapter", None):
+        previous.close()
     recce_context = context
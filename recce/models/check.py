@@ -13,6 +13,7 @@ from uuid import UUID
 
 from recce.exceptions import RecceException
 
+from .store import CheckStore
 from .types import Check, RunType
 
 if typing.TYPE_CHECKING:
@@ -37,11 +38,14 @@ class CheckDAO:
         self._session_info_cache = None
 
     @property
-    def _checks(self):
+    def _checks(self) -> CheckStore:
         """Get checks from local context."""
         from recce.core import default_context
 
-        return default_context().checks
+        context = default_context()
+        if not isinstance(context.checks, CheckStore):
+            context.checks = CheckStore(context.checks)
+        return context.checks
 
     @property
     def is_cloud_user(self) -> bool:
@@ -256,10 +260,7 @@ class CheckDAO:
                 return None
         else:
             # Local mode
-            for check in self._checks:
-                if str(check_id) == str(check.check_id):
-                    return check
-            return None
+            return self._checks.find("check_id", check_id)
 
     def update_check_by_id(self, check_id, patch: "PatchCheckIn") -> Optional[Check]:
         """
@@ -336,11 +337,11 @@ class CheckDAO:
                 return False
         else:
             # Local mode
-            for check in self._checks:
-                if str(check_id) == str(check.check_id):
-                    self._checks.remove(check)
-                    return True
-            return False
+            check = self._checks.find("check_id", check_id)
+            if check is None:
+                return False
+            self._checks.remove(check)
+            return True
 
     def list(self) -> List[Check]:
         """
@@ -1,3 +1,4 @@
+from .store import RunStore
 from .types import Run, RunType
 
 
@@ -7,43 +8,42 @@ class RunDAO:
     """
 
     @property
-    def _runs(self):
+    def _runs(self) -> RunStore:
         from recce.core import default_context
 
-        return default_context().runs
+        context = default_context()
+        if not isinstance(context.runs, RunStore):
+            context.runs = RunStore(context.runs)
+        return context.runs
 
     def create(self, run: Run):
         self._runs.append(run)
 
     def find_run_by_id(self, run_id):
-        for run in self._runs:
-            if str(run_id) == str(run.run_id):
-                if run.params and "primary_keys" in run.params:
-                    run.params["primary_keys"] = [key.replace('"', "") for key in run.params["primary_keys"]]
+        run = self._runs.find("run_id", run_id)
+        if run is not None and run.params and "primary_keys" in run.params:
+            run.params["primary_keys"] = [key.replace('"', "") for key in run.params["primary_keys"]]
 
-                return run
-
-        return None
+        return run
 
     def list(self, type_filter: RunType = None):
         if type_filter:
-            return list(filter(lambda run: run.type == type_filter, self._runs))
+            return self._runs.find_all("type", type_filter)
         return list(self._runs)
 
     def list_by_check_id(self, check_id):
-        runs = []
-        for run in self._runs:
-            if str(check_id) == str(run.check_id):
-                runs.append(run)
-        return runs
+        return self._runs.find_all("check_id", check_id)
+
+    def set_check_id(self, run: Run, check_id):
+        self._runs.set_attribute(run, "check_id", check_id)
 
     def delete(self, run_id):
-        for run in self._runs:
-            if str(run_id) == str(run.run_id):
-                self._runs.remove(run)
-                return True
+        run = self._runs.find("run_id", run_id)
+        if run is None:
+            return False
 
-        return False
+        self._runs.remove(run)
+        return True
 
     def clear(self):
         self._runs.clear()
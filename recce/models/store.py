@@ -0,0 +1,220 @@
+import bisect
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _index_key(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value)
+
+
+# The gap between the order keys of consecutive items, so that most inserts fit a key between their neighbours
+_ORDER_KEY_STEP = 1 << 20
+
+
+class IndexedList(list):
+    """
+    A list with dict indexes over some attributes of its items, so lookups by those attributes do not scan the list.
+
+    The indexes are kept in sync on every mutation of the list. An indexed attribute changed on an item already in the
+    list is not seen until `reindex` is called, unless it is changed with `set_attribute`. Lookups return the items in
+    list order, as a linear scan would.
+
+    Each item has an order key, increasing along the list, so the position of an item and its place in an index
+    bucket are found by bisection. `remove` finds its item by identity rather than equality.
+    """
+
+    indexed_attributes: Tuple[str, ...] = ()
+
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self._indexes: Dict[str, Dict[str, List[Any]]] = {}
+        # The order keys of the items, in list order, and the order keys of each item by its id
+        self._order_keys: List[int] = []
+        self._order_keys_by_id: Dict[int, List[int]] = {}
+        self.reindex()
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles rebuild the indexes from the items
+        return self.__class__, (list(self),)
+
+    def find(self, attribute: str, value) -> Optional[Any]:
+        """
+        Return the first item whose `attribute` equals `value`, compared as strings, or None.
+        """
+        bucket = self._indexes[attribute].get(_index_key(value))
+        return bucket[0] if bucket else None
+
+    def find_all(self, attribute: str, value) -> List[Any]:
+        """
+        Return the items whose `attribute` equals `value`, compared as strings.
+        """
+        return list(self._indexes[attribute].get(_index_key(value), ()))
+
+    def reindex(self, attribute: Optional[str] = None):
+        """
+        Rebuild the index of `attribute`, or all the indexes and the order keys if None.
+        """
+        if attribute is None:
+            self._renumber()
+        attributes = self.indexed_attributes if attribute is None else (attribute,)
+        for attr in attributes:
+            self._indexes[attr] = {}
+        for item in self:
+            for attr in attributes:
+                self._indexes[attr].setdefault(_index_key(getattr(item, attr, None)), []).append(item)
+
+    def set_attribute(self, item, attribute: str, value):
+        """
+        Set the attribute of an item and move the item to its new bucket of the index, without rebuilding the index.
+        """
+        if attribute not in self.indexed_attributes or id(item) not in self._order_keys_by_id:
+            setattr(item, attribute, value)
+            return
+        self._remove_from_index(item, attribute)
+        setattr(item, attribute, value)
+        self._add_to_index(item, attribute)
+
+    def _renumber(self):
+        self._order_keys = [(i + 1) * _ORDER_KEY_STEP for i in range(len(self))]
+        self._order_keys_by_id = {}
+        for item, key in zip(self, self._order_keys):
+            self._order_keys_by_id.setdefault(id(item), []).append(key)
+
+    def _order_key(self, item) -> int:
+        return self._order_keys_by_id[id(item)][0]
+
+    def _add_order_key(self, item, key: int):
+        keys = self._order_keys_by_id.setdefault(id(item), [])
+        bisect.insort(keys, key)
+
+    def _remove_order_key(self, item, key: int):
+        keys = self._order_keys_by_id[id(item)]
+        keys.remove(key)
+        if not keys:
+            del self._order_keys_by_id[id(item)]
+
+    def _add_to_index(self, item, attribute: str):
+        bucket = self._indexes[attribute].setdefault(_index_key(getattr(item, attribute, None)), [])
+        # Keep the bucket in list order
+        key = self._order_key(item)
+        lo, hi = 0, len(bucket)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._order_key(bucket[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        bucket.insert(lo, item)
+
+    def _remove_from_index(self, item, attribute: str):
+        key = _index_key(getattr(item, attribute, None))
+        bucket = self._indexes[attribute].get(key)
+        if bucket is None:
+            return
+        for i, other in enumerate(bucket):
+            if other is item:
+                del bucket[i]
+                break
+        if not bucket:
+            del self._indexes[attribute][key]
+
+    def _added(self, item, key: int):
+        self._add_order_key(item, key)
+        for attr in self.indexed_attributes:
+            self._add_to_index(item, attr)
+
+    def _removed(self, item, key: int):
+        for attr in self.indexed_attributes:
+            self._remove_from_index(item, attr)
+        self._remove_order_key(item, key)
+
+    def append(self, item):
+        super().append(item)
+        key = (self._order_keys[-1] if self._order_keys else 0) + _ORDER_KEY_STEP
+        self._order_keys.append(key)
+        self._added(item, key)
+
+    def extend(self, iterable: Iterable):
+        for item in list(iterable):
+            self.append(item)
+
+    def __iadd__(self, iterable: Iterable):
+        self.extend(iterable)
+        return self
+
+    def remove(self, item):
+        keys = self._order_keys_by_id.get(id(item))
+        if not keys:
+            raise ValueError("IndexedList.remove(x): x not in list")
+        del self[bisect.bisect_left(self._order_keys, keys[0])]
+
+    def pop(self, index: int = -1):
+        item = self[index]
+        del self[index]
+        return item
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            removed = list(zip(self[index], self._order_keys[index]))
+        else:
+            removed = [(self[index], self._order_keys[index])]
+        super().__delitem__(index)
+        del self._order_keys[index]
+        for item, key in removed:
+            self._removed(item, key)
+
+    def insert(self, index: int, item):
+        index = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        before = self._order_keys[index - 1] if index > 0 else 0
+        after = self._order_keys[index] if index < len(self) else before + 2 * _ORDER_KEY_STEP
+        super().insert(index, item)
+        if after - before < 2:
+            # No key fits between the neighbours
+            self.reindex()
+            return
+        key = (before + after) // 2
+        self._order_keys.insert(index, key)
+        self._added(item, key)
+
+    def clear(self):
+        super().clear()
+        self.reindex()
+
+    # The operations below may reorder or replace many items, so they rebuild the indexes
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.reindex()
+
+    def __imul__(self, n: int):
+        result = super().__imul__(n)
+        self.reindex()
+        return result
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.reindex()
+
+    def reverse(self):
+        super().reverse()
+        self.reindex()
+
+
+class RunStore(IndexedList):
+    """
+    The runs of a context, indexed by run id, check id and type.
+    """
+
+    indexed_attributes = ("run_id", "check_id", "type")
+
+
+class CheckStore(IndexedList):
+    """
+    The checks of a context, indexed by check id.
+    """
+
+    indexed_attributes = ("check_id",)
@@ -1,9 +1,10 @@
+import time
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Literal, Optional, Set
 
-from pydantic import UUID4, BaseModel, Field
+from pydantic import UUID4, BaseModel, Field, PrivateAttr
 
 from recce.util.pydantic_model import pydantic_model_dump
 
@@ -49,8 +50,11 @@ class Run(BaseModel):
     error: Optional[str] = None
     status: Optional[RunStatus] = None
     progress: Optional[RunProgress] = None
+    # Position in the run queue while the run waits to start, 1 being the next run to start
+    queue_position: Optional[int] = None
     run_id: UUID4 = Field(default_factory=uuid.uuid4)
     run_at: str = Field(default_factory=lambda: datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"))
+    _started_at: Optional[float] = PrivateAttr(default=None)
 
     def __init__(self, **data):
         type = data.get("type")
@@ -85,6 +89,16 @@ class Run(BaseModel):
 
         super().__init__(**data)
 
+    @property
+    def started_at(self) -> Optional[float]:
+        """
+        When the run left the queue and started to execute, as a `time.time()` timestamp. It is not persisted.
+        """
+        return self._started_at
+
+    def mark_started(self):
+        self._started_at = time.time()
+
 
 class Check(BaseModel):
     name: str
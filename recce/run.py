@@ -1,8 +1,9 @@
+import asyncio
 import os
 import sys
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from deepdiff import DeepDiff
 from rich import box
@@ -112,9 +113,56 @@ def run_should_be_approved(run):
     return False
 
 
-async def execute_preset_checks(preset_checks: List, is_skip_query: bool) -> Tuple[int, List[Dict]]:
+def _check_has_run(check_type: str, is_skip_query: bool) -> bool:
+    return (
+        not is_skip_query
+        and check_type in [e.value for e in RunType]
+        and check_type not in ["schema_diff", "lineage_diff"]
+    )
+
+
+async def _execute_check_run(check_type: str, check_params: dict, check_id=None):
+    """
+    Submit the run of a check and wait for it. Return the run, the error raised by the run if any, and the execution
+    time in seconds, counted from the moment the run leaves the queue of the run scheduler.
+    """
+    run = None
+    start = time.time()
+    try:
+        run, future = submit_run(check_type, params=check_params, check_id=check_id)
+        await future
+        # A run attached to an identical run in flight never waits in the queue itself
+        started_at = run.started_at if run.started_at is not None else start
+        return run, None, time.time() - started_at
+    except Exception as e:
+        return run, e, None
+
+
+async def _execute_check_runs(runs: Dict[int, Tuple], concurrency: int) -> Dict[int, Tuple]:
+    """
+    Execute the runs of the checks, with at most `concurrency` of them at the same time. The execution time of each run
+    does not include the time it waits for its turn, here or in the queue of the run scheduler.
+    :param runs: Index of the check to the arguments of `_execute_check_run`
+    :return: Index of the check to the run, the error and the execution time
+    """
+    semaphore = asyncio.Semaphore(max(concurrency or 1, 1))
+
+    async def _execute(args):
+        async with semaphore:
+            return await _execute_check_run(*args)
+
+    results = await asyncio.gather(*[_execute(args) for args in runs.values()])
+    return dict(zip(runs.keys(), results))
+
+
+async def execute_preset_checks(
+    preset_checks: List, is_skip_query: bool, concurrency: Optional[int] = 1
+) -> Tuple[int, List[Dict]]:
     """
     Execute the preset checks
+
+    The runs of the checks are executed first, up to `concurrency` at the same time. The checks are then created and
+    reported in the order of the preset checks.
     """
     console = Console()
     rc = 0
@@ -129,9 +177,19 @@ async def execute_preset_checks(preset_checks: List, is_skip_query: bool) -> Tup
     # Purge the existing preset checks before running the new ones
     purge_preset_checks()
 
+    executions = await _execute_check_runs(
+        {
+            index: (check.get("type"), check.get("params") if check.get("params") else {})
+            for index, check in enumerate(preset_checks)
+            if _check_has_run(check.get("type"), is_skip_query)
+        },
+        concurrency,
+    )
+
     # Execute the preset checks
-    for check in preset_checks:
+    for index, check in enumerate(preset_checks):
         run = None
+        elapsed = None
         check_name = check.get("name")
         check_type = check.get("type")
         check_description = check.get("description", "")
@@ -157,8 +215,9 @@ async def execute_preset_checks(preset_checks: List, is_skip_query: bool) -> Tup
                 )
             else:
                 if not is_skip_query:
-                    run, future = submit_run(check_type, params=check_params)
-                    await future
+                    run, error, elapsed = executions[index]
+                    if error is not None:
+                        raise error
                     is_check = run_should_be_approved(run)
                     create_check_from_run(
                         run.run_id, check_name, check_description, check_options, is_preset=True, is_checked=is_check
@@ -169,12 +228,13 @@ async def execute_preset_checks(preset_checks: List, is_skip_query: bool) -> Tup
                     )
                     continue
 
-            end = time.time()
+            if elapsed is None:
+                elapsed = time.time() - start
             table.add_row(
                 "[[green]Success[/green]]",
                 check_name,
                 check_type.replace("_", " ").title(),
-                f"{end - start:.2f} seconds",
+                f"{elapsed:.2f} seconds",
                 "N/A",
             )
         except Exception as e:
@@ -207,9 +267,13 @@ async def execute_preset_checks(preset_checks: List, is_skip_query: bool) -> Tup
     return rc, failed_checks
 
 
-async def execute_state_checks(checks: List, is_skip_query: bool) -> Tuple[int, List[Dict]]:
+async def execute_state_checks(
+    checks: List, is_skip_query: bool, concurrency: Optional[int] = 1
+) -> Tuple[int, List[Dict]]:
     """
     Execute the checks from loaded state
+
+    The runs of the checks are executed up to `concurrency` at the same time, and reported in the order of the checks.
     """
     console = Console()
     rc = 0
@@ -221,14 +285,22 @@ async def execute_state_checks(checks: List, is_skip_query: bool) -> Tuple[int,
     table.add_column("Execution Time")
     table.add_column("Failed Reason")
 
+    executions = await _execute_check_runs(
+        {
+            index: (check.type.value, check.params if check.params else {}, check.check_id)
+            for index, check in enumerate(checks)
+            if _check_has_run(check.type.value, is_skip_query)
+        },
+        concurrency,
+    )
+
     # Execute loaded checks
-    for check in checks:
+    for index, check in enumerate(checks):
         run = None
-        check_id = check.check_id
+        elapsed = None
         check_name = check.name
         check_type = check.type.value
         check_description = check.description
-        check_params = check.params if check.params else {}
         if check.is_checked:
             check.is_checked = False
             check.updated_at = datetime.now(tz=timezone.utc).replace(microsecond=0)
@@ -239,16 +311,18 @@ async def execute_state_checks(checks: List, is_skip_query: bool) -> Tuple[int,
                 raise ValueError(f"Invalid check type: {check_type}")
 
             start = time.time()
-            if check_type not in ["schema_diff", "lineage_diff"] and not is_skip_query:
-                run, future = submit_run(check_type, params=check_params, check_id=check_id)
-                await future
+            if index in executions:
+                run, error, elapsed = executions[index]
+                if error is not None:
+                    raise error
 
-            end = time.time()
+            if elapsed is None:
+                elapsed = time.time() - start
             table.add_row(
                 "[[green]Success[/green]]",
                 check_name,
                 check_type.replace("_", " ").title(),
-                f"{end - start:.2f} seconds",
+                f"{elapsed:.2f} seconds",
                 "N/A",
             )
         except Exception as e:
@@ -320,71 +394,78 @@ async def cli_run(output_state_file: str, **kwargs):
     from recce.core import load_context
 
     ctx = load_context(**kwargs)
-
-    # Set up the checks if this is a session-based run
-    if kwargs.get("session_id") and kwargs.get("state_loader"):
-        state_loader = kwargs.get("state_loader")
-        try:
-            # Try to populate the checks from the database
-            state_loader.state.checks = CheckDAO().list()
-        except Exception as e:
-            console.print(f"[[red]Error[/red]] Failed to load checks from database: {e}")
-
-    is_skip_query = kwargs.get("skip_query", False)
-    is_skip_check = kwargs.get("skip_check", False)
-
-    # Prepare the artifact by collecting the lineage
-    console.rule("DBT Artifacts")
-    from recce.adapter.dbt_adapter import DbtAdapter
-
-    dbt_adaptor: DbtAdapter = ctx.adapter
-    dbt_adaptor.print_lineage_info()
-
-    # Execute the preset checks
-    rc = 0
-    if ctx.state_loader.state is None:
-        preset_checks = RecceConfig().get("checks")
-        if is_skip_check or preset_checks is None or len(preset_checks) == 0:
-            # Skip the preset checks
-            pass
+    try:
+        # Set up the checks if this is a session-based run
+        if kwargs.get("session_id") and kwargs.get("state_loader"):
+            state_loader = kwargs.get("state_loader")
+            try:
+                # Try to populate the checks from the database
+                state_loader.state.checks = CheckDAO().list()
+            except Exception as e:
+                console.print(f"[[red]Error[/red]] Failed to load checks from database: {e}")
+
+        is_skip_query = kwargs.get("skip_query", False)
+        is_skip_check = kwargs.get("skip_check", False)
+        concurrency = kwargs.get("concurrency") or 1
+        # The runs are only bounded by `--concurrency`. The run scheduler keeps a worker for interactive runs, which
+        # `recce run` does not submit, so it gets one more worker than the runs at the same time.
+        ctx.max_concurrent_runs = concurrency + 1
+
+        # Prepare the artifact by collecting the lineage
+        console.rule("DBT Artifacts")
+        from recce.adapter.dbt_adapter import DbtAdapter
+
+        dbt_adaptor: DbtAdapter = ctx.adapter
+        dbt_adaptor.print_lineage_info()
+
+        # Execute the preset checks
+        rc = 0
+        if ctx.state_loader.state is None:
+            preset_checks = RecceConfig().get("checks")
+            if is_skip_check or preset_checks is None or len(preset_checks) == 0:
+                # Skip the preset checks
+                pass
+            else:
+                console.rule("Preset checks")
+                _, failed_checks = await execute_preset_checks(preset_checks, is_skip_query, concurrency)
+                if failed_checks:
+                    console.print("[[yellow]Warning[/yellow]] Preset checks failed. Please see the failed reason.")
+                    process_failed_checks(failed_checks, error_log)
         else:
-            console.rule("Preset checks")
-            _, failed_checks = await execute_preset_checks(preset_checks, is_skip_query)
-            if failed_checks:
-                console.print("[[yellow]Warning[/yellow]] Preset checks failed. Please see the failed reason.")
-                process_failed_checks(failed_checks, error_log)
-    else:
-        state_checks = ctx.state_loader.state.checks
-        if is_skip_check or state_checks is None or len(state_checks) == 0:
-            # Skip the checks in the state
-            pass
+            state_checks = ctx.state_loader.state.checks
+            if is_skip_check or state_checks is None or len(state_checks) == 0:
+                # Skip the checks in the state
+                pass
+            else:
+                console.rule("Checks")
+                _, failed_checks = await execute_state_checks(state_checks, is_skip_query, concurrency)
+                if failed_checks:
+                    console.print("[[yellow]Warning[/yellow]] Checks failed. Please see the failed reason.")
+                    process_failed_checks(failed_checks, error_log)
+
+        from recce.event import log_load_state
+
+        log_load_state(command="run")
+
+        # Export the state
+        console.rule("Export state")
+        ctx.state_loader.state_file = output_state_file
+        msg = ctx.state_loader.export(ctx.export_state())
+        if msg is not None:
+            console.print(msg)
         else:
-            console.rule("Checks")
-            _, failed_checks = await execute_state_checks(state_checks, is_skip_query)
-            if failed_checks:
-                console.print("[[yellow]Warning[/yellow]] Checks failed. Please see the failed reason.")
-                process_failed_checks(failed_checks, error_log)
-
-    from recce.event import log_load_state
-
-    log_load_state(command="run")
-
-    # Export the state
-    console.rule("Export state")
-    ctx.state_loader.state_file = output_state_file
-    msg = ctx.state_loader.export(ctx.export_state())
-    if msg is not None:
-        console.print(msg)
-    else:
-        console.print("Export successful")
-
-    summary_path = kwargs.get("summary")
-    if summary_path:
-        dirs = os.path.dirname(summary_path)
-        if dirs:
-            os.makedirs(dirs, exist_ok=True)
-        with open(summary_path, "w", encoding="utf-8") as f:
-            f.write(generate_markdown_summary(ctx))
-        console.print(f"The summary is stored at '{summary_path}'")
-
-    return rc
+            console.print("Export successful")
+
+        summary_path = kwargs.get("summary")
+        if summary_path:
+            dirs = os.path.dirname(summary_path)
+            if dirs:
+                os.makedirs(dirs, exist_ok=True)
+            with open(summary_path, "w", encoding="utf-8") as f:
+                f.write(generate_markdown_summary(ctx))
+            console.print(f"The summary is stored at '{summary_path}'")
+
+        return rc
+    finally:
+        # Stop the worker processes of the adapter, so they do not outlive the command
+        ctx.close()
@@ -34,6 +34,7 @@ from . import __latest_version__, __version__, event, is_recce_cloud_instance
 from .apis.check_api import check_router
 from .apis.check_events_api import check_events_router
 from .apis.run_api import run_router
+from .apis.run_func import add_run_listener, remove_run_listener
 from .config import RecceConfig
 from .connect_to_cloud import (
     connect_to_cloud_background_task,
@@ -46,7 +47,7 @@ from .core import RecceContext, default_context, load_context
 from .event import get_recce_api_token, log_api_event, log_single_env_event
 from .exceptions import RecceException
 from .github import is_github_codespace
-from .models.types import CllData
+from .models.types import CllData, Run
 from .run import load_preset_checks
 from .state import RecceShareStateManager, RecceStateLoader
 
@@ -241,8 +242,12 @@ async def lifespan(fastapi: FastAPI):
         logger.debug(f"[Idle Timeout] Scheduling idle timeout check with {app_state.idle_timeout} seconds")
         schedule_idle_timeout_check(app_state)
 
+    add_run_listener(broadcast_run_event)
+
     yield
 
+    remove_run_listener(broadcast_run_event)
+
     if app_state.command == "server":
         teardown_server(app_state, ctx)
     elif app_state.command == "read_only":
@@ -250,6 +255,9 @@ async def lifespan(fastapi: FastAPI):
     elif app_state.command == "preview":
         teardown_preview(app_state, ctx)
 
+    if ctx is not None:
+        ctx.close()
+
 
 app = FastAPI(lifespan=lifespan)
 
@@ -807,12 +815,39 @@ async def websocket_endpoint(websocket: WebSocket):
             if data == "ping":
                 await websocket.send_text("pong")
     except WebSocketDisconnect:
-        clients.remove(websocket)
+        clients.discard(websocket)
 
 
 async def broadcast(data: str):
-    for client in clients:
-        await client.send_text(data)
+    for client in list(clients):
+        try:
+            await client.send_text(data)
+        except Exception:
+            # The client is gone, e.g. the connection was closed while the message was sent
+            clients.discard(client)
+
+
+def _json_default(value: Any):
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return str(value)
+
+
+async def broadcast_run_event(event: str, run: Run):
+    """
+    Push the progress or the completion of a run to the web clients, so they do not have to poll the run.
+    """
+    broadcast_command = {
+        "command": f"run_{event}",
+        "event": {
+            "runId": str(run.run_id),
+            "status": run.status.value if run.status else None,
+            "progress": run.progress.model_dump(mode="json") if run.progress else None,
+            "queuePosition": run.queue_position,
+            "error": run.error,
+        },
+    }
+    await broadcast(json.dumps(broadcast_command, default=_json_default))
 
 
 @app.post("/api/connect")
@@ -6,7 +6,8 @@ from enum import Enum
 if t.TYPE_CHECKING:
     import agate
     import pandas
-from pydantic import BaseModel, Field
+    import pyarrow
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class DataFrameColumnType(Enum):
@@ -36,6 +37,60 @@ class DataFrameColumnType(Enum):
             return cls.UNKNOWN
 
 
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is not installed. Please install it using `pip install pyarrow`")
+    return pyarrow
+
+
+# The number of units of a timestamp or duration in a millisecond
+_ARROW_UNITS_PER_MILLISECOND = {"ms": 1, "us": 1000, "ns": 1000000}
+
+
+def _pandas_column_to_arrow(series: "pandas.Series"):
+    """Convert a pandas column to an Arrow array holding the values of `to_json(orient="values")`.
+
+    NaN and infinite floats are null, and dates, timestamps and durations are milliseconds, as in the JSON. Floats
+    keep their full precision, where the JSON rounds them to 10 decimals, like the values of the agate tables. Returns
+    None if pyarrow is not installed or the column has other values, e.g. decimals, which the JSON turns into text.
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute as pc
+        import pyarrow.types as pat
+    except ImportError:
+        return None
+
+    try:
+        array = pyarrow.array(series, from_pandas=True)
+    except pyarrow.ArrowException:
+        # e.g. an object column of mixed types
+        return None
+
+    arrow_type = array.type
+    if pat.is_integer(arrow_type) or pat.is_boolean(arrow_type) or pat.is_null(arrow_type):
+        return array
+    elif pat.is_string(arrow_type) or pat.is_large_string(arrow_type):
+        return array
+    elif pat.is_float64(arrow_type):
+        return pc.if_else(pc.is_finite(array), array, None)
+    elif pat.is_date(arrow_type):
+        return array.cast(pyarrow.date64()).cast(pyarrow.int64())
+    elif pat.is_timestamp(arrow_type) or pat.is_duration(arrow_type):
+        values = array.cast(pyarrow.int64())
+        if arrow_type.unit == "s":
+            return pc.multiply(values, 1000)
+        # Round down, as pandas does
+        units = _ARROW_UNITS_PER_MILLISECOND[arrow_type.unit]
+        milliseconds = pc.divide(values, units)
+        remainders = pc.subtract(values, pc.multiply(milliseconds, units))
+        return pc.subtract(milliseconds, pc.less(remainders, 0).cast(pyarrow.int64()))
+    else:
+        return None
+
+
 class DataFrameColumn(BaseModel):
     key: t.Optional[str] = None
     name: str
@@ -53,6 +108,11 @@ class DataFrame(BaseModel):
     data: t.List[tuple]
     limit: t.Optional[int] = Field(None, description="Limit the number of rows returned")
     more: t.Optional[bool] = Field(None, description="Whether there are more rows to fetch")
+    next_page_token: t.Optional[str] = Field(None, description="Token to fetch the next page of rows")
+
+    # The Arrow table of the data, and the rows and column keys it was built for. See `to_arrow`
+    _arrow_table: t.Any = PrivateAttr(None)
+    _arrow_source: t.Any = PrivateAttr(None)
 
     @staticmethod
     def from_agate(table: "agate.Table", limit: t.Optional[int] = None, more: t.Optional[bool] = None):
@@ -119,8 +179,15 @@ class DataFrame(BaseModel):
                 col_type = DataFrameColumnType.UNKNOWN
             columns.append(DataFrameColumn(name=column, type=col_type))
 
-        s = pandas_df.to_json(orient="values")
-        data = json.loads(s)
+        # The columns go through Arrow where they can, rather than through a JSON document of the whole frame
+        arrays = []
+        values = []
+        for i in range(len(pandas_df.columns)):
+            series = pandas_df.iloc[:, i]
+            array = _pandas_column_to_arrow(series)
+            arrays.append(array)
+            values.append(array.to_pylist() if array is not None else json.loads(series.to_json(orient="values")))
+        data = list(zip(*values))
 
         df = DataFrame(
             columns=columns,
@@ -128,6 +195,10 @@ class DataFrame(BaseModel):
             limit=limit,
             more=more,
         )
+        if arrays and all(array is not None for array in arrays):
+            import pyarrow
+
+            df._set_arrow_table(pyarrow.Table.from_arrays(arrays, names=[column.key for column in columns]))
         return df
 
     @staticmethod
@@ -168,3 +239,70 @@ class DataFrame(BaseModel):
             more=more,
         )
         return df
+
+    def to_columnar(self) -> dict:
+        """Serialize the DataFrame column by column, with one list of values per column.
+
+        This is more compact than the row-oriented form for wide or long results, since the values of a column are
+        stored together and each row is not wrapped in its own list.
+        """
+        return {
+            "columns": [dict(key=column.key, name=column.name, type=column.type.value) for column in self.columns],
+            "data": [list(values) for values in zip(*self.data)] if self.data else [[] for _ in self.columns],
+            "limit": self.limit,
+            "more": self.more,
+            "next_page_token": self.next_page_token,
+        }
+
+    def _set_arrow_table(self, table: "pyarrow.Table"):
+        self._arrow_table = table
+        self._arrow_source = (self.data, len(self.data), tuple(column.key for column in self.columns))
+
+    def _get_arrow_table(self) -> t.Optional["pyarrow.Table"]:
+        # The table is stale if the rows or the columns were replaced or changed since it was built
+        if self._arrow_table is None or self._arrow_source is None:
+            return None
+        data, num_rows, keys = self._arrow_source
+        if data is not self.data or num_rows != len(self.data) or keys != tuple(c.key for c in self.columns):
+            return None
+        return self._arrow_table
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Convert the DataFrame to an Arrow table. The limit, more and next_page_token fields are kept in the schema
+        metadata.
+
+        The table is built once, or taken from `from_pandas`, and reused by later calls.
+        """
+        pyarrow = _import_pyarrow()
+
+        metadata = {
+            key: json.dumps(value)
+            for key, value in dict(limit=self.limit, more=self.more, next_page_token=self.next_page_token).items()
+            if value is not None
+        }
+        table = self._get_arrow_table()
+        if table is not None:
+            return table.replace_schema_metadata(metadata)
+
+        arrays = []
+        for values in self.to_columnar()["data"]:
+            try:
+                arrays.append(pyarrow.array(values))
+            except pyarrow.ArrowException:
+                # Values of mixed types are sent as text
+                arrays.append(pyarrow.array([None if value is None else str(value) for value in values]))
+
+        table = pyarrow.Table.from_arrays(arrays, names=[column.key for column in self.columns])
+        self._set_arrow_table(table)
+        return table.replace_schema_metadata(metadata)
+
+    def to_arrow_ipc(self) -> bytes:
+        """Serialize the DataFrame in the Arrow IPC streaming format."""
+        pyarrow = _import_pyarrow()
+        import pyarrow.ipc
+
+        table = self.to_arrow()
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
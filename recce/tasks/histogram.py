@@ -1,16 +1,26 @@
+import logging
 import math
 import re
 from datetime import date, datetime
+from functools import partial
 from typing import Optional
 
 from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel
 
 from recce.core import default_context
+from recce.exceptions import RecceCancelException
 from recce.models import Check
 from recce.tasks import Task
 from recce.tasks.core import CheckValidator, TaskResultDiffer
 from recce.tasks.query import QueryMixin
+from recce.tasks.sampling import (
+    APPROX_SAMPLE_MIN_ROWS,
+    APPROX_SAMPLE_PERCENT,
+    get_materialized,
+    sample_method,
+    tablesample_clause,
+)
 
 sql_datetime_types = [
     "DATE",
@@ -76,6 +86,8 @@ sql_not_supported_types = [
     "BOOL",  # Snowflake and PostgreSQL also support BOOL as an alias for BOOLEAN
 ]
 
+logger = logging.getLogger("uvicorn")
+
 sql_not_supported_types_pattern = [
     r"^(CHAR|VARCHAR|NCHAR|NVARCHAR|VARCHAR2|NVARCHAR2)\(\d+\)$",  # String types with lengths
 ]
@@ -91,7 +103,7 @@ def _is_histogram_supported(column_type):
     return True
 
 
-def generate_histogram_sql_integer(node, column, min_value, max_value, num_bins=50):
+def generate_histogram_sql_integer(node, column, min_value, max_value, num_bins=50, sample_clause=""):
     bin_size = math.ceil((max_value - min_value) / num_bins) or 1
 
     sql = f"""
@@ -111,7 +123,7 @@ def generate_histogram_sql_integer(node, column, min_value, max_value, num_bins=
         SELECT
             {column} as column_value,
             FLOOR(({column} - (SELECT min_value FROM bin_parameters)) / (SELECT bin_size FROM bin_parameters)) AS bin
-        FROM {{{{ ref("{node}") }}}},
+        FROM {{{{ ref("{node}") }}}} {sample_clause},
         bin_parameters
     ),
     bin_edges AS (
@@ -128,7 +140,7 @@ def generate_histogram_sql_integer(node, column, min_value, max_value, num_bins=
     return sql, bin_size
 
 
-def generate_histogram_sql_numeric(node, column, min_value, max_value, num_bins=50):
+def generate_histogram_sql_numeric(node, column, min_value, max_value, num_bins=50, sample_clause=""):
     bin_size = (max_value - min_value) / num_bins
     sql = f"""
         WITH value_ranges AS (
@@ -147,7 +159,7 @@ def generate_histogram_sql_numeric(node, column, min_value, max_value, num_bins=
             SELECT
                 {column} as column_value,
                 FLOOR(({column} - (SELECT min_value FROM bin_parameters)) / (SELECT bin_size FROM bin_parameters)) AS bin
-            FROM {{{{ ref("{node}") }}}},
+            FROM {{{{ ref("{node}") }}}} {sample_clause},
             bin_parameters
         ),
         bin_edges AS (
@@ -169,79 +181,174 @@ class HistogramDiffParams(BaseModel):
     column_name: str
     column_type: str
     num_bins: Optional[int] = 50
+    # Count the bins of large relations on a table sample and scale the counts up
+    approximate: Optional[bool] = False
+
+
+# Counts the values of the column in both environments in one statement. If the bounds are not given, they are computed
+# over the values of both environments in the same statement. The bin size follows `_numeric_bins`.
+HISTOGRAM_NUMERIC_JINJA_TEMPLATE = r"""
+with all_values as (
+    select 'base' as env, {{ column }} as column_value from {{ base_relation }} {{ sample_clause }}
+    union all
+    select 'current' as env, {{ column }} as column_value from {{ curr_relation }} {{ sample_clause }}
+),
+
+bounds as (
+    {%- if min_value is none %}
+    select min(column_value) as min_value, max(column_value) as max_value from all_values
+    {%- else %}
+    select {{ min_value }} as min_value, {{ max_value }} as max_value
+    {%- endif %}
+),
+
+bin_parameters as (
+    select
+        min_value,
+        max_value,
+        {%- if is_integer %}
+        case
+            when max_value - min_value < {{ num_bins }} then 1
+            else ceil((max_value - min_value) * 1.0 / {{ num_bins }})
+        end as bin_size
+        {%- else %}
+        (max_value - min_value) * 1.0 / {{ num_bins }} as bin_size
+        {%- endif %}
+    from bounds
+),
+
+binned_values as (
+    select
+        env,
+        case
+            when bin_size = 0 then 0
+            else floor((column_value - min_value) / bin_size)
+        end as bin
+    from all_values, bin_parameters
+    where column_value is not null
+),
+
+bin_counts as (
+    select env, bin, count(*) as count
+    from binned_values
+    group by env, bin
+)
+
+select bin_counts.env, bin_counts.bin, bin_counts.count, bounds.min_value, bounds.max_value
+from bin_counts, bounds
+"""
+
+# The bounds and the number of values of the column in both environments
+HISTOGRAM_BOUNDS_JINJA_TEMPLATE = r"""
+select 'base' as env, min({{ column }}) as min_value, max({{ column }}) as max_value, count({{ column }}) as total
+from {{ base_relation }}
+union all
+select 'current' as env, min({{ column }}) as min_value, max({{ column }}) as max_value, count({{ column }}) as total
+from {{ curr_relation }}
+"""
+
+# Counts the values of the column in both environments per date part in one statement
+HISTOGRAM_DATETIME_JINJA_TEMPLATE = r"""
+with binned_values as (
+    select 'base' as env, {{ dbt.date_trunc(datepart, column) }} as bin
+    from {{ base_relation }} {{ sample_clause }}
+    where {{ column }} is not null
+    union all
+    select 'current' as env, {{ dbt.date_trunc(datepart, column) }} as bin
+    from {{ curr_relation }} {{ sample_clause }}
+    where {{ column }} is not null
+)
+
+select env, bin, count(*) as count
+from binned_values
+group by env, bin
+"""
+
+
+def _execute_histogram_sql(task, sql):
+    """
+    Run the histogram query on the base and current environments concurrently. If either query fails, the error is
+    raised rather than yielding empty bins.
+    """
+    return task.execute_base_and_current(
+        partial(task.execute_sql, sql, base=True), partial(task.execute_sql, sql, base=False)
+    )
+
+
+def _scale_count(count, sample_percent=None):
+    if not sample_percent:
+        return count
+    return int(round(float(count) * 100 / sample_percent))
 
 
-def query_numeric_histogram(task, node, column, column_type, min_value, max_value, num_bins=50):
+def _numeric_bins(column_type, min_value, max_value, num_bins=50):
+    """
+    Return the number of bins, the bin size, the bin edges and the labels of a numeric histogram.
+    """
     if column_type.upper() in sql_integer_types:
         if max_value - min_value < num_bins:
             num_bins = int(max_value - min_value + 1)
-        histogram_sql, bin_size = generate_histogram_sql_integer(node, column, min_value, max_value, num_bins)
+        bin_size = math.ceil((max_value - min_value) / num_bins) or 1
     else:
-        histogram_sql, bin_size = generate_histogram_sql_numeric(node, column, min_value, max_value, num_bins)
-
-    base = None
-    try:
-        base = task.execute_sql(histogram_sql, base=True)
-    except Exception as e:
-        print(e)
-    finally:
-        task.check_cancel()
-
-    curr = None
-    try:
-        curr = task.execute_sql(histogram_sql, base=False)
-    except Exception as e:
-        print(e)
-    finally:
-        task.check_cancel()
+        bin_size = (max_value - min_value) / num_bins
 
     bin_edges = [None] * (num_bins + 1)
     labels = [""] * (num_bins + 1)
-
-    base_result = {}
-    curr_result = {}
     for i in range(num_bins + 1):
         val = int(min_value) + i * bin_size
         bin_edges[i] = val
         labels[i] = f"{val}-{val + bin_size}"
 
-    if base is not None:
-        counts = [0] * num_bins
-        for row in base.rows:
-            bin = row[0]
-            count = row[1]
-            if bin is not None:
-                i = int(bin)
-                if i < num_bins:
-                    counts[i] = count
-                else:
-                    counts[num_bins - 1] += count
-        base_result = {
-            "counts": counts,
-        }
-    if curr is not None:
-        counts = [0] * num_bins
-        for row in curr.rows:
-            bin = row[0]
-            count = row[1]
-            if bin is not None:
-                i = int(bin)
-                if i < num_bins:
-                    counts[i] = count
-                else:
-                    counts[num_bins - 1] += count
-        curr_result = {
-            "counts": counts,
-        }
+    return num_bins, bin_size, bin_edges, labels
+
+
+def _numeric_counts(rows, num_bins, sample_percent=None):
+    """
+    Return the counts of a numeric histogram from the (bin, count) rows. Values past the last bin fall into it.
+    """
+    counts = [0] * num_bins
+    for bin, count in rows:
+        if bin is not None:
+            i = int(bin)
+            if i < num_bins:
+                counts[i] = _scale_count(count, sample_percent)
+            else:
+                counts[num_bins - 1] += _scale_count(count, sample_percent)
+    return {
+        "counts": counts,
+    }
+
+
+def query_numeric_histogram(
+    task, node, column, column_type, min_value, max_value, num_bins=50, sample_clause="", sample_percent=None
+):
+    if column_type.upper() in sql_integer_types:
+        if max_value - min_value < num_bins:
+            num_bins = int(max_value - min_value + 1)
+        histogram_sql, bin_size = generate_histogram_sql_integer(
+            node, column, min_value, max_value, num_bins, sample_clause=sample_clause
+        )
+    else:
+        histogram_sql, bin_size = generate_histogram_sql_numeric(
+            node, column, min_value, max_value, num_bins, sample_clause=sample_clause
+        )
+
+    base, curr = _execute_histogram_sql(task, histogram_sql)
+
+    num_bins, _, bin_edges, labels = _numeric_bins(column_type, min_value, max_value, num_bins)
+
+    base_result = _numeric_counts(base.rows, num_bins, sample_percent)
+    curr_result = _numeric_counts(curr.rows, num_bins, sample_percent)
     return base_result, curr_result, bin_edges, labels
 
 
-def query_datetime_histogram(task, node, column, min_value, max_value):
+def _datetime_bins(min_value, max_value):
+    """
+    Return the date part, the bin edges and the number of bins of a datetime histogram.
+    """
     days_delta = (max_value - min_value).days
-    print(max_value, min_value, days_delta)
-    # _type = None
     if days_delta > 365 * 4:
-        _type = "yearly"
+        datepart = "year"
         dmin = date(min_value.year, 1, 1)
         if max_value.year < 3000:
             dmax = date(max_value.year, 1, 1) + relativedelta(years=+1)
@@ -251,17 +358,8 @@ def query_datetime_histogram(task, node, column, min_value, max_value):
         interval = relativedelta(years=+interval_years)
         num_buckets = math.ceil((dmax.year - dmin.year) / interval.years)
         bin_edges = [dmin + relativedelta(year=i) for i in range(num_buckets + 1)]
-        sql = f"""
-        SELECT
-            {{{{ date_trunc("year", "{column}") }}}} as year,
-            COUNT(*) AS counts
-        FROM {{{{ ref("{node}") }}}}
-        WHERE {column} IS NOT NULL
-        GROUP BY year
-        ORDER BY year
-        """
     elif days_delta > 60:
-        _type = "monthly"
+        datepart = "month"
         interval = relativedelta(months=+1)
         dmin = date(min_value.year, min_value.month, 1)
         if max_value.year < 3000:
@@ -271,17 +369,8 @@ def query_datetime_histogram(task, node, column, min_value, max_value):
         period = relativedelta(dmax, dmin)
         num_buckets = period.years * 12 + period.months
         bin_edges = [dmin + relativedelta(months=i) for i in range(num_buckets + 1)]
-        sql = f"""
-        SELECT
-            {{{{ date_trunc("month", "{column}") }}}} as month,
-            COUNT(*) AS counts
-        FROM {{{{ ref("{node}") }}}}
-        WHERE {column} IS NOT NULL
-        GROUP BY month
-        ORDER BY month
-        """
     else:
-        _type = "daily"
+        datepart = "day"
         interval = relativedelta(days=+1)
         dmin = date(min_value.year, min_value.month, min_value.day)
         if max_value.year < 3000:
@@ -290,133 +379,284 @@ def query_datetime_histogram(task, node, column, min_value, max_value):
             dmax = date(3000, 1, 1)
         num_buckets = (dmax - dmin).days
         bin_edges = [dmin + relativedelta(day=i) for i in range(num_buckets + 1)]
-        sql = f"""
-        SELECT
-            {{{{ date_trunc("day", "{column}") }}}} as day,
-            COUNT(*) AS counts
-        FROM {{{{ ref("{node}") }}}}
-        WHERE {column} IS NOT NULL
-        GROUP BY day
-        ORDER BY day
-        """
 
-    base = None
-    curr = None
-    try:
-        base = task.execute_sql(sql, base=True)
-    except Exception as e:
-        print(e)
-    finally:
-        task.check_cancel()
-    try:
-        curr = task.execute_sql(sql, base=False)
-    except Exception as e:
-        print(e)
-    finally:
-        task.check_cancel()
-
-    base_counts = [0] * num_buckets
-    print(_type)
-    for d, v in base.rows:
-        i = bin_edges.index(d.date()) if isinstance(d, datetime) else bin_edges.index(d)
-        base_counts[i] = v
-    curr_counts = [0] * num_buckets
-    for d, v in curr.rows:
+    return datepart, bin_edges, num_buckets
+
+
+def _datetime_counts(rows, bin_edges, num_buckets, sample_percent=None):
+    """
+    Return the counts of a datetime histogram from the (truncated date, count) rows.
+    """
+    counts = [0] * num_buckets
+    for d, v in rows:
         i = bin_edges.index(d.date()) if isinstance(d, datetime) else bin_edges.index(d)
-        curr_counts[i] = v
-    base_result = {
-        "counts": base_counts,
-    }
-    curr_result = {
-        "counts": curr_counts,
+        counts[i] = _scale_count(v, sample_percent)
+    return {
+        "counts": counts,
     }
 
+
+def query_datetime_histogram(task, node, column, min_value, max_value, sample_clause="", sample_percent=None):
+    datepart, bin_edges, num_buckets = _datetime_bins(min_value, max_value)
+    sql = f"""
+    SELECT
+        {{{{ date_trunc("{datepart}", "{column}") }}}} as {datepart},
+        COUNT(*) AS counts
+    FROM {{{{ ref("{node}") }}}} {sample_clause}
+    WHERE {column} IS NOT NULL
+    GROUP BY {datepart}
+    ORDER BY {datepart}
+    """
+
+    base, curr = _execute_histogram_sql(task, sql)
+
+    base_result = _datetime_counts(base.rows, bin_edges, num_buckets, sample_percent)
+    curr_result = _datetime_counts(curr.rows, bin_edges, num_buckets, sample_percent)
+
     return base_result, curr_result, bin_edges
 
 
+def _get_min_max(fn, base, curr):
+    if base is None and curr is None:
+        return None
+    if base is None:
+        return curr
+    if curr is None:
+        return base
+    return fn(base, curr)
+
+
 class HistogramDiffTask(Task, QueryMixin):
     def __init__(self, params):
         super().__init__()
         self.params = HistogramDiffParams(**params)
         self.connection = None
 
-    def execute(self):
-        from recce.adapter.dbt_adapter import DbtAdapter
+    def _sample(self, dbt_adapter, base_total, curr_total):
+        """
+        Return the table sample clause and percentage used to count the bins, or ("", None) to count all rows.
+        """
+        if self.params.approximate and min(base_total or 0, curr_total or 0) >= APPROX_SAMPLE_MIN_ROWS:
+            # The clause applies to both relations, so both must be sampleable
+            model = self.params.model
+            db_type = dbt_adapter.adapter.type()
+            clauses = [
+                tablesample_clause(db_type, materialized=get_materialized(dbt_adapter, model, base=base))
+                for base in (True, False)
+            ]
+            if None not in clauses:
+                return clauses[0], APPROX_SAMPLE_PERCENT
+        return "", None
+
+    def _execute_single_query(self, dbt_adapter, base_relation, curr_relation):
+        """
+        Compute the histogram of both environments with statements that union the base and current relations.
+
+        A numeric histogram is computed by a single statement that finds the bounds and counts the bins. A datetime
+        histogram, whose bins depend on the bounds, or an approximate one, whose sampling depends on the row counts,
+        first queries the bounds of both environments in one statement and then counts the bins in another.
+        """
+        column = self.params.column_name
+        column_type = self.params.column_type
+        num_bins = self.params.num_bins or 50
+        is_datetime = column_type.upper() in sql_datetime_types
+        context = dict(
+            base_relation=base_relation,
+            curr_relation=curr_relation,
+            column=column,
+            sample_clause="",
+            min_value=None,
+            max_value=None,
+        )
 
-        result = {}
+        base_total = curr_total = None
+        min_value = max_value = None
+        sample_clause, sample_percent = "", None
+        if is_datetime or self.params.approximate:
+            sql = dbt_adapter.generate_sql(HISTOGRAM_BOUNDS_JINJA_TEMPLATE, context=context)
+            _, table = dbt_adapter.execute(sql, fetch=True)
+            self.check_cancel()
+            bounds = {row[0]: row[1:] for row in table.rows}
+            min_value = _get_min_max(min, bounds["base"][0], bounds["current"][0])
+            max_value = _get_min_max(max, bounds["base"][1], bounds["current"][1])
+            base_total = bounds["base"][2]
+            curr_total = bounds["current"][2]
+            sample_clause, sample_percent = self._sample(dbt_adapter, base_total, curr_total)
+            context.update(sample_clause=sample_clause, min_value=min_value, max_value=max_value)
 
-        dbt_adapter: DbtAdapter = default_context().adapter
+            if min_value is None or max_value is None:
+                return self._result({"counts": []}, {"counts": []}, base_total, curr_total, None, None, [], [], None)
+
+        if is_datetime:
+            datepart, bin_edges, num_buckets = _datetime_bins(min_value, max_value)
+            sql = dbt_adapter.generate_sql(HISTOGRAM_DATETIME_JINJA_TEMPLATE, context=dict(context, datepart=datepart))
+            _, table = dbt_adapter.execute(sql, fetch=True)
+            self.check_cancel()
+            base_result = _datetime_counts(
+                [row[1:] for row in table.rows if row[0] == "base"], bin_edges, num_buckets, sample_percent
+            )
+            current_result = _datetime_counts(
+                [row[1:] for row in table.rows if row[0] == "current"], bin_edges, num_buckets, sample_percent
+            )
+            return self._result(
+                base_result,
+                current_result,
+                base_total,
+                curr_total,
+                min_value,
+                max_value,
+                bin_edges,
+                None,
+                sample_percent,
+            )
+
+        is_integer = column_type.upper() in sql_integer_types
+        sql = dbt_adapter.generate_sql(
+            HISTOGRAM_NUMERIC_JINJA_TEMPLATE, context=dict(context, is_integer=is_integer, num_bins=num_bins)
+        )
+        _, table = dbt_adapter.execute(sql, fetch=True)
+        self.check_cancel()
+
+        base_rows = [(row[1], row[2]) for row in table.rows if row[0] == "base"]
+        curr_rows = [(row[1], row[2]) for row in table.rows if row[0] == "current"]
+        if min_value is None:
+            # The bounds and totals come with the bin counts
+            if len(table.rows) > 0:
+                min_value, max_value = table.rows[0][3], table.rows[0][4]
+            base_total = sum(count for _, count in base_rows)
+            curr_total = sum(count for _, count in curr_rows)
+            if min_value is None or max_value is None:
+                return self._result({"counts": []}, {"counts": []}, base_total, curr_total, None, None, [], [], None)
+
+        num_bins, _, bin_edges, labels = _numeric_bins(column_type, min_value, max_value, num_bins)
+        return self._result(
+            _numeric_counts(base_rows, num_bins, sample_percent),
+            _numeric_counts(curr_rows, num_bins, sample_percent),
+            base_total,
+            curr_total,
+            min_value,
+            max_value,
+            bin_edges,
+            labels,
+            sample_percent,
+        )
+
+    def _execute_per_environment(self, dbt_adapter):
+        """
+        Compute the histogram with separate statements for the base and current environments. Used when the relation
+        is missing in one environment or the union of both fails, e.g. when the column only exists in one of them.
+        """
         node = self.params.model
         column = self.params.column_name
         num_bins = self.params.num_bins or 50
         column_type = self.params.column_type
 
+        min_max_sql = f"""
+            SELECT
+                MIN({column}) as min,
+                MAX({column}) as max,
+                COUNT({column}) as total
+            FROM {{{{ ref("{node}") }}}}
+            """
+        # Get the mix/max values from both the base and current environments
+
+        min_max_base, min_max_curr = self.execute_base_and_current(
+            partial(self.execute_sql, min_max_sql, base=True),
+            partial(self.execute_sql, min_max_sql, base=False),
+        )
+
+        min_value = _get_min_max(min, min_max_base[0][0], min_max_curr[0][0])
+        max_value = _get_min_max(max, min_max_base[0][1], min_max_curr[0][1])
+        base_total = min_max_base[0][2]
+        curr_total = min_max_curr[0][2]
+
+        sample_clause, sample_percent = self._sample(dbt_adapter, base_total, curr_total)
+
+        # Get histogram data from both the base and current environments
+        labels = None
+        if min_value is None or max_value is None:
+            base_result = {
+                "counts": [],
+            }
+            current_result = {
+                "counts": [],
+            }
+            bin_edges = []
+            labels = []
+        elif column_type.upper() in sql_datetime_types:
+            base_result, current_result, bin_edges = query_datetime_histogram(
+                self,
+                node,
+                column,
+                min_value,
+                max_value,
+                sample_clause=sample_clause,
+                sample_percent=sample_percent,
+            )
+        else:
+            base_result, current_result, bin_edges, labels = query_numeric_histogram(
+                self,
+                node,
+                column,
+                column_type,
+                min_value,
+                max_value,
+                num_bins,
+                sample_clause=sample_clause,
+                sample_percent=sample_percent,
+            )
+        return self._result(
+            base_result, current_result, base_total, curr_total, min_value, max_value, bin_edges, labels, sample_percent
+        )
+
+    @staticmethod
+    def _result(base_result, current_result, base_total, curr_total, min_value, max_value, bin_edges, labels, percent):
+        if base_result:
+            base_result["total"] = base_total
+        if current_result:
+            current_result["total"] = curr_total
+        result = {
+            "base": base_result,
+            "current": current_result,
+            "min": min_value,
+            "max": max_value,
+            "bin_edges": bin_edges,
+            "labels": labels,
+        }
+        result.update(sample_method(percent))
+        return result
+
+    def execute(self):
+        from recce.adapter.dbt_adapter import DbtAdapter
+
+        dbt_adapter: DbtAdapter = default_context().adapter
+        node = self.params.model
+        column_type = self.params.column_type
+
         if _is_histogram_supported(column_type) is False:
             raise ValueError(f"Column type {column_type} is not supported for histogram analysis")
 
         with dbt_adapter.connection_named("query"):
             self.connection = dbt_adapter.get_thread_connection()
-            min_max_sql = f"""
-                SELECT
-                    MIN({column}) as min,
-                    MAX({column}) as max,
-                    COUNT({column}) as total
-                FROM {{{{ ref("{node}") }}}}
-                """
-            # Get the mix/max values from both the base and current environments
-
-            min_max_base = self.execute_sql(min_max_sql, base=True)
-            min_max_curr = self.execute_sql(min_max_sql, base=False)
-
-            def get_min_max(fn, base, curr):
-                if base is None and curr is None:
-                    return None
-                if base is None:
-                    return curr
-                if curr is None:
-                    return base
-                return fn(base, curr)
-
-            min_value = get_min_max(min, min_max_base[0][0], min_max_curr[0][0])
-            max_value = get_min_max(max, min_max_base[0][1], min_max_curr[0][1])
-            base_total = min_max_base[0][2]
-            curr_total = min_max_curr[0][2]
-
-            # Get histogram data from both the base and current environments
-            labels = None
-            if min_value is None or max_value is None:
-                base_result = {
-                    "counts": [],
-                }
-                current_result = {
-                    "counts": [],
-                }
-                bin_edges = []
-                labels = []
-            elif column_type.upper() in sql_datetime_types:
-                base_result, current_result, bin_edges = query_datetime_histogram(
-                    self, node, column, min_value, max_value
-                )
-            else:
-                base_result, current_result, bin_edges, labels = query_numeric_histogram(
-                    self, node, column, column_type, min_value, max_value, num_bins
-                )
-            if base_result:
-                base_result["total"] = base_total
-            if current_result:
-                current_result["total"] = curr_total
-            result["base"] = base_result
-            result["current"] = current_result
-            result["min"] = min_value
-            result["max"] = max_value
-            result["bin_edges"] = bin_edges
-            result["labels"] = labels
-        return result
+            base_relation = dbt_adapter.create_relation(node, base=True)
+            curr_relation = dbt_adapter.create_relation(node, base=False)
+            if base_relation is not None and curr_relation is not None:
+                try:
+                    return self._execute_single_query(dbt_adapter, base_relation, curr_relation)
+                except RecceCancelException:
+                    raise
+                except Exception as e:
+                    self.check_cancel()
+                    logger.warning(
+                        f"Failed to compute the histogram of both environments in one statement, "
+                        f"falling back to one query per environment: {e}"
+                    )
+
+            return self._execute_per_environment(dbt_adapter)
 
     def cancel(self):
         super().cancel()
-        if self.connection:
-            self.close_connection(self.connection)
+        self.close_connections()
 
 
 class HistogramDiffTaskResultDiffer(TaskResultDiffer):
@@ -1,4 +1,7 @@
-from typing import List
+import threading
+import typing
+from functools import partial
+from typing import Iterator, List, Optional
 
 from pydantic import BaseModel
 
@@ -7,152 +10,236 @@ from ..exceptions import RecceException
 from ..models import Check
 from .core import CheckValidator, Task, TaskResultDiffer
 from .dataframe import DataFrame
+from .query import QueryMixin
 
-PROFILE_COLUMN_JINJA_TEMPLATE = r"""
-{# Conditions -------------------------------------------- #}
-{%- set is_struct = column_type.startswith('struct') -%}
-{%- set is_numeric =
-    column_type.startswith('int') or
-    column_type.startswith('float') or
-    'numeric' in column_type or
-    'number' in column_type or
-    'double' in column_type or
-    'bigint' in column_type
--%}
-{%- set is_date_or_time =
-    column_type.startswith('date') or
-    column_type.startswith('timestamp')
--%}
-{%- set is_logical = column_type.startswith('bool') -%}
-
-{%- if db_type == 'sqlserver' -%}
-    {%- set is_numeric = column_type in [
-        "bigint", "numeric", "smallint", "decimal", "int",
-        "tinyint", "money", "float", "real"
-    ]-%}
-{%- elif db_type == 'athena' -%}
+if typing.TYPE_CHECKING:
+    import agate
+
+# Profile a batch of columns with a single scan. With more than one column, each column gets its own alias prefix so
+# that the result is one wide row, which is unpivoted back to one row per column by the task.
+PROFILE_COLUMNS_JINJA_TEMPLATE = r"""
+select
+{%- for column in columns %}
+    {%- set column_name = column.name -%}
+    {%- set column_type = column.type -%}
+    {%- set alias_prefix = 'c' ~ loop.index0 ~ '__' if columns | length > 1 else '' -%}
+
+    {# Conditions -------------------------------------------- #}
+    {%- set is_struct = column_type.startswith('struct') -%}
     {%- set is_numeric =
-        "int" in column_type or
-        "float" in column_type or
-        "decimal" in column_type or
-        "double" in column_type
+        column_type.startswith('int') or
+        column_type.startswith('float') or
+        'numeric' in column_type or
+        'number' in column_type or
+        'double' in column_type or
+        'bigint' in column_type
+    -%}
+    {%- set is_date_or_time =
+        column_type.startswith('date') or
+        column_type.startswith('timestamp')
     -%}
-{%- endif -%}
-
-{# General Agg ------------------------------------------- #}
-{%- set agg_row_count = 'cast(count(*) as ' ~ dbt.type_bigint() ~ ')' -%}
-{%- set agg_not_null_proportion =
-        'sum(case when ' ~ adapter.quote(column_name) ~ ' is null '
-        ~ 'then 0 '
-        ~ 'else 1 end) / '
-        ~ 'cast(count(*) as ' ~ dbt.type_numeric() ~ ')'
--%}
-{%- set agg_distinct_proportion =
-        'count(distinct ' ~ adapter.quote(column_name) ~') / '
-        ~ 'cast(count(*) as ' ~ dbt.type_numeric() ~ ')'
--%}
-{%- set agg_distinct_count = 'count(distinct ' ~ adapter.quote(column_name) ~ ')' -%}
-{%- set agg_is_unique =      'count(distinct ' ~ adapter.quote(column_name) ~ ') = count(*)' -%}
-{%- set agg_min =            'cast(null as ' ~ dbt.type_string() ~ ')' -%}
-{%- set agg_max =            'cast(null as ' ~ dbt.type_string() ~ ')' -%}
-{%- set agg_avg =            'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
-{%- set agg_median =         'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
-
-
-{%- if is_struct -%}
-    {%- set agg_distinct_proportion = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
-    {%- set agg_distinct_count = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
-    {%- set agg_is_unique = 'null' -%}
-{%- endif -%}
-
-
-{%- if (is_numeric or is_date_or_time) and (not is_struct) -%}
-    {%- set agg_min =
-        'cast(min(' ~ adapter.quote(column_name) ~ ') as ' ~ dbt.type_string() ~ ')'
+    {%- set is_logical = column_type.startswith('bool') -%}
+
+    {%- if db_type == 'sqlserver' -%}
+        {%- set is_numeric = column_type in [
+            "bigint", "numeric", "smallint", "decimal", "int",
+            "tinyint", "money", "float", "real"
+        ]-%}
+    {%- elif db_type == 'athena' -%}
+        {%- set is_numeric =
+            "int" in column_type or
+            "float" in column_type or
+            "decimal" in column_type or
+            "double" in column_type
+        -%}
+    {%- endif -%}
+
+    {# General Agg ------------------------------------------- #}
+    {%- set agg_row_count = 'cast(count(*) as ' ~ dbt.type_bigint() ~ ')' -%}
+    {%- set agg_not_null_proportion =
+            'sum(case when ' ~ adapter.quote(column_name) ~ ' is null '
+            ~ 'then 0 '
+            ~ 'else 1 end) / '
+            ~ 'cast(count(*) as ' ~ dbt.type_numeric() ~ ')'
     -%}
-    {%- set agg_max =
-        'cast(max(' ~ adapter.quote(column_name) ~ ') as ' ~ dbt.type_string() ~ ')'
+    {%- set agg_distinct_proportion =
+            'count(distinct ' ~ adapter.quote(column_name) ~') / '
+            ~ 'cast(count(*) as ' ~ dbt.type_numeric() ~ ')'
     -%}
-{%- endif -%}
+    {%- set agg_distinct_count = 'count(distinct ' ~ adapter.quote(column_name) ~ ')' -%}
+    {%- set agg_is_unique =      'count(distinct ' ~ adapter.quote(column_name) ~ ') = count(*)' -%}
+    {%- set agg_min =            'cast(null as ' ~ dbt.type_string() ~ ')' -%}
+    {%- set agg_max =            'cast(null as ' ~ dbt.type_string() ~ ')' -%}
+    {%- set agg_avg =            'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
+    {%- set agg_median =         'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
+
+
+    {%- if is_struct -%}
+        {%- set agg_distinct_proportion = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
+        {%- set agg_distinct_count = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
+        {%- set agg_is_unique = 'null' -%}
+    {%- endif -%}
 
 
-{%- if is_numeric and not is_struct -%}
-    {%- set agg_avg = 'avg(' ~ adapter.quote(column_name) ~ ')' -%}
+    {%- if (is_numeric or is_date_or_time) and (not is_struct) -%}
+        {%- set agg_min =
+            'cast(min(' ~ adapter.quote(column_name) ~ ') as ' ~ dbt.type_string() ~ ')'
+        -%}
+        {%- set agg_max =
+            'cast(max(' ~ adapter.quote(column_name) ~ ') as ' ~ dbt.type_string() ~ ')'
+        -%}
+    {%- endif -%}
 
-    {%- if db_type == 'bigquery' -%}
-        {%- set agg_median = 'approx_quantiles(' ~ adapter.quote(column_name) ~ ', 100)[offset(50)]' -%}
-    {%- elif db_type == 'postgres' -%}
-        {%- set agg_median = 'percentile_cont(0.5) within group (order by ' ~ adapter.quote(column_name) ~ ')' -%}
-    {%- elif db_type == 'redshift' -%}
-        {%- set agg_median =
-            '(select percentile_cont(0.5) within group (order by '
-            ~ adapter.quote(column_name) ~ ') from ' ~ relation ~ ')' -%}
-    {%- elif db_type == 'athena' -%}
-        {%- set agg_median = 'approx_percentile( ' ~ adapter.quote(column_name) ~ ', 0.5)' -%}
-    {%- elif db_type == 'sqlserver' -%}
-        {%- set agg_median = 'percentile_cont(' ~ adapter.quote(column_name) ~ ', 0.5) over ()' -%}
-    {%- else -%}
-        {%- set agg_median = 'median(' ~ adapter.quote(column_name) ~ ')' -%}
+
+    {%- if is_numeric and not is_struct -%}
+        {%- set agg_avg = 'avg(' ~ adapter.quote(column_name) ~ ')' -%}
+
+        {%- if db_type == 'bigquery' -%}
+            {%- set agg_median = 'approx_quantiles(' ~ adapter.quote(column_name) ~ ', 100)[offset(50)]' -%}
+        {%- elif db_type == 'postgres' -%}
+            {%- set agg_median = 'percentile_cont(0.5) within group (order by ' ~ adapter.quote(column_name) ~ ')' -%}
+        {%- elif db_type == 'redshift' -%}
+            {%- set agg_median =
+                '(select percentile_cont(0.5) within group (order by '
+                ~ adapter.quote(column_name) ~ ') from ' ~ relation ~ ')' -%}
+        {%- elif db_type == 'athena' -%}
+            {%- set agg_median = 'approx_percentile( ' ~ adapter.quote(column_name) ~ ', 0.5)' -%}
+        {%- elif db_type == 'sqlserver' -%}
+            {%- set agg_median = 'percentile_cont(' ~ adapter.quote(column_name) ~ ', 0.5) over ()' -%}
+        {%- else -%}
+            {%- set agg_median = 'median(' ~ adapter.quote(column_name) ~ ')' -%}
+        {%- endif -%}
+    {%- elif is_logical -%}
+        {%- set agg_avg = 'avg(case when ' ~ adapter.quote(column_name) ~ ' then 1 else 0 end)' -%}
     {%- endif -%}
-{%- elif is_logical -%}
-    {%- set agg_avg = 'avg(case when ' ~ adapter.quote(column_name) ~ ' then 1 else 0 end)' -%}
-{%- endif -%}
 
 
-{# Overwrite Agg ----------------------------------------- #}
+    {# Approximate Agg --------------------------------------- #}
+
+    {%- if approximate and db_type in approx_db_types and not is_struct -%}
+        {%- if db_type in ['trino', 'athena'] -%}
+            {%- set agg_approx_distinct = 'approx_distinct(' ~ adapter.quote(column_name) ~ ')' -%}
+        {%- elif db_type == 'redshift' -%}
+            {%- set agg_approx_distinct = 'approximate count(distinct ' ~ adapter.quote(column_name) ~ ')' -%}
+        {%- else -%}
+            {%- set agg_approx_distinct = 'approx_count_distinct(' ~ adapter.quote(column_name) ~ ')' -%}
+        {%- endif -%}
+        {%- set agg_distinct_count = agg_approx_distinct -%}
+        {%- set agg_distinct_proportion =
+                agg_approx_distinct ~ ' / cast(count(*) as ' ~ dbt.type_numeric() ~ ')'
+        -%}
+        {# Uniqueness cannot be told from an approximate distinct count #}
+        {%- set agg_is_unique = 'null' -%}
+
+        {%- if is_numeric -%}
+            {%- if db_type in ['snowflake', 'trino'] -%}
+                {%- set agg_median = 'approx_percentile(' ~ adapter.quote(column_name) ~ ', 0.5)' -%}
+            {%- elif db_type == 'duckdb' -%}
+                {%- set agg_median = 'approx_quantile(' ~ adapter.quote(column_name) ~ ', 0.5)' -%}
+            {%- elif db_type in ['databricks', 'spark'] -%}
+                {%- set agg_median = 'percentile_approx(' ~ adapter.quote(column_name) ~ ', 0.5)' -%}
+            {%- endif -%}
+        {%- endif -%}
+    {%- endif -%}
 
-{# DRC-663: Support bigquery array type }
-{%- set is_array = column_type.startswith('array') -%}
-{%- if db_type == 'bigquery' and is_array -%}
-    {%- set agg_distinct_proportion = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
-    {%- set agg_distinct_count = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
-    {%- set agg_is_unique = 'null' -%}
-    {%- set agg_min =
-        'cast(min(array_length(' ~ adapter.quote(column_name) ~ ')) as ' ~ dbt.type_string() ~ ')'
-    -%}
-    {%- set agg_max =
-        'cast(max(array_length(' ~ adapter.quote(column_name) ~ ')) as ' ~ dbt.type_string() ~ ')'
-    -%}
-    {%- set agg_avg = 'avg(array_length(' ~ adapter.quote(column_name) ~ '))' -%}
-    {%- set agg_median =
-        'approx_quantiles(array_length(' ~ adapter.quote(column_name) ~ '), 100)[offset(50)]'
-    -%}
-{%- endif -%}
 
+    {# Overwrite Agg ----------------------------------------- #}
+
+    {# DRC-663: Support bigquery array type }
+    {%- set is_array = column_type.startswith('array') -%}
+    {%- if db_type == 'bigquery' and is_array -%}
+        {%- set agg_distinct_proportion = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
+        {%- set agg_distinct_count = 'cast(null as ' ~ dbt.type_numeric() ~ ')' -%}
+        {%- set agg_is_unique = 'null' -%}
+        {%- set agg_min =
+            'cast(min(array_length(' ~ adapter.quote(column_name) ~ ')) as ' ~ dbt.type_string() ~ ')'
+        -%}
+        {%- set agg_max =
+            'cast(max(array_length(' ~ adapter.quote(column_name) ~ ')) as ' ~ dbt.type_string() ~ ')'
+        -%}
+        {%- set agg_avg = 'avg(array_length(' ~ adapter.quote(column_name) ~ '))' -%}
+        {%- set agg_median =
+            'approx_quantiles(array_length(' ~ adapter.quote(column_name) ~ '), 100)[offset(50)]'
+        -%}
+    {%- endif -%}
 
-{# Main Query -------------------------------------------- #}
 
-select
-    '{{ column_name }}' as column_name,
-    nullif('{{ column_type }}', '') as data_type,
-    {{ agg_row_count }} as row_count,
-    {{ agg_not_null_proportion }} as not_null_proportion,
-    {{ agg_distinct_proportion }} as distinct_proportion,
-    {{ agg_distinct_count }} as distinct_count,
-    {{ agg_is_unique }} as is_unique,
-    {{ agg_min }} as min,
-    {{ agg_max }} as max,
-    {{ agg_avg }} as avg,
-    {{ agg_median }} as median
+    {# Main Query -------------------------------------------- #}
+
+    '{{ column_name }}' as {{ alias_prefix }}column_name,
+    nullif('{{ column_type }}', '') as {{ alias_prefix }}data_type,
+    {{ agg_row_count }} as {{ alias_prefix }}row_count,
+    {{ agg_not_null_proportion }} as {{ alias_prefix }}not_null_proportion,
+    {{ agg_distinct_proportion }} as {{ alias_prefix }}distinct_proportion,
+    {{ agg_distinct_count }} as {{ alias_prefix }}distinct_count,
+    {{ agg_is_unique }} as {{ alias_prefix }}is_unique,
+    {{ agg_min }} as {{ alias_prefix }}min,
+    {{ agg_max }} as {{ alias_prefix }}max,
+    {{ agg_avg }} as {{ alias_prefix }}avg,
+    {{ agg_median }} as {{ alias_prefix }}median{{ ',' if not loop.last }}
+{%- endfor %}
 from {{ relation }}
 """
 
+PROFILE_COLUMN_JINJA_TEMPLATE = (
+    r"""{%- set columns = [{'name': column_name, 'type': column_type}] -%}""" + PROFILE_COLUMNS_JINJA_TEMPLATE
+)
+
+PROFILE_METRICS = [
+    "column_name",
+    "data_type",
+    "row_count",
+    "not_null_proportion",
+    "distinct_proportion",
+    "distinct_count",
+    "is_unique",
+    "min",
+    "max",
+    "avg",
+    "median",
+]
+
+# Maximum number of columns profiled by one query
+PROFILE_BATCH_SIZE = 50
+
+# The median of these adapters is a window function, which cannot be mixed with the aggregates of other columns
+PROFILE_PER_COLUMN_DB_TYPES = {"sqlserver"}
+
+# Adapters with approximate distinct count functions, used by the approximate mode. The medians of BigQuery and Athena
+# are always approximate.
+PROFILE_APPROX_DB_TYPES = ["athena", "bigquery", "databricks", "duckdb", "redshift", "snowflake", "spark", "trino"]
+
+
+def _get_database_error():
+    from recce.adapter.dbt_adapter import dbt_version
+
+    if dbt_version < "v1.8":
+        from dbt.exceptions import DbtDatabaseError
+    else:
+        from dbt_common.exceptions import DbtDatabaseError
+    return DbtDatabaseError
+
 
 class ProfileParams(BaseModel):
     model: str
     columns: List[str] = None
+    # Use approximate distinct counts and medians where the adapter supports them
+    approximate: Optional[bool] = False
 
 
 class ProfileDiffResult(BaseModel):
     base: DataFrame
     current: DataFrame
+    # "approximate" or "exact"
+    method: Optional[str] = None
 
 
 class ProfileResult(BaseModel):
     current: DataFrame
+    method: Optional[str] = None
 
 
-class ProfileDiffTask(Task):
+class ProfileDiffTask(Task, QueryMixin):
 
     def __init__(self, params):
         super().__init__()
@@ -182,34 +269,89 @@ class ProfileDiffTask(Task):
 
             total = len(base_columns) + len(curr_columns)
             completed = 0
-
-            tables: List[agate.Table] = []
-
-            for column in base_columns:
-                self.update_progress(message=f"[Base] Profile column: {column.name}", percentage=completed / total)
-                relation = dbt_adapter.create_relation(model, base=True)
-                response, table = self._profile_column(dbt_adapter, relation, column)
-                tables.append(table)
-                completed = completed + 1
-                self.check_cancel()
-            base = DataFrame.from_agate(merge_tables(tables))
-
-            tables: List[agate.Table] = []
-            for column in curr_columns:
-                self.update_progress(message=f"[Current] Profile column: {column.column}", percentage=completed / total)
-                relation = dbt_adapter.create_relation(model, base=False)
-                response, table = self._profile_column(dbt_adapter, relation, column)
-                tables.append(table)
-                completed = completed + 1
-                self.check_cancel()
-            current = DataFrame.from_agate(merge_tables(tables))
+            lock = threading.Lock()
+
+            def _profile(base: bool, columns) -> DataFrame:
+                nonlocal completed
+                label = "Base" if base else "Current"
+                tables: List[agate.Table] = []
+                relation = dbt_adapter.create_relation(model, base=base)
+                for batch in self._batch_columns(dbt_adapter, columns):
+                    with lock:
+                        self.update_progress(
+                            message=f"[{label}] Profile columns: {', '.join(column.name for column in batch)}",
+                            percentage=completed / total,
+                        )
+                    tables.extend(self._profile_columns(dbt_adapter, relation, batch))
+                    with lock:
+                        completed = completed + len(batch)
+                    self.check_cancel()
+                return DataFrame.from_agate(merge_tables(tables))
+
+            base, current = self.execute_base_and_current(
+                partial(_profile, True, base_columns),
+                partial(_profile, False, curr_columns),
+            )
 
             if len(base.columns) == 0 and len(current.columns) != 0:
                 base.columns = current.columns
             elif len(base.columns) != 0 and len(current.columns) == 0:
                 current.columns = base.columns
 
-            return ProfileDiffResult(base=base, current=current)
+            return ProfileDiffResult(base=base, current=current, method=self._method(dbt_adapter))
+
+    def _approximate_context(self) -> dict:
+        return dict(approximate=bool(self.params.approximate), approx_db_types=PROFILE_APPROX_DB_TYPES)
+
+    def _method(self, dbt_adapter) -> str:
+        db_type = dbt_adapter.adapter.type().lower()
+        return "approximate" if self.params.approximate and db_type in PROFILE_APPROX_DB_TYPES else "exact"
+
+    @staticmethod
+    def _batch_columns(dbt_adapter, columns) -> Iterator[list]:
+        db_type = dbt_adapter.adapter.type().lower()
+        batch_size = 1 if db_type in PROFILE_PER_COLUMN_DB_TYPES else PROFILE_BATCH_SIZE
+        for i in range(0, len(columns), batch_size):
+            yield columns[i : i + batch_size]
+
+    def _profile_columns(self, dbt_adapter, relation, columns) -> List["agate.Table"]:
+        """
+        Profile the columns with a single scan of the relation and unpivot the wide result to one table per column.
+
+        If the batched query fails, the columns are profiled one by one, so that the error of the failing column is
+        reported as it would be without batching.
+        """
+        import agate
+
+        if len(columns) == 1:
+            _, table = self._profile_column(dbt_adapter, relation, columns[0])
+            return [table]
+
+        db_type = dbt_adapter.adapter.type().lower()
+        column_specs = [dict(name=column.name, type=column.data_type.lower()) for column in columns]
+        try:
+            sql = dbt_adapter.generate_sql(
+                PROFILE_COLUMNS_JINJA_TEMPLATE,
+                base=False,  # always false because we use the macro in current manifest
+                context=dict(relation=relation, columns=column_specs, db_type=db_type, **self._approximate_context()),
+            )
+        except Exception as e:
+            names = ", ".join(column.name for column in columns)
+            raise RecceException(f"Failed to generate SQL for profiling columns: {names}") from e
+
+        try:
+            _, wide = dbt_adapter.execute(sql, fetch=True)
+        except _get_database_error():
+            self.check_cancel()
+            return [self._profile_column(dbt_adapter, relation, column)[1] for column in columns]
+
+        n = len(PROFILE_METRICS)
+        tables = []
+        for i in range(len(columns)):
+            column_types = wide.column_types[i * n : (i + 1) * n]
+            rows = [row.values()[i * n : (i + 1) * n] for row in wide.rows]
+            tables.append(agate.Table(rows, PROFILE_METRICS, column_types))
+        return tables
 
     def _profile_column(self, dbt_adapter, relation, column):
         column_name = column.name
@@ -220,7 +362,13 @@ class ProfileDiffTask(Task):
             sql = dbt_adapter.generate_sql(
                 PROFILE_COLUMN_JINJA_TEMPLATE,
                 base=False,  # always false because we use the macro in current manifest
-                context=dict(relation=relation, column_name=column_name, column_type=column_type, db_type=db_type),
+                context=dict(
+                    relation=relation,
+                    column_name=column_name,
+                    column_type=column_type,
+                    db_type=db_type,
+                    **self._approximate_context(),
+                ),
             )
         except Exception as e:
             raise RecceException(f"Failed to generate SQL for profiling column: {column_name}") from e
@@ -228,13 +376,7 @@ class ProfileDiffTask(Task):
         try:
             return dbt_adapter.execute(sql, fetch=True)
         except Exception as e:
-            from recce.adapter.dbt_adapter import dbt_version
-
-            if dbt_version < "v1.8":
-                from dbt.exceptions import DbtDatabaseError
-            else:
-                from dbt_common.exceptions import DbtDatabaseError
-            if isinstance(e, DbtDatabaseError):
+            if isinstance(e, _get_database_error()):
                 if str(e).find("100051") >= 0:
                     # Snowflake error '100051 (22012): Division by zero"'
                     e = RecceException("No profile diff result due to the model is empty.", False)
@@ -242,13 +384,7 @@ class ProfileDiffTask(Task):
 
     def cancel(self):
         super().cancel()
-
-        if self.connection:
-            from recce.adapter.dbt_adapter import DbtAdapter
-
-            dbt_adapter: DbtAdapter = default_context().adapter
-            with dbt_adapter.connection_named("cancel"):
-                dbt_adapter.cancel(self.connection)
+        self.close_connections()
 
 
 class ProfileDiffResultDiffer(TaskResultDiffer):
@@ -287,12 +423,14 @@ class ProfileTask(ProfileDiffTask):
             completed = 0
 
             tables: List[agate.Table] = []
-            for column in curr_columns:
-                self.update_progress(message=f"[Current] Profile column: {column.column}", percentage=completed / total)
-                relation = dbt_adapter.create_relation(model, base=False)
-                response, table = self._profile_column(dbt_adapter, relation, column)
-                tables.append(table)
-                completed = completed + 1
+            relation = dbt_adapter.create_relation(model, base=False)
+            for batch in self._batch_columns(dbt_adapter, curr_columns):
+                self.update_progress(
+                    message=f"[Current] Profile columns: {', '.join(column.name for column in batch)}",
+                    percentage=completed / total,
+                )
+                tables.extend(self._profile_columns(dbt_adapter, relation, batch))
+                completed = completed + len(batch)
                 self.check_cancel()
             current = DataFrame.from_agate(merge_tables(tables))
-            return ProfileResult(current=current)
+            return ProfileResult(current=current, method=self._method(dbt_adapter))
@@ -1,7 +1,12 @@
+import base64
+import contextvars
+import json
 import typing
-from typing import List, Optional, Tuple
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..core import default_context
 from ..exceptions import RecceException
@@ -11,21 +16,47 @@ from .dataframe import DataFrame
 from .valuediff import ValueDiffMixin
 
 QUERY_LIMIT = 2000
+# The largest page of rows a paginated query returns
+QUERY_MAX_PAGE_SIZE = 10000
 
 if typing.TYPE_CHECKING:
     import agate
 
 
+def encode_page_token(offset: int) -> str:
+    """
+    Encode the position of the next page of a query result as an opaque token.
+    """
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode("utf-8")).decode("ascii")
+
+
+def decode_page_token(page_token: Optional[str]) -> int:
+    """
+    Decode a page token into the number of rows to skip. No token means the first page.
+    """
+    if not page_token:
+        return 0
+    try:
+        offset = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))["offset"]
+    except Exception:
+        raise RecceException(f"Invalid page token: {page_token}")
+    if not isinstance(offset, int) or offset < 0:
+        raise RecceException(f"Invalid page token: {page_token}")
+    return offset
+
+
 class QueryMixin:
     @classmethod
     def execute_sql_with_limit(
-        cls, sql_template, base: bool = False, limit: Optional[int] = None
+        cls, sql_template, base: bool = False, limit: Optional[int] = None, offset: int = 0
     ) -> Tuple["agate.Table", bool]:
         """
         Execute a SQL template and return the result as an agate table.
         :param sql_template: SQL template to execute
         :param base: Whether to run the query on the base environment
         :param limit: Limit the number of rows returned
+        :param offset: Number of rows to skip before the returned rows. Only stable if the query has an ORDER BY on a
+            unique key
         :return: Tuple of agate table and whether there are more rows to fetch
         """
         from jinja2.exceptions import TemplateSyntaxError
@@ -37,10 +68,10 @@ class QueryMixin:
             sql = dbt_adapter.generate_sql(sql_template, base)
 
             if limit is None:
-                _, result = dbt_adapter.execute(sql, fetch=True, auto_begin=True)
+                _, result = dbt_adapter.execute(sql, fetch=True, auto_begin=True, offset=offset)
                 return result, False
             else:
-                _, result = dbt_adapter.execute(sql, fetch=True, auto_begin=True, limit=limit + 1)
+                _, result = dbt_adapter.execute(sql, fetch=True, auto_begin=True, limit=limit + 1, offset=offset)
                 if len(result.rows) > limit:
                     return result.limit(limit), True
                 return result, False
@@ -54,15 +85,130 @@ class QueryMixin:
         result, _ = cls.execute_sql_with_limit(sql_template, base)
         return result
 
+    def get_page(self) -> Tuple[int, int]:
+        """
+        Return the offset and the limit of the page requested by the `page_size` and `page_token` params. Without a page
+        size, the page holds `QUERY_LIMIT` rows.
+        """
+        return decode_page_token(self.params.page_token), self.params.page_size or QUERY_LIMIT
+
+    def is_paginated(self) -> bool:
+        """
+        Whether the params request a page of the result, rather than its first `QUERY_LIMIT` rows.
+        """
+        return self.params.page_size is not None or self.params.page_token is not None
+
+    def paginate(self, df: Optional[DataFrame], offset: int, more: bool) -> Optional[DataFrame]:
+        """
+        Set the token of the page following the rows of the data frame, if a page is requested and there are more rows
+        to fetch.
+
+        The pages are read by skipping the rows of the earlier pages, so they are only stable if the query has an
+        ORDER BY on a unique key. Otherwise the warehouse may return the rows in a different order on each call.
+        """
+        if df is not None and more and self.is_paginated():
+            df.next_page_token = encode_page_token(offset + len(df.data))
+        return df
+
     @staticmethod
     def close_connection(connection):
         dbt_adapter = default_context().adapter
         with dbt_adapter.connection_named("cancel query"):
             dbt_adapter.cancel(connection)
 
+    def execute_base_and_current(
+        self,
+        base_fn: Callable[[], Any],
+        current_fn: Callable[[], Any],
+        name: str = "query",
+    ) -> Tuple[Any, Any]:
+        """
+        Run the base and current statements concurrently, each on its own named connection.
+
+        If one side fails, the other side is cancelled and the error is raised.
+        :param base_fn: Function that runs the statement against the base environment
+        :param current_fn: Function that runs the statement against the current environment
+        :param name: Prefix of the connection names
+        :return: Tuple of the base and current results
+        """
+        base, current = self.execute_on_connections([(f"{name} (base)", base_fn), (f"{name} (current)", current_fn)])
+        self.check_cancel()
+        return base, current
+
+    def execute_on_connections(
+        self,
+        jobs: List[Tuple[str, Callable[[], Any]]],
+        max_workers: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run the jobs concurrently on a bounded pool of worker threads. Each job runs on a dbt connection named after it.
+
+        The connections in use are tracked in `self.parallel_connections` so that `close_connections` can cancel the
+        in-flight statements. If a job fails, the pending jobs are dropped, the running ones are cancelled and the error
+        is raised.
+        :param jobs: List of the connection name and the function to run
+        :param max_workers: Maximum number of concurrent connections, defaults to one per job
+        :return: The results of the jobs, in order
+        """
+        dbt_adapter = default_context().adapter
+        if getattr(self, "parallel_connections", None) is None:
+            self.parallel_connections = []
+        connections = self.parallel_connections
+
+        def _run(connection_name, fn):
+            self.check_cancel()
+            with dbt_adapter.connection_named(connection_name):
+                connection = dbt_adapter.get_thread_connection()
+                connections.append(connection)
+                try:
+                    return fn()
+                finally:
+                    connections.remove(connection)
+
+        if not jobs:
+            return []
+
+        max_workers = min(max_workers or len(jobs), len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recce-query") as executor:
+            # Copy the context so that the dbt invocation context is visible in the worker threads
+            futures = [executor.submit(contextvars.copy_context().run, _run, name, fn) for name, fn in jobs]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            errors = [future.exception() for future in futures if future in done and future.exception() is not None]
+            if errors:
+                for future in not_done:
+                    future.cancel()
+                for connection in list(connections):
+                    self.close_connection(connection)
+
+        if errors:
+            raise errors[0]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def get_max_connections() -> int:
+        """
+        The number of connections to run concurrent queries on, as configured by `threads` in the dbt profile.
+        """
+        runtime_config = getattr(default_context().adapter, "runtime_config", None)
+        return max(getattr(runtime_config, "threads", None) or 1, 1)
+
+    def close_connections(self):
+        """
+        Cancel the statements running on the task connection and on the connections of `execute_base_and_current`.
+        """
+        connection = getattr(self, "connection", None)
+        if connection:
+            self.close_connection(connection)
+        for connection in list(getattr(self, "parallel_connections", None) or []):
+            self.close_connection(connection)
+
 
 class QueryParams(BaseModel):
     sql_template: str
+    # Fetch the result one page at a time. The token of the next page is returned with each page. The pages are only
+    # stable if the query has an ORDER BY on a unique key.
+    page_size: Optional[int] = Field(None, gt=0, le=QUERY_MAX_PAGE_SIZE)
+    page_token: Optional[str] = None
 
 
 class QueryResult(DataFrame):
@@ -74,6 +220,10 @@ class QueryDiffParams(BaseModel):
     base_sql_template: Optional[str] = None
     primary_keys: Optional[List[str]] = None
     current_model: Optional[str] = None
+    # Fetch the results one page at a time. The same token selects the same page of the base and current results. The
+    # pages are only stable if the query has an ORDER BY on a unique key, or with the primary keys the diff is ordered by.
+    page_size: Optional[int] = Field(None, gt=0, le=QUERY_MAX_PAGE_SIZE)
+    page_token: Optional[str] = None
 
 
 class QueryTask(Task, QueryMixin):
@@ -89,25 +239,25 @@ class QueryTask(Task, QueryMixin):
 
         dbt_adapter: DbtAdapter = default_context().adapter
 
-        limit = QUERY_LIMIT
+        offset, limit = self.get_page()
         with dbt_adapter.connection_named("query"):
             self.connection = dbt_adapter.get_thread_connection()
 
             sql_template = self.params.sql_template
-            table, more = self.execute_sql_with_limit(sql_template, base=self.is_base, limit=limit)
+            table, more = self.execute_sql_with_limit(sql_template, base=self.is_base, limit=limit, offset=offset)
             self.check_cancel()
 
-            return DataFrame.from_agate(table, limit=limit, more=more)
+            return self.paginate(DataFrame.from_agate(table, limit=limit, more=more), offset, more)
 
     def execute_sqlmesh(self):
         from ..adapter.sqlmesh_adapter import SqlmeshAdapter
 
         sqlmesh_adapter: SqlmeshAdapter = default_context().adapter
 
-        sql = self.params.get("sql_template")
-        limit = QUERY_LIMIT
-        df, more = sqlmesh_adapter.fetchdf_with_limit(sql, base=self.is_base, limit=limit)
-        return DataFrame.from_pandas(df, limit=limit, more=more)
+        sql = self.params.sql_template
+        offset, limit = self.get_page()
+        df, more = sqlmesh_adapter.fetchdf_with_limit(sql, base=self.is_base, limit=limit, offset=offset)
+        return self.paginate(DataFrame.from_pandas(df, limit=limit, more=more), offset, more)
 
     def execute(self):
         context = default_context()
@@ -147,21 +297,21 @@ class QueryDiffTask(Task, QueryMixin, ValueDiffMixin):
         base_sql_template: Optional[str] = None,
         preview_change: bool = False,
     ):
-        limit = QUERY_LIMIT
+        offset, limit = self.get_page()
 
         self.connection = dbt_adapter.get_thread_connection()
+        execute = partial(self.execute_sql_with_limit, limit=limit, offset=offset)
         if preview_change:
-            base, base_more = self.execute_sql_with_limit(base_sql_template, base=False, limit=limit)
+            base_fn = partial(execute, base_sql_template, base=False)
         else:
-            base, base_more = self.execute_sql_with_limit(base_sql_template or sql_template, base=True, limit=limit)
-        self.check_cancel()
+            base_fn = partial(execute, base_sql_template or sql_template, base=True)
+        current_fn = partial(execute, sql_template, base=False)
 
-        current, current_more = self.execute_sql_with_limit(sql_template, base=False, limit=limit)
-        self.check_cancel()
+        (base, base_more), (current, current_more) = self.execute_base_and_current(base_fn, current_fn)
 
         return QueryDiffResult(
-            base=DataFrame.from_agate(base, limit=limit, more=base_more),
-            current=DataFrame.from_agate(current, limit=limit, more=current_more),
+            base=self.paginate(DataFrame.from_agate(base, limit=limit, more=base_more), offset, base_more),
+            current=self.paginate(DataFrame.from_agate(current, limit=limit, more=current_more), offset, current_more),
         )
 
     def _query_diff_join(
@@ -238,20 +388,31 @@ class QueryDiffTask(Task, QueryMixin, ValueDiffMixin):
             base_query = dbt_adapter.generate_sql(base_sql_template or sql_template, base=True)
         current_query = dbt_adapter.generate_sql(sql_template, base=False)
 
+        # The diff is ordered by the primary keys, so a page is read from the cursor after skipping the earlier pages
+        offset, limit = self.get_page()
+        paginated = self.is_paginated()
         sql = dbt_adapter.generate_sql(
             query_template,
             context=dict(
                 base_query=base_query,
                 current_query=current_query,
                 primary_keys=primary_keys,
-                limit=QUERY_LIMIT,
+                limit=offset + limit + 1 if paginated else QUERY_LIMIT,
             ),
         )
 
-        _, table = dbt_adapter.execute(sql, fetch=True)
+        if not paginated:
+            _, table = dbt_adapter.execute(sql, fetch=True)
+            self.check_cancel()
+            return QueryDiffResult(diff=DataFrame.from_agate(table))
+
+        _, table = dbt_adapter.execute(sql, fetch=True, limit=limit + 1, offset=offset)
         self.check_cancel()
 
-        return QueryDiffResult(diff=DataFrame.from_agate(table))
+        more = len(table.rows) > limit
+        if more:
+            table = table.limit(limit)
+        return QueryDiffResult(diff=self.paginate(DataFrame.from_agate(table, limit=limit, more=more), offset, more))
 
     @staticmethod
     def _select_single_model(model_name):
@@ -292,12 +453,12 @@ class QueryDiffTask(Task, QueryMixin, ValueDiffMixin):
 
         sqlmesh_adapter: SqlmeshAdapter = default_context().adapter
 
-        limit = QUERY_LIMIT
-        base, base_more = sqlmesh_adapter.fetchdf_with_limit(base_sql or sql, base=True, limit=limit)
-        curr, curr_more = sqlmesh_adapter.fetchdf_with_limit(sql, base=False, limit=limit)
+        offset, limit = self.get_page()
+        base, base_more = sqlmesh_adapter.fetchdf_with_limit(base_sql or sql, base=True, limit=limit, offset=offset)
+        curr, curr_more = sqlmesh_adapter.fetchdf_with_limit(sql, base=False, limit=limit, offset=offset)
         return QueryDiffResult(
-            base=DataFrame.from_pandas(base, limit=limit, more=base_more),
-            current=DataFrame.from_pandas(curr, limit=limit, more=curr_more),
+            base=self.paginate(DataFrame.from_pandas(base, limit=limit, more=base_more), offset, base_more),
+            current=self.paginate(DataFrame.from_pandas(curr, limit=limit, more=curr_more), offset, curr_more),
         )
 
     def _sqlmesh_query_diff_join(self, sql, primary_keys, base_sql=None):
@@ -375,8 +536,7 @@ class QueryDiffTask(Task, QueryMixin, ValueDiffMixin):
 
     def cancel(self):
         super().cancel()
-        if self.connection:
-            self.close_connection(self.connection)
+        self.close_connections()
 
 
 class QueryDiffResultDiffer(TaskResultDiffer):
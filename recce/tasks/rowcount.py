@@ -1,4 +1,8 @@
-from typing import List, Literal, Optional, Union
+import logging
+import threading
+from collections import defaultdict
+from functools import partial
+from typing import Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel
 
@@ -8,13 +12,147 @@ from recce.tasks import Task
 from recce.tasks.core import CheckValidator, TaskResultDiffer
 from recce.tasks.query import QueryMixin
 
+logger = logging.getLogger("uvicorn")
+
+# Queries that return the (table name, row count) of the tables in a schema from the warehouse metadata. The counts of
+# Postgres, Redshift and DuckDB are the statistics maintained by the database, and the metadata of Snowflake and BigQuery
+# may lag behind recent writes, so the counts read from the metadata are reported as estimated.
+#
+# The context has the `relation` of a model in the schema, rendered with the quoting of the adapter, and the
+# `database_literal` and `schema_literal` string literals, escaped by `_string_literal`.
+ROW_COUNT_METADATA_SQL = {
+    "snowflake": r"""
+        select table_name, row_count
+        from {{ relation.information_schema('tables') }}
+        where upper(table_schema) = upper({{ schema_literal }}) and table_type = 'BASE TABLE'
+    """,
+    "bigquery": r"""
+        select table_id, row_count
+        from {{ relation.include(identifier=False) }}.__TABLES__
+        where type = 1
+    """,
+    "postgres": r"""
+        select c.relname, cast(c.reltuples as bigint)
+        from pg_catalog.pg_class c
+        join pg_catalog.pg_namespace n on n.oid = c.relnamespace
+        where n.nspname = {{ schema_literal }} and c.relkind in ('r', 'p') and c.reltuples >= 0
+    """,
+    "redshift": r"""
+        select "table", estimated_visible_rows
+        from svv_table_info
+        where {% if database_literal %}"database" = {{ database_literal }} and {% endif %}"schema" = {{ schema_literal }}
+    """,
+    "duckdb": r"""
+        select table_name, estimated_size
+        from duckdb_tables()
+        where {% if database_literal %}database_name = {{ database_literal }} and {% endif %}schema_name = {{ schema_literal }}
+    """,
+}
+
+
+# The warehouses that read a backslash in a string literal as an escape character
+BACKSLASH_ESCAPE_ADAPTERS = {"snowflake", "redshift"}
+
+
+def _string_literal(value: Optional[str], adapter_type: str) -> Optional[str]:
+    """
+    Quote a value as a SQL string literal of the warehouse, escaping the single quotes and, where the warehouse reads
+    them as escapes, the backslashes in it.
+    """
+    if value is None:
+        return None
+    escaped = str(value)
+    if adapter_type in BACKSLASH_ESCAPE_ADAPTERS:
+        escaped = escaped.replace("\\", "\\\\")
+    escaped = escaped.replace("'", "''")
+    return f"'{escaped}'"
+
+
+class RowCountMixin(QueryMixin):
+    def _execute_per_node(self, fn, nodes: List[str], action: str) -> list:
+        """
+        Run `fn` for each node on a pool of connections, sized by the `threads` of the dbt profile, and report the
+        progress as nodes complete.
+        """
+        completed = 0
+        total = len(nodes)
+        lock = threading.Lock()
+
+        def _run(node):
+            nonlocal completed
+            result = fn(node)
+            self.check_cancel()
+            with lock:
+                completed += 1
+                self.update_progress(message=f"{action}: {node} [{completed}/{total}]", percentage=completed / total)
+            return result
+
+        jobs = [(f"{action.lower()}: {node}", partial(_run, node)) for node in nodes]
+        return self.execute_on_connections(jobs, max_workers=self.get_max_connections())
+
+    def _query_metadata_row_counts(self, dbt_adapter, model_names: List[str], base=False) -> Dict[str, int]:
+        """
+        Get the row counts of the table-like models from the warehouse metadata, with one query per schema.
+
+        Views and the models that are not found in the metadata are not in the result, and should be counted by a
+        `count(*)` query instead.
+        """
+        adapter_type = dbt_adapter.adapter.type().lower()
+        sql_template = ROW_COUNT_METADATA_SQL.get(adapter_type)
+        if sql_template is None:
+            return {}
+
+        # (database, schema) -> identifier -> model name
+        schemas = defaultdict(dict)
+        # (database, schema) -> a relation in the schema
+        relations = {}
+        for model_name in model_names:
+            node = dbt_adapter.find_node_by_name(model_name, base=base)
+            if node is None or node.resource_type not in ["model", "snapshot"]:
+                continue
+            if node.config is None or node.config.materialized not in ["table", "incremental", "snapshot"]:
+                continue
+            relation = dbt_adapter.create_relation(model_name, base=base)
+            if relation is None or relation.identifier is None:
+                continue
+            schemas[(relation.database, relation.schema)][relation.identifier.lower()] = model_name
+            relations.setdefault((relation.database, relation.schema), relation)
+
+        def _query_schema(database, schema, identifiers):
+            row_counts = {}
+            context = dict(
+                relation=relations[(database, schema)],
+                database_literal=_string_literal(database, adapter_type),
+                schema_literal=_string_literal(schema, adapter_type),
+            )
+            try:
+                sql = dbt_adapter.generate_sql(sql_template, context=context)
+                _, table = dbt_adapter.execute(sql, fetch=True)
+            except Exception as e:
+                logger.debug(f"Failed to query the row counts of {database}.{schema} from metadata: {e}")
+                return row_counts
+            for table_name, row_count in table.rows:
+                model_name = identifiers.get(str(table_name).lower())
+                if model_name is not None and row_count is not None:
+                    row_counts[model_name] = int(row_count)
+            return row_counts
+
+        jobs = [
+            (f"metadata: {schema}", partial(_query_schema, database, schema, identifiers))
+            for (database, schema), identifiers in schemas.items()
+        ]
+        row_counts = {}
+        for result in self.execute_on_connections(jobs, max_workers=self.get_max_connections()):
+            row_counts.update(result)
+        return row_counts
+
 
 class RowCountParams(BaseModel):
     node_names: Optional[list[str]] = None
     node_ids: Optional[list[str]] = None
 
 
-class RowCountTask(Task, QueryMixin):
+class RowCountTask(Task, RowCountMixin):
     def __init__(self, params: dict):
         super().__init__()
         self.params = RowCountParams(**params) if params is not None else RowCountParams()
@@ -73,24 +211,21 @@ class RowCountTask(Task, QueryMixin):
         # Query row count for nodes that are not cached
         with dbt_adapter.connection_named("query"):
             self.connection = dbt_adapter.get_thread_connection()
-            completed = 0
-            total = len(query_candidates)
-            for node in query_candidates:
-                self.update_progress(message=f"Query: {node} [{completed}/{total}]", percentage=completed / total)
 
-                row_count = self._query_row_count(dbt_adapter, node, base=False)
-                self.check_cancel()
-                result[node] = {
-                    "curr": row_count,
+            def _row_count(node):
+                return {
+                    "curr": self._query_row_count(dbt_adapter, node, base=False),
                 }
-                completed += 1
+
+            row_counts = self._execute_per_node(_row_count, query_candidates, "Query")
+            for node, row_count in zip(query_candidates, row_counts):
+                result[node] = row_count
 
         return result
 
     def cancel(self):
         super().cancel()
-        if self.connection:
-            self.close_connection(self.connection)
+        self.close_connections()
 
 
 class RowCountDiffParams(BaseModel):
@@ -100,9 +235,12 @@ class RowCountDiffParams(BaseModel):
     exclude: Optional[str] = None
     packages: Optional[list[str]] = None
     view_mode: Optional[Literal["all", "changed_models"]] = None
+    # "metadata" reads the row counts of tables from the warehouse metadata and only counts the rows of views. The result
+    # of each node then has the `method` of its base and current counts, and whether any of them is `estimated`.
+    strategy: Optional[Literal["count", "metadata"]] = None
 
 
-class RowCountDiffTask(Task, QueryMixin):
+class RowCountDiffTask(Task, RowCountMixin):
     def __init__(self, params: dict):
         super().__init__()
         self.params = RowCountDiffParams(**params) if params is not None else RowCountDiffParams()
@@ -161,20 +299,46 @@ class RowCountDiffTask(Task, QueryMixin):
         # Query row count for nodes that are not cached
         with dbt_adapter.connection_named("query"):
             self.connection = dbt_adapter.get_thread_connection()
-            completed = 0
-            total = len(query_candidates)
-            for node in query_candidates:
-                self.update_progress(message=f"Diff: {node} [{completed}/{total}]", percentage=completed / total)
 
-                base_row_count = self._query_row_count(dbt_adapter, node, base=True)
+            base_metadata_row_counts = {}
+            curr_metadata_row_counts = {}
+            if self.params.strategy == "metadata":
+                self.update_progress(message="Query row counts from metadata")
+                base_metadata_row_counts = self._query_metadata_row_counts(dbt_adapter, query_candidates, base=True)
+                curr_metadata_row_counts = self._query_metadata_row_counts(dbt_adapter, query_candidates, base=False)
                 self.check_cancel()
-                curr_row_count = self._query_row_count(dbt_adapter, node, base=False)
+
+            def _row_count_diff(node):
+                base_row_count = base_metadata_row_counts.get(node)
+                if base_row_count is None:
+                    base_row_count = self._query_row_count(dbt_adapter, node, base=True)
                 self.check_cancel()
-                result[node] = {
+                curr_row_count = curr_metadata_row_counts.get(node)
+                if curr_row_count is None:
+                    curr_row_count = self._query_row_count(dbt_adapter, node, base=False)
+                row_count_diff = {
                     "base": base_row_count,
                     "curr": curr_row_count,
                 }
-                completed += 1
+                if self.params.strategy == "metadata":
+                    # How each row count is obtained. The counts from the metadata are estimates.
+                    method = {
+                        "base": "metadata" if node in base_metadata_row_counts else "count",
+                        "curr": "metadata" if node in curr_metadata_row_counts else "count",
+                    }
+                    row_count_diff["method"] = method
+                    row_count_diff["estimated"] = "metadata" in method.values()
+                return row_count_diff
+
+            # Only the nodes without a row count from metadata need a query
+            nodes_to_query = [
+                node
+                for node in query_candidates
+                if node not in base_metadata_row_counts or node not in curr_metadata_row_counts
+            ]
+            row_counts = dict(zip(nodes_to_query, self._execute_per_node(_row_count_diff, nodes_to_query, "Diff")))
+            for node in query_candidates:
+                result[node] = row_counts[node] if node in row_counts else _row_count_diff(node)
 
         return result
 
@@ -225,8 +389,7 @@ class RowCountDiffTask(Task, QueryMixin):
 
     def cancel(self):
         super().cancel()
-        if self.connection:
-            self.close_connection(self.connection)
+        self.close_connections()
 
 
 class RowCountDiffResultDiffer(TaskResultDiffer):
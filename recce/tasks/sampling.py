@@ -0,0 +1,99 @@
+import math
+from typing import Optional, Tuple
+
+# Percentage of the rows read by the approximate mode of the top-k and histogram diffs
+APPROX_SAMPLE_PERCENT = 10
+
+# Relations with fewer rows are always read in full, since sampling them saves little and loses accuracy
+APPROX_SAMPLE_MIN_ROWS = 1_000_000
+
+# The table sample clause of each adapter, appended to the relation in the `from` clause. Adapters without a clause
+# are always read in full.
+TABLESAMPLE_CLAUSES = {
+    "athena": "tablesample bernoulli ({percent})",
+    "bigquery": "tablesample system ({percent} percent)",
+    "databricks": "tablesample ({percent} percent)",
+    "duckdb": "tablesample {percent} percent (bernoulli)",
+    "postgres": "tablesample system ({percent})",
+    "snowflake": "sample ({percent})",
+    "spark": "tablesample ({percent} percent)",
+    "sqlserver": "tablesample ({percent} percent)",
+    "trino": "tablesample bernoulli ({percent})",
+}
+
+# Materializations that cannot be sampled. Warehouses such as BigQuery and Postgres reject a table sample clause on a
+# view, and an ephemeral model is not a relation at all.
+UNSAMPLEABLE_MATERIALIZATIONS = {"view", "ephemeral"}
+
+
+def get_materialized(dbt_adapter, model: str, base: bool = False) -> Optional[str]:
+    """
+    Return the materialization of the model, or None if the node has none, e.g. a source.
+    """
+    node = dbt_adapter.find_node_by_name(model, base=base)
+    config = getattr(node, "config", None)
+    return getattr(config, "materialized", None)
+
+
+def tablesample_clause(
+    db_type: str, percent: float = APPROX_SAMPLE_PERCENT, materialized: Optional[str] = None
+) -> Optional[str]:
+    """
+    Return the table sample clause of the adapter, or None if the adapter cannot sample tables or the relation is
+    materialized as `materialized` and cannot be sampled.
+    """
+    if materialized in UNSAMPLEABLE_MATERIALIZATIONS:
+        return None
+    clause = TABLESAMPLE_CLAUSES.get(db_type.lower())
+    if clause is None:
+        return None
+    return clause.format(percent=percent)
+
+
+def sample_relation(
+    db_type: str, relation, percent: float = APPROX_SAMPLE_PERCENT, materialized: Optional[str] = None
+) -> Optional[str]:
+    """
+    Return the relation with the table sample clause of the adapter, or None if the relation cannot be sampled. See
+    `tablesample_clause`.
+    """
+    clause = tablesample_clause(db_type, percent, materialized)
+    if clause is None:
+        return None
+    return f"{relation} {clause}"
+
+
+def sample_method(percent: Optional[float]) -> dict:
+    """
+    The method recorded in the result of a diff that reads `percent` percent of the rows, or all of them if None.
+    """
+    if percent is None:
+        return {"method": "exact"}
+    return {"method": "sample", "sample_percent": percent}
+
+
+def scale_sample_count(count: int, percent: float, z: float = 1.96) -> Tuple[int, Tuple[int, int]]:
+    """
+    Scale up a count of rows from a sample of `percent` percent of the rows of a relation. Return the estimate and its
+    interval at the confidence level of `z` (95% by default).
+
+    The interval assumes each row is sampled independently. Block sampling, such as `tablesample system`, varies more.
+    """
+    rate = percent / 100
+    estimate = count / rate
+    margin = z * math.sqrt(count * (1 - rate)) / rate
+    return int(round(estimate)), (max(count, int(math.floor(estimate - margin))), int(math.ceil(estimate + margin)))
+
+
+def wilson_interval(successes: int, n: int, z: float = 1.96) -> Tuple[Optional[float], Optional[float]]:
+    """
+    The Wilson score interval of the proportion `successes / n`, at the confidence level of `z` (95% by default).
+    Return (None, None) if there are no observations.
+    """
+    if n == 0:
+        return None, None
+    p = successes / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -6,16 +6,27 @@ from recce.core import default_context
 from recce.models import Check
 from recce.tasks import Task
 from recce.tasks.core import CheckValidator, TaskResultDiffer
-from recce.tasks.query import QueryMixin
+from recce.tasks.rowcount import RowCountMixin
+from recce.tasks.sampling import (
+    APPROX_SAMPLE_MIN_ROWS,
+    APPROX_SAMPLE_PERCENT,
+    get_materialized,
+    sample_method,
+    sample_relation,
+    scale_sample_count,
+)
 
 
 class TopKDiffParams(BaseModel):
     model: str
     column_name: str
     k: Optional[int] = 10
+    # Count the categories, the rows and the valid values of large relations on a table sample and scale the counts up.
+    # Whether a relation is large is read from the warehouse metadata when available.
+    approximate: Optional[bool] = False
 
 
-class TopKDiffTask(Task, QueryMixin):
+class TopKDiffTask(Task, RowCountMixin):
     def __init__(self, params):
         super().__init__()
         self.params = TopKDiffParams(**params)
@@ -47,7 +58,34 @@ class TopKDiffTask(Task, QueryMixin):
 
         return (int(v) if v is not None else 0 for v in result)
 
-    def _query_top_k(self, dbt_adapter, base_relation, curr_relation, column, k):
+    def _sample_relations(self, dbt_adapter, base_relation, curr_relation) -> Optional[Tuple[str, str]]:
+        """
+        Return the sampled base and current relations, or None if either cannot be sampled or has fewer than
+        `APPROX_SAMPLE_MIN_ROWS` rows.
+
+        The row counts come from the warehouse metadata, and only the relations missing from it are counted with a
+        `count(*)`, which most warehouses answer without a full scan.
+        """
+        model = self.params.model
+        db_type = dbt_adapter.adapter.type()
+        base_sample = sample_relation(db_type, base_relation, materialized=get_materialized(dbt_adapter, model, True))
+        curr_sample = sample_relation(db_type, curr_relation, materialized=get_materialized(dbt_adapter, model, False))
+        if base_sample is None or curr_sample is None:
+            return None
+
+        row_counts = []
+        for base, relation in [(True, base_relation), (False, curr_relation)]:
+            row_count = self._query_metadata_row_counts(dbt_adapter, [model], base=base).get(model)
+            if row_count is None:
+                sql = dbt_adapter.generate_sql(r"select count(*) from {{ relation }}", context=dict(relation=relation))
+                _, table = dbt_adapter.execute(sql, fetch=True)
+                row_count = int(table[0][0] or 0)
+            row_counts.append(row_count)
+        if min(row_counts) < APPROX_SAMPLE_MIN_ROWS:
+            return None
+        return base_sample, curr_sample
+
+    def _query_top_k(self, dbt_adapter, base_relation, curr_relation, column, k, sample_percent=None):
         sql_template = r"""
         WITH
         BASE_CAT as (
@@ -96,10 +134,11 @@ class TopKDiffTask(Task, QueryMixin):
         base_counts = []
         curr_counts = []
 
+        scale = 100 / sample_percent if sample_percent else 1
         for row in table:
             categories.append(row[0] if row[0] != "__null__" else None)
-            base_counts.append(int(row[1] if row[1] else 0))
-            curr_counts.append(int(row[2] if row[2] else 0))
+            base_counts.append(int(round(float(row[1] if row[1] else 0) * scale)))
+            curr_counts.append(int(round(float(row[2] if row[2] else 0) * scale)))
 
         return categories, base_counts, curr_counts
 
@@ -124,13 +163,34 @@ class TopKDiffTask(Task, QueryMixin):
                 raise ValueError(f"Model '{model}' not found in the manifest")
 
             self.check_cancel()
-            categories, base_counts, curr_counts = self._query_top_k(
-                dbt_adapter, base_relation, curr_relation, column, k
+            sample = (
+                self._sample_relations(dbt_adapter, base_relation, curr_relation) if self.params.approximate else None
             )
             self.check_cancel()
 
-            base_total, base_valids, curr_total, curr_valids = self._query_row_count_diff(
-                dbt_adapter, base_relation, curr_relation, column
+            sample_percent = None
+            intervals = {}
+            if sample is not None:
+                base_relation, curr_relation = sample
+                sample_percent = APPROX_SAMPLE_PERCENT
+                # The totals and valid values are scaled up from the sample as well, so no relation is read in full
+                scaled = [
+                    scale_sample_count(count, sample_percent)
+                    for count in self._query_row_count_diff(dbt_adapter, base_relation, curr_relation, column)
+                ]
+                base_total, base_valids, curr_total, curr_valids = (estimate for estimate, _ in scaled)
+                intervals = {
+                    "base": {"total_interval": scaled[0][1], "valids_interval": scaled[1][1]},
+                    "current": {"total_interval": scaled[2][1], "valids_interval": scaled[3][1]},
+                }
+            else:
+                base_total, base_valids, curr_total, curr_valids = self._query_row_count_diff(
+                    dbt_adapter, base_relation, curr_relation, column
+                )
+            self.check_cancel()
+
+            categories, base_counts, curr_counts = self._query_top_k(
+                dbt_adapter, base_relation, curr_relation, column, k, sample_percent=sample_percent
             )
 
             result = {
@@ -139,13 +199,16 @@ class TopKDiffTask(Task, QueryMixin):
                     "counts": base_counts,
                     "valids": base_valids,
                     "total": base_total,
+                    **intervals.get("base", {}),
                 },
                 "current": {
                     "values": categories,
                     "counts": curr_counts,
                     "valids": curr_valids,
                     "total": curr_total,
+                    **intervals.get("current", {}),
                 },
+                **sample_method(sample_percent),
             }
             return result
 
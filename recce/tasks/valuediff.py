@@ -1,18 +1,67 @@
 from typing import List, Optional, TypedDict, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..core import default_context
 from ..exceptions import RecceException
 from ..models import Check
 from .core import CheckValidator, Task, TaskResultDiffer
 from .dataframe import DataFrame
+from .sampling import wilson_interval
+
+# Maximum number of columns compared by one query
+VALUE_DIFF_BATCH_SIZE = 100
+
+# Number of buckets the surrogate key hash is split into when sampling, i.e. the last four hex digits of the hash. The
+# keys in the first buckets are sampled, so the same keys are picked in both relations.
+VALUE_DIFF_SAMPLE_BUCKETS = 16**4
+
+# Sets `_pk` to the surrogate key expression of the primary keys
+SURROGATE_KEY_JINJA = r"""
+{%- set default_null_value = "_recce_surrogate_key_null_" -%}
+{%- set fields = [] -%}
+
+{%- for field in primary_keys -%}
+    {%- do fields.append(
+        "coalesce(cast(" ~ field ~ " as " ~ dbt.type_string() ~ "), '" ~ default_null_value  ~"')"
+    ) -%}
+
+    {%- if not loop.last %}
+        {%- do fields.append("'-'") -%}
+    {%- endif -%}
+{%- endfor -%}
+
+{%- set _pk = dbt.hash(dbt.concat(fields)) -%}
+"""
+
+# Keeps the rows whose surrogate key falls in the sampled buckets. Requires `_pk` and `sample_threshold`.
+SAMPLE_FILTER_JINJA = r"""
+{%- if sample_threshold %}
+where lower({{ dbt.right(_pk, 4) }}) < '{{ sample_threshold }}'
+{%- endif -%}
+"""
+
+
+def _sample_buckets(sample_percent: Optional[float]) -> Optional[int]:
+    """
+    The number of surrogate key buckets sampled for `sample_percent`, or None if all rows are compared.
+    """
+    if sample_percent is None:
+        return None
+    buckets = max(1, round(sample_percent / 100 * VALUE_DIFF_SAMPLE_BUCKETS))
+    return buckets if buckets < VALUE_DIFF_SAMPLE_BUCKETS else None
+
+
+def _sample_threshold(buckets: Optional[int]) -> Optional[str]:
+    return f"{buckets:04x}" if buckets is not None else None
 
 
 class ValueDiffParams(BaseModel):
     model: str
     primary_key: Union[str, List[str]]
     columns: Optional[List[str]] = None
+    # Compare a deterministic sample of this percentage of the primary keys instead of all rows
+    sample_percent: Optional[float] = Field(None, gt=0, le=100)
 
 
 class ValueDiffResult(BaseModel):
@@ -23,14 +72,52 @@ class ValueDiffResult(BaseModel):
 
     summary: Summary
     data: DataFrame
+    # Number of warehouse scans saved by diffing all columns in one join instead of one join per column
+    scans_saved: Optional[int] = None
+    # "exact", or "sample" if the counts are extrapolated from a sample of the primary keys
+    method: Optional[str] = None
+    sample_percent: Optional[float] = None
+    # Number of rows in the sample, from both relations
+    sampled_rows: Optional[int] = None
 
 
 class ValueDiffMixin:
-    def _verify_primary_key(self, dbt_adapter, primary_key: Union[str, List[str]], model: str):
+    def _verify_primary_key(
+        self,
+        dbt_adapter,
+        primary_key: Union[str, List[str]],
+        model: str,
+        sample_threshold: Optional[str] = None,
+    ):
         self.update_progress(message=f"Verify primary key: {primary_key}")
         composite = True if isinstance(primary_key, List) else False
 
-        if composite:
+        if sample_threshold is not None:
+            if len(primary_key) == 0:
+                raise RecceException("Primary key cannot be empty")
+            # Duplicated keys share a bucket, so verifying the sampled keys is enough for a sampled diff
+            sql_template = (
+                SURROGATE_KEY_JINJA
+                + r"""
+            with validation_errors as (
+                select
+                    {{ _pk }} as _pk
+                from {{ relation }}
+                """
+                + SAMPLE_FILTER_JINJA
+                + r"""
+                {%- if primary_keys | length == 1 %}
+                and {{ primary_keys[0] }} is not null
+                {%- endif %}
+                group by {{ _pk }}
+                having count(*) > 1
+            )
+
+            select *
+            from validation_errors
+            """
+            )
+        elif composite:
             if len(primary_key) == 0:
                 raise RecceException("Primary key cannot be empty")
             sql_template = r"""
@@ -59,12 +146,14 @@ class ValueDiffMixin:
             context = dict(
                 relation=relation,
                 primary_key=primary_key,
+                primary_keys=primary_key if composite else [primary_key],
+                sample_threshold=sample_threshold,
             )
 
             sql = dbt_adapter.generate_sql(sql_template, context=context)
             sql_test = f"""SELECT COUNT(*) AS INVALIDS FROM ({sql}) AS T"""
 
-            response, table = dbt_adapter.adapter.execute(sql_test, fetch=True)
+            response, table = dbt_adapter.execute(sql_test, fetch=True)
             for row in table.rows:
                 invalids = row[0]
                 if invalids > 0:
@@ -90,17 +179,16 @@ class ValueDiffTask(Task, ValueDiffMixin):
         primary_key: Union[str, List[str]],
         model: str,
         columns: List[str] = None,
+        sample_percent: Optional[float] = None,
     ):
         import agate
 
-        column_groups = {}
         composite = True if isinstance(primary_key, List) else False
 
         if columns is None or len(columns) == 0:
             base_columns = [column.column for column in dbt_adapter.get_columns(model, base=True)]
             curr_columns = [column.column for column in dbt_adapter.get_columns(model, base=False)]
             columns = [column for column in base_columns if column in curr_columns]
-        completed = 0
 
         if composite:
             for primary_key_comp in primary_key[::-1]:
@@ -110,68 +198,55 @@ class ValueDiffTask(Task, ValueDiffMixin):
             if primary_key not in columns:
                 columns.insert(0, primary_key)
 
-        sql_template = r"""
-        {%- set default_null_value = "_recce_surrogate_key_null_" -%}
-        {%- set fields = [] -%}
-
-        {%- for field in primary_keys -%}
-            {%- do fields.append(
-                "coalesce(cast(" ~ field ~ " as " ~ dbt.type_string() ~ "), '" ~ default_null_value  ~"')"
-            ) -%}
-
-            {%- if not loop.last %}
-                {%- do fields.append("'-'") -%}
-            {%- endif -%}
-        {%- endfor -%}
-
-        {%- set _pk = dbt.hash(dbt.concat(fields)) -%}
-
+        # Join the base and current relations once per batch of columns and count the mismatches of every column as
+        # conditional aggregates. A row is mismatched if it exists in both relations and the values differ, where two
+        # nulls are considered equal. When sampling, only the keys in the sampled buckets of both relations are joined.
+        sql_template = (
+            SURROGATE_KEY_JINJA
+            + r"""
         with a_query as (
             select {{ _pk }} as _pk, * from {{ base_relation }}
+            """
+            + SAMPLE_FILTER_JINJA
+            + r"""
         ),
 
         b_query as (
             select {{ _pk }} as _pk, * from {{ curr_relation }}
-        ),
-
-        joined as (
-            select
-                coalesce(a_query._pk, b_query._pk) as _pk,
-                a_query.{{ column_to_compare }} as a_query_value,
-                b_query.{{ column_to_compare }} as b_query_value,
-                case
-                    when a_query.{{ column_to_compare }} = b_query.{{ column_to_compare }} then 'perfect match'
-                    when a_query.{{ column_to_compare }} is null and b_query.{{ column_to_compare }} is null then 'both are null'
-                    when a_query._pk is null then 'missing from {{ a_relation_name }}'
-                    when b_query._pk is null then 'missing from {{ b_relation_name }}'
-                    when a_query.{{ column_to_compare }} is null then 'value is null in {{ a_relation_name }} only'
-                    when b_query.{{ column_to_compare }} is null then 'value is null in {{ b_relation_name }} only'
-                    when a_query.{{ column_to_compare }} != b_query.{{ column_to_compare }} then 'values do not match'
-                    else 'unknown' -- this should never happen
-                end as match_status
-            from a_query
-            full outer join b_query on a_query._pk = b_query._pk
-        ),
-
-        aggregated as (
-            select
-                '{{ column_to_compare }}' as column_name,
-                match_status,
-                count(*) as count_records
-            from joined
-            group by 1, 2
+            """
+            + SAMPLE_FILTER_JINJA
+            + r"""
         )
 
         select
-            column_name,
-            match_status,
-            count_records,
-            round(100.0 * count_records / sum(count_records) over (), 2) as percent_of_total
-        from aggregated
+            sum(case when a_query._pk is null then 1 else 0 end) as added,
+            sum(case when b_query._pk is null then 1 else 0 end) as removed,
+            sum(case when a_query._pk is not null and b_query._pk is not null then 1 else 0 end) as common
+            {%- for column in columns_to_compare %},
+            sum(
+                case
+                    when a_query._pk is null or b_query._pk is null then 0
+                    when a_query.{{ column }} = b_query.{{ column }} then 0
+                    when a_query.{{ column }} is null and b_query.{{ column }} is null then 0
+                    else 1
+                end
+            ) as mismatched_{{ loop.index0 }}
+            {%- endfor %}
+        from a_query
+        full outer join b_query on a_query._pk = b_query._pk
         """
+        )
 
-        for column in columns:
-            self.update_progress(message=f"Diff column: {column}", percentage=completed / len(columns))
+        sample_buckets = _sample_buckets(sample_percent)
+        batches = [columns[i : i + VALUE_DIFF_BATCH_SIZE] for i in range(0, len(columns), VALUE_DIFF_BATCH_SIZE)]
+        added = removed = common = 0
+        mismatched = {}
+        completed = 0
+        for batch in batches:
+            self.update_progress(
+                message=f"Diff columns: {', '.join(batch)}",
+                percentage=completed / len(columns),
+            )
 
             sql = dbt_adapter.generate_sql(
                 sql_template,
@@ -179,80 +254,60 @@ class ValueDiffTask(Task, ValueDiffMixin):
                     base_relation=dbt_adapter.create_relation(model, base=True),
                     curr_relation=dbt_adapter.create_relation(model, base=False),
                     primary_keys=primary_key if composite else [primary_key],
-                    column_to_compare=column,
+                    columns_to_compare=batch,
+                    sample_threshold=_sample_threshold(sample_buckets),
                 ),
             )
 
             _, table = dbt_adapter.execute(sql, fetch=True)
-            if column not in column_groups:
-                column_groups[column] = dict(added=0, removed=0, mismatched=0, matched=0)
-            for row in table.rows:
-                # data example:
-                # ('COLUMN_NAME', 'MATCH_STATUS', 'COUNT_RECORDS', 'PERCENT_OF_TOTAL')
-                # ('EVENT_ID', 'perfect match', 158601510, Decimal('100.00'))
-                column_name, column_state, row_count, total_rate = row
-                if "column_name" == row[0].lower():
-                    # skip column names
-                    return
-
-                # sample data like this:
-                #     https://github.com/dbt-labs/dbt-audit-helper/blob/main/macros/compare_column_values.sql
-                #
-                #     'perfect match'            -> matched
-                #     'both are null'            -> matched
-                #     'missing from a'           -> row added
-                #     'missing from b'           -> row removed
-                #     'value is null in a only'  -> mismatched
-                #     'value is null in b only'  -> mismatched
-                #     'values do not match'      -> mismatched
-                #     'unknown'                  -> this should never happen
-                # end as match_status,
-
-                state_mappings = {
-                    "perfect match": "matched",
-                    "both are null": "matched",
-                    "missing from a": "added",
-                    "missing from b": "removed",
-                    "value is null in a only": "mismatched",
-                    "value is null in b only": "mismatched",
-                    "values do not match": "mismatched",
-                }
-
-                # Use the mapping to update counts
-                for state, action in state_mappings.items():
-                    if state in column_state:
-                        column_groups[column_name][action] += row_count
+            # The sums are null if both relations are empty
+            added, removed, common, *counts = [int(value or 0) for value in table.rows[0]]
+            for column, count in zip(batch, counts):
+                mismatched[column] = count
 
             # Cancel as early as possible
             self.check_cancel()
 
-            completed = completed + 1
+            completed = completed + len(batch)
 
-        first = list(column_groups.values())[0]
-        added = first["added"]
-        removed = first["removed"]
-        common = first["matched"] + first["mismatched"]
-        total = common + added + removed
+        # When sampling, the counts are extrapolated from the sampled buckets and the matched rates come with the bounds of
+        # their 95% confidence interval
+        sampled_rows = common + added + removed
+        scale = 1 if sample_buckets is None else VALUE_DIFF_SAMPLE_BUCKETS / sample_buckets
+        total = round(sampled_rows * scale)
+
+        # The per-column approach scans both relations once per column
+        scans_saved = 2 * (len(columns) - len(batches))
+        self.update_progress(
+            message=f"Diffed {len(columns)} columns with {len(batches)} queries, {scans_saved} warehouse scans saved",
+            percentage=1,
+        )
 
         row = []
-        for k, v in column_groups.items():
+        for k, v in mismatched.items():
             if composite and k.lower() == "_pk":
                 continue
-            # This is incorrect when there are one side null
-            # https://github.com/dbt-labs/dbt-audit-helper/blob/main/macros/compare_column_values.sql#L20-L23
-            # matched = v['matched']
-            matched = common - v["mismatched"]
+            matched = common - v
             rate = None if common == 0 else matched / common
-            record = [k, matched, rate]
+            record = [k, round(matched * scale), rate]
+            if sample_buckets is not None:
+                record.extend(wilson_interval(matched, common))
             row.append(record)
 
         column_names = ["column", "matched", "matched_p"]
         column_types = [agate.Text(), agate.Number(), agate.Number()]
+        if sample_buckets is not None:
+            column_names.extend(["matched_p_low", "matched_p_high"])
+            column_types.extend([agate.Number(), agate.Number()])
         table = agate.Table(row, column_names=column_names, column_types=column_types)
 
         return ValueDiffResult(
-            summary=ValueDiffResult.Summary(total=total, added=added, removed=removed),
+            summary=ValueDiffResult.Summary(total=total, added=round(added * scale), removed=round(removed * scale)),
             data=DataFrame.from_agate(table),
+            scans_saved=scans_saved,
+            method="exact" if sample_buckets is None else "sample",
+            sample_percent=None if sample_buckets is None else sample_buckets / VALUE_DIFF_SAMPLE_BUCKETS * 100,
+            sampled_rows=None if sample_buckets is None else sampled_rows,
         )
 
     def execute(self):
@@ -264,11 +319,16 @@ class ValueDiffTask(Task, ValueDiffMixin):
             primary_key: Union[str, List[str]] = self.params.primary_key
             model: str = self.params.model
             columns: List[str] = self.params.columns
+            sample_percent: Optional[float] = self.params.sample_percent
 
-            self._verify_primary_key(dbt_adapter, primary_key, model)
+            self._verify_primary_key(
+                dbt_adapter, primary_key, model, sample_threshold=_sample_threshold(_sample_buckets(sample_percent))
+            )
             self.check_cancel()
 
-            return self._query_value_diff(dbt_adapter, primary_key, model, columns=columns)
+            return self._query_value_diff(
+                dbt_adapter, primary_key, model, columns=columns, sample_percent=sample_percent
+            )
 
     def cancel(self):
         super().cancel()
@@ -298,7 +358,7 @@ class ValueDiffTaskResultDiffer(TaskResultDiffer):
 
         row_data = result.get("data", {}).get("data", [])
         for row in row_data:
-            column, matched, matched_p = row
+            column, matched, matched_p = row[:3]
             if float(matched_p) < 1.0:
                 # if there is any mismatched, we consider it as changed
                 is_changed = True
@@ -336,6 +396,7 @@ class ValueDiffDetailTask(Task, ValueDiffMixin):
         primary_key: Union[str, List[str]],
         model: str,
         columns: List[str] = None,
+        sample_threshold: Optional[str] = None,
     ):
         composite = True if isinstance(primary_key, List) else False
 
@@ -352,13 +413,22 @@ class ValueDiffDetailTask(Task, ValueDiffMixin):
             if primary_key not in columns:
                 columns.insert(0, primary_key)
 
-        sql_template = r"""
+        # When sampling, only the rows of the keys in the sampled buckets are compared
+        sql_template = (
+            SURROGATE_KEY_JINJA
+            + r"""
         with a_query as (
             select {{ columns | join(',\n') }} from {{ base_relation }}
+            """
+            + SAMPLE_FILTER_JINJA
+            + r"""
         ),
 
         b_query as (
             select {{ columns | join(',\n') }} from {{ curr_relation }}
+            """
+            + SAMPLE_FILTER_JINJA
+            + r"""
         ),
 
         a_intersect_b as (
@@ -408,6 +478,7 @@ class ValueDiffDetailTask(Task, ValueDiffMixin):
         order by {{ primary_keys | join(',\n') }}, in_a desc, in_b desc
         limit {{ limit }}
         """
+        )
 
         sql = dbt_adapter.generate_sql(
             sql_template,
@@ -417,6 +488,7 @@ class ValueDiffDetailTask(Task, ValueDiffMixin):
                 primary_keys=primary_key if composite else [primary_key],
                 columns=columns,
                 limit=1000,
+                sample_threshold=sample_threshold,
             ),
         )
 
@@ -436,11 +508,12 @@ class ValueDiffDetailTask(Task, ValueDiffMixin):
             primary_key: Union[str, List[str]] = self.params.primary_key
             model: str = self.params.model
             columns: List[str] = self.params.columns
+            sample_threshold = _sample_threshold(_sample_buckets(self.params.sample_percent))
 
-            self._verify_primary_key(dbt_adapter, primary_key, model)
+            self._verify_primary_key(dbt_adapter, primary_key, model, sample_threshold=sample_threshold)
             self.check_cancel()
 
-            return self._query_value_diff(dbt_adapter, primary_key, model, columns)
+            return self._query_value_diff(dbt_adapter, primary_key, model, columns, sample_threshold=sample_threshold)
 
     def cancel(self):
         from recce.adapter.dbt_adapter import DbtAdapter
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional, Union
+
+import sqlglot.expressions as exp
+from sqlglot import Dialect, parse_one
+from sqlglot.optimizer.qualify import qualify
+
+from recce.util.cache import LRUCache
+
+DEFAULT_AST_CACHE_SIZE = 256
+
+DialectType = Union[str, Dialect, None]
+
+
+class AstCache:
+    """
+    A bounded cache of parsed and qualified sqlglot expressions shared by the column-level lineage and the breaking
+    change analysis, so that each compiled SQL is parsed and qualified at most once per process.
+
+    The cache keeps the original expressions and hands out copies, so callers are free to mutate the result. Errors
+    are cached as well, and each lookup raises a new exception of the same type and arguments.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_AST_CACHE_SIZE):
+        self._cache = LRUCache(capacity=capacity)
+        self._lock = threading.Lock()
+        self._computing: Dict[Any, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, sql: str, dialect: DialectType = None) -> exp.Expression:
+        key = ("parse", _hash(sql), _dialect_key(dialect))
+        return self._get_or_compute(key, lambda: (parse_one(sql, dialect=_get_dialect(dialect)), None))
+
+    def qualify(
+        self,
+        sql: str,
+        dialect: DialectType = None,
+        schema: Optional[dict] = None,
+        allow_partial: bool = False,
+    ) -> exp.Expression:
+        """
+        Return a copy of the parsed and qualified expression.
+
+        If qualifying fails, the error is raised unless `allow_partial` is set, in which case the expression as left by
+        the failed `qualify` is returned. Parse errors are always raised.
+        """
+
+        def _qualify():
+            expression = self.parse(sql, dialect)
+            try:
+                return qualify(expression, schema=schema, dialect=_get_dialect(dialect)), None
+            except Exception as e:
+                return expression, e
+
+        key = ("qualify", _hash(sql), _dialect_key(dialect), _hash(json.dumps(schema, sort_keys=True, default=str)))
+        return self._get_or_compute(key, _qualify, allow_partial=allow_partial)
+
+    def _get_or_compute(self, key, compute, allow_partial: bool = False) -> exp.Expression:
+        while True:
+            with self._lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    break
+                # Only one thread computes a key. The others wait for it and then look the key up again.
+                computing = self._computing.get(key)
+                if computing is None:
+                    computing = self._computing[key] = threading.Event()
+                    owner = True
+                else:
+                    owner = False
+            if not owner:
+                computing.wait()
+                continue
+
+            try:
+                try:
+                    expression, error = compute()
+                except Exception as e:
+                    expression, error = None, e
+                entry = (expression, _CachedError(error) if error is not None else None)
+                with self._lock:
+                    self.misses += 1
+                    self._cache.put(key, entry)
+            finally:
+                with self._lock:
+                    del self._computing[key]
+                computing.set()
+            break
+
+        expression, error = entry
+        if error is not None and (not allow_partial or expression is None):
+            raise error.create()
+        return expression.copy()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class _CachedError:
+    """
+    The type, arguments and attributes of an exception, without its traceback, so it can be raised again as a new
+    exception on each lookup and in several threads at once.
+    """
+
+    def __init__(self, error: Exception):
+        self.error_type = type(error)
+        self.args = error.args
+        self.attributes = dict(getattr(error, "__dict__", {}))
+
+    def create(self) -> Exception:
+        # Bypass `__init__`, whose signature may differ from the arguments kept in `args`
+        error = self.error_type.__new__(self.error_type, *self.args)
+        error.args = self.args
+        error.__dict__.update(self.attributes)
+        return error
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _dialect_key(dialect: DialectType) -> Optional[str]:
+    if dialect is None or isinstance(dialect, str):
+        return dialect
+    if isinstance(dialect, type):
+        return dialect.__name__
+    return type(dialect).__name__
+
+
+def _get_dialect(dialect: DialectType) -> Optional[Dialect]:
+    return Dialect.get(dialect) if dialect is not None else None
+
+
+ast_cache = AstCache()
@@ -1,14 +1,14 @@
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 import sqlglot.expressions as exp
-from sqlglot import Dialect, parse_one
 from sqlglot.errors import SqlglotError
 from sqlglot.optimizer import Scope, traverse_scope
-from sqlglot.optimizer.qualify import qualify
 
 from recce.models.types import ChangeStatus, NodeChange
+from recce.util.ast_cache import ast_cache
+from recce.util.pydantic_model import pydantic_model_dump
 
 CHANGE_CATEGORY_UNKNOWN = NodeChange(category="unknown")
 CHANGE_CATEGORY_BREAKING = NodeChange(category="breaking")
@@ -46,10 +46,16 @@ class BreakingPerformanceTracking:
     def increment_other_error_nodes(self):
         self.other_error_nodes += 1
 
+    def nodes_per_second(self) -> Optional[float]:
+        if not self.lineage_diff_elapsed:
+            return None
+        return self.modified_nodes * 1000 / self.lineage_diff_elapsed
+
     def to_dict(self):
         return {
             "lineage_diff_elapsed_ms": self.lineage_diff_elapsed,
             "modified_nodes": self.modified_nodes,
+            "modified_nodes_per_second": self.nodes_per_second(),
             "sqlglot_error_nodes": self.sqlglot_error_nodes,
             "other_error_nodes": self.other_error_nodes,
             "checkpoints": self.checkpoints,
@@ -270,17 +276,12 @@ def parse_change_category(
         return NodeChange(category="non_breaking")
 
     try:
-        dialect = Dialect.get(dialect)
 
         def _parse(sql, schema):
-            exp = parse_one(sql, dialect=dialect)
             if schema:
-                try:
-                    exp = qualify(exp, schema=schema, dialect=dialect)
-                except Exception:
-                    # cannot optimize, skip it.
-                    pass
-            return exp
+                # cannot optimize, use the partially qualified expression.
+                return ast_cache.qualify(sql, dialect=dialect, schema=schema, allow_partial=True)
+            return ast_cache.parse(sql, dialect=dialect)
 
         old_exp = _parse(old_sql, old_schema)
         new_exp = _parse(new_sql, new_schema)
@@ -328,3 +329,41 @@ def parse_change_category(
             return result
 
     return result
+
+
+def parse_change_category_worker(args: Tuple) -> Tuple[NodeChange, Optional[str]]:
+    """
+    Run `parse_change_category` for one `(old_sql, new_sql, old_schema, new_schema, dialect)` job in a worker process.
+
+    Returns the change with the error kind ("sqlglot" or "other") if parsing failed, so that the caller can count it.
+    """
+    old_sql, new_sql, old_schema, new_schema, dialect = args
+    perf_tracking = BreakingPerformanceTracking()
+    try:
+        change = parse_change_category(
+            old_sql,
+            new_sql,
+            old_schema=old_schema,
+            new_schema=new_schema,
+            dialect=dialect,
+            perf_tracking=perf_tracking,
+        )
+    except Exception:
+        return CHANGE_CATEGORY_UNKNOWN, "other"
+
+    if perf_tracking.sqlglot_error_nodes:
+        return change, "sqlglot"
+    if perf_tracking.other_error_nodes:
+        return change, "other"
+    return change, None
+
+
+def dump_change_category_outcome(outcome: Tuple[NodeChange, Optional[str]]) -> dict:
+    """Convert the outcome of `parse_change_category_worker` to a JSON-serializable dict"""
+    change, error = outcome
+    return {"change": pydantic_model_dump(change), "error": error}
+
+
+def load_change_category_outcome(data: dict) -> Tuple[NodeChange, Optional[str]]:
+    """Convert the output of `dump_change_category_outcome` back to the outcome of `parse_change_category_worker`"""
+    return NodeChange(**data["change"]), data["error"]
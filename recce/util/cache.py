@@ -1,5 +1,14 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
 from collections import OrderedDict
-from typing import Any
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("uvicorn")
 
 
 class LRUCache(object):
@@ -21,5 +30,159 @@ class LRUCache(object):
             self.cache.popitem(last=False)
         self.cache[key] = value
 
+    def pop(self, key) -> Any:
+        return self.cache.pop(key, None)
+
     def clear(self):
         self.cache.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self.cache
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+
+class TTLCache(object):
+    """
+    A thread-safe LRU cache whose entries also expire `ttl` seconds after they are put.
+    """
+
+    def __init__(self, capacity: int = 128, ttl: float = 300, timer: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.timer = timer
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key) -> Any:
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.timer():
+                del self.cache[key]
+                return None
+            self.cache.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.capacity:
+                self.cache.popitem(last=False)
+            self.cache[key] = (self.timer() + self.ttl, value)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+
+# Entries of the disk cache that are not used for this long are removed
+DISK_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+class DiskCache(object):
+    """
+    A content-addressed cache of JSON values on disk.
+
+    The key is the SHA-256 of the JSON-encoded key parts and the salt, so the cache can be shared between processes
+    and machines. Any change of the salt (e.g. the recce version) invalidates all the entries. Unreadable entries are
+    treated as misses and write errors are ignored.
+
+    A hit refreshes the modification time of the entry. The first write of a process to a namespace removes the
+    entries that have not been used for `max_age` seconds, such as the ones left by other salts after an upgrade.
+    """
+
+    # The namespace directories already pruned by this process
+    _pruned = set()
+    _pruned_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: str,
+        namespace: str,
+        salt: str = "",
+        max_age: Optional[float] = DISK_CACHE_MAX_AGE,
+        timer: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = os.path.join(cache_dir, namespace)
+        self.salt = salt
+        self.max_age = max_age
+        self.timer = timer
+
+    def _hash(self, key_parts) -> str:
+        payload = json.dumps([self.salt, key_parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    def get(self, key_parts) -> Optional[Any]:
+        path = self._path(self._hash(key_parts))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Failed to read the cache entry {path}: {e}")
+            return None
+        try:
+            # Keep the entry from being pruned while it is used
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key_parts, value: Any):
+        self._prune_once()
+        path = self._path(self._hash(key_parts))
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so that readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Failed to write the cache entry {path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _prune_once(self):
+        with DiskCache._pruned_lock:
+            if self.cache_dir in DiskCache._pruned:
+                return
+            DiskCache._pruned.add(self.cache_dir)
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Remove the entries, and the leftover temporary files, that have not been used for `max_age` seconds. Return
+        the number of removed files.
+        """
+        if self.max_age is None or not os.path.isdir(self.cache_dir):
+            return 0
+        expired_before = self.timer() - self.max_age
+        removed = 0
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            try:
+                for entry in os.scandir(shard.path):
+                    if entry.is_file() and entry.stat().st_mtime < expired_before:
+                        os.remove(entry.path)
+                        removed += 1
+                if not os.listdir(shard.path):
+                    os.rmdir(shard.path)
+            except OSError as e:
+                # Another process may prune or write the same directory
+                logger.debug(f"Failed to prune the cache directory {shard.path}: {e}")
+        return removed
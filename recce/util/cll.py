@@ -3,13 +3,13 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import sqlglot.expressions as exp
-from sqlglot import Dialect, parse_one
-from sqlglot.errors import OptimizeError, SqlglotError
+from sqlglot.errors import OptimizeError, ParseError, SqlglotError, TokenError
 from sqlglot.optimizer import Scope, traverse_scope
-from sqlglot.optimizer.qualify import qualify
 
 from recce.exceptions import RecceException
 from recce.models.types import CllColumn, CllColumnDep
+from recce.util.ast_cache import ast_cache
+from recce.util.pydantic_model import pydantic_model_dump
 
 CllResult = Tuple[
     List[CllColumnDep],  # Model to column dependencies
@@ -323,15 +323,10 @@ def cll(sql, schema=None, dialect=None) -> CllResult:
     #     }
     # }
 
-    dialect = Dialect.get(dialect) if dialect is not None else None
-
     try:
-        expression = parse_one(sql, dialect=dialect)
-    except SqlglotError as e:
+        expression = ast_cache.qualify(sql, dialect=dialect, schema=schema)
+    except (ParseError, TokenError) as e:
         raise RecceException(f"Failed to parse SQL: {str(e)}")
-
-    try:
-        expression = qualify(expression, schema=schema, dialect=dialect)
     except OptimizeError as e:
         raise RecceException(f"Failed to optimize SQL: {str(e)}")
     except SqlglotError as e:
@@ -353,3 +348,40 @@ def cll(sql, schema=None, dialect=None) -> CllResult:
     if result is None:
         raise RecceException("Failed to extract CLL from SQL")
     return result
+
+
+def cll_worker(args: Tuple[str, Optional[dict], Optional[str]]) -> Tuple[Optional[CllResult], Optional[str]]:
+    """
+    Run `cll` for one `(sql, schema, dialect)` job in a worker process.
+
+    Failures are returned as an error kind ("sqlglot" or "other") instead of being raised, so the parent process
+    never has to unpickle arbitrary exception types.
+    """
+    sql, schema, dialect = args
+    try:
+        return cll(sql, schema=schema, dialect=dialect), None
+    except RecceException:
+        return None, "sqlglot"
+    except Exception:
+        return None, "other"
+
+
+def dump_cll_outcome(outcome: Tuple[Optional[CllResult], Optional[str]]) -> dict:
+    """Convert the outcome of `cll_worker` to a JSON-serializable dict"""
+    result, error = outcome
+    if result is None:
+        return {"error": error}
+    m2c, c2c_map = result
+    return {
+        "m2c": [pydantic_model_dump(d) for d in m2c],
+        "c2c": {name: pydantic_model_dump(column) for name, column in c2c_map.items()},
+    }
+
+
+def load_cll_outcome(data: dict) -> Tuple[Optional[CllResult], Optional[str]]:
+    """Convert the output of `dump_cll_outcome` back to the outcome of `cll_worker`"""
+    if "error" in data:
+        return None, data["error"]
+    m2c = [CllColumnDep(**d) for d in data["m2c"]]
+    c2c_map = {name: CllColumn(**column) for name, column in data["c2c"].items()}
+    return (m2c, c2c_map), None
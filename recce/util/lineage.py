@@ -1,7 +1,13 @@
-from typing import Dict, Iterable, Set, Tuple
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from recce.models.types import CllColumn, CllNode
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def find_upstream(node_ids: Iterable, parent_map):
     visited = set()
@@ -39,6 +45,122 @@ def find_downstream(node_ids: Iterable, child_map):
     return downstream
 
 
+class GraphIndex:
+    """
+    A compact, read-only index of a dependency graph for repeated upstream and downstream closure queries.
+
+    Node ids (model ids or column keys) are interned to consecutive integers and the edges are stored as CSR-style
+    offset and target arrays. With numpy installed, a closure is computed level by level with array operations;
+    otherwise it falls back to a traversal over the integer arrays. The closures are the same as `find_upstream`
+    and `find_downstream` over the original maps.
+    """
+
+    def __init__(self, parent_map: Dict[str, Iterable[str]], child_map: Optional[Dict[str, Iterable[str]]] = None):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        parent_sources, parent_targets = self._intern_edges(parent_map)
+        if child_map is None:
+            child_sources, child_targets = parent_targets, parent_sources
+        else:
+            child_sources, child_targets = self._intern_edges(child_map)
+
+        self._parent_offsets, self._parents = _build_csr(len(self.ids), parent_sources, parent_targets)
+        self._child_offsets, self._children = _build_csr(len(self.ids), child_sources, child_targets)
+        self._id_array = np.array(self.ids, dtype=object) if np is not None else None
+
+    def _intern_edges(self, adjacency: Dict[str, Iterable[str]]) -> Tuple[List[int], List[int]]:
+        index = self.index
+        ids = self.ids
+        sources = []
+        targets = []
+        for node_id, neighbors in adjacency.items():
+            for node in (node_id, *neighbors):
+                if node not in index:
+                    index[node] = len(ids)
+                    ids.append(node)
+            source = index[node_id]
+            for neighbor in neighbors:
+                sources.append(source)
+                targets.append(index[neighbor])
+        return sources, targets
+
+    def __len__(self):
+        return len(self.ids)
+
+    def find_upstream(self, node_ids: Iterable[str]) -> Set[str]:
+        return self._closure(node_ids, self._parent_offsets, self._parents)
+
+    def find_downstream(self, node_ids: Iterable[str]) -> Set[str]:
+        return self._closure(node_ids, self._child_offsets, self._children)
+
+    def _closure(self, node_ids: Iterable[str], offsets, targets) -> Set[str]:
+        start = [self.index[n] for n in node_ids if n in self.index]
+        if np is not None:
+            return set(self._id_array[_closure_vectorized(len(self.ids), start, offsets, targets)].tolist())
+
+        visited = bytearray(len(self.ids))
+        reached = bytearray(len(self.ids))
+        result = []
+        stack = start
+        while stack:
+            current = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            for target in targets[offsets[current] : offsets[current + 1]]:
+                if not reached[target]:
+                    reached[target] = 1
+                    result.append(target)
+                    stack.append(target)
+
+        ids = self.ids
+        return {ids[i] for i in result}
+
+
+def _build_csr(size: int, sources: List[int], targets: List[int]):
+    if np is not None:
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=size), out=offsets[1:])
+        return offsets, np.asarray(targets, dtype=np.int64)[order]
+
+    offsets = array("q", bytes(8 * (size + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+
+    csr_targets = array("q", bytes(8 * len(targets)))
+    cursor = offsets[:-1]
+    for source, target in zip(sources, targets):
+        csr_targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, csr_targets
+
+
+def _closure_vectorized(size: int, start: List[int], offsets, targets):
+    # Breadth-first search where each level expands the whole frontier at once
+    expanded = np.zeros(size, dtype=bool)
+    reached = np.zeros(size, dtype=bool)
+    frontier = np.unique(np.asarray(start, dtype=np.int64))
+    while frontier.size:
+        expanded[frontier] = True
+        begins = offsets[frontier]
+        lengths = offsets[frontier + 1] - begins
+        total = int(lengths.sum())
+        if total == 0:
+            break
+        # The positions of all the edges of the frontier in `targets`
+        positions = np.repeat(begins - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        neighbors = np.unique(targets[positions])
+        neighbors = neighbors[~reached[neighbors]]
+        reached[neighbors] = True
+        frontier = neighbors[~expanded[neighbors]]
+    return np.flatnonzero(reached)
+
+
 def find_column_dependencies(node_column_id: str, parent_map: Dict, child_map: Dict) -> Tuple[Set, Set]:
     upstream_cols = find_upstream([node_column_id], parent_map)
     downstream_cols = find_downstream([node_column_id], child_map)
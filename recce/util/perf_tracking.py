@@ -14,6 +14,7 @@ class LineagePerfTracker:
     cll_nodes = 0
     change_analysis_nodes = 0
     anchor_nodes = None
+    manifest_serializations_avoided = 0
 
     params = None
 
@@ -48,6 +49,9 @@ class LineagePerfTracker:
     def increment_change_analysis_nodes(self):
         self.change_analysis_nodes += 1
 
+    def increment_manifest_serializations_avoided(self):
+        self.manifest_serializations_avoided += 1
+
     def set_params(self, has_node, has_column, change_analysis, no_cll, no_upstream, no_downstream):
         self.params = {
             "has_node": has_node,
@@ -67,6 +71,7 @@ class LineagePerfTracker:
             "cll_nodes": self.cll_nodes,
             "change_analysis_nodes": self.change_analysis_nodes,
             "anchor_nodes": self.anchor_nodes,
+            "manifest_serializations_avoided": self.manifest_serializations_avoided,
             "params": self.params,
         }
 
@@ -81,5 +86,6 @@ class LineagePerfTracker:
         self.change_analysis_nodes = 0
         self.cll_nodes = 0
         self.anchor_nodes = 0
+        self.manifest_serializations_avoided = 0
 
         self.params = None
@@ -55,6 +55,9 @@ setup(
         "mcp": [
             "mcp>=1.0.0",
         ],
+        "arrow": [
+            "pyarrow",
+        ],
         "dev": [
             "pytest>=4.6",
             "pytest-asyncio",
@@ -68,6 +71,7 @@ setup(
             "twine",
             "tox",
             "pandas",
+            "pyarrow",
             "httpx",
         ],
     },
@@ -1,3 +1,8 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 from recce.adapter.dbt_adapter import DbtAdapter, dbt_supported_registry
 
 
@@ -23,3 +28,192 @@ def test_dbt_adapter_support_tasks_without_required_dbt_package(dbt_test_helper)
     for task_type in dbt_supported_registry:
         task = task_type.value
         assert task in support_tasks
+
+
+def test_manifest_dict_is_memoized(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    dbt_test_helper.create_model("customers", curr_csv="customer_id\n1\n", base_csv="customer_id\n1\n")
+
+    manifest_dict = adapter.get_manifest_dict(base=False)
+    assert adapter.get_manifest_dict(base=False) is manifest_dict
+    assert adapter.get_manifest_dict(base=True) is not manifest_dict
+    assert "customers" in manifest_dict["nodes"]
+
+    # Replacing the artifacts must invalidate the memoized view
+    dbt_test_helper.create_model("orders", curr_csv="order_id\n1\n")
+    new_manifest_dict = adapter.get_manifest_dict(base=False)
+    assert new_manifest_dict is not manifest_dict
+    assert "orders" in new_manifest_dict["nodes"]
+    assert "orders" not in adapter.get_manifest_dict(base=True)["nodes"]
+
+
+def test_lineage_does_not_share_the_memoized_manifest_dict(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    dbt_test_helper.create_model("customers", curr_csv="customer_id\n1\n", base_csv="customer_id\n1\n")
+
+    manifest_dict = adapter.get_manifest_dict(base=False)
+    lineage = adapter.get_lineage(base=False)
+    lineage["nodes"]["customers"]["config"]["materialized"] = "changed"
+    assert manifest_dict["nodes"]["customers"]["config"]["materialized"] != "changed"
+
+
+def test_manifest_index(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    dbt_test_helper.create_model(
+        "customers", curr_sql="select 1 as customer_id", unique_id="model.recce_test.customers"
+    )
+    dbt_test_helper.create_model(
+        "customers", curr_sql="select 1 as customer_id", unique_id="model.other_pkg.customers", package_name="other_pkg"
+    )
+    dbt_test_helper.create_source("raw", "orders", curr_csv="order_id\n1\n")
+
+    index = adapter.get_manifest_index(base=False)
+    assert adapter.get_manifest_index(base=False) is index
+    assert adapter.find_node_by_name("customers").unique_id == "model.recce_test.customers"
+    assert adapter.find_node_by_name("customers", base=True) is None
+    assert index.resolve_ref("customers", package_name="other_pkg").unique_id == "model.other_pkg.customers"
+    assert index.resolve_ref("customers", package_name="unknown_pkg") is None
+    assert index.resolve_source("raw", "orders").unique_id == "source.recce_test.raw.orders"
+    assert index.resolve_source("raw", "customers") is None
+
+    # Only the index of the replaced manifest is rebuilt
+    base_index = adapter.get_manifest_index(base=True)
+    adapter.curr_manifest = dbt_test_helper.curr_manifest.writable_manifest()
+    assert adapter.get_manifest_index(base=False) is not index
+    assert adapter.get_manifest_index(base=True) is base_index
+
+
+def test_runtime_manifest_is_shared(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    dbt_test_helper.create_model("customers", curr_sql="select 1 as customer_id", base_sql="select 1 as customer_id")
+
+    manifest = adapter.get_runtime_manifest(base=False)
+    assert adapter.get_runtime_manifest(base=False) is manifest
+    assert adapter.get_runtime_manifest(base=True) is not manifest
+
+    num_nodes = len(manifest.nodes)
+    sql = adapter.generate_sql('select * from {{ ref("customers") }}')
+    assert "customers" in sql
+    # The generated node must not leak into the shared manifest
+    assert len(manifest.nodes) == num_nodes
+
+    dbt_test_helper.create_model("orders", curr_sql="select 1 as order_id")
+    assert "orders" in [node.name for node in adapter.get_runtime_manifest(base=False).nodes.values()]
+    # The current manifest of the adapter is the runtime manifest, so it is converted only once
+    assert adapter.get_runtime_manifest(base=False) is adapter.manifest
+
+
+def test_generate_sql_concurrently(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    dbt_test_helper.create_model("customers", curr_sql="select 1 as customer_id", base_sql="select 1 as customer_id")
+    dbt_test_helper.create_model("orders", curr_sql="select 1 as order_id", base_sql="select 1 as order_id")
+    manifests = [adapter.get_runtime_manifest(base=False), adapter.get_runtime_manifest(base=True)]
+    num_nodes = [len(m.nodes) for m in manifests]
+
+    from dbt.clients import jinja
+
+    get_rendered = jinja.get_rendered
+    lock = threading.Lock()
+    leaked = []
+    active = 0
+    max_active = 0
+
+    def _get_rendered(*args, **kwargs):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        # The generated nodes never appear in the shared manifests, and other threads render in the meantime
+        leaked.extend(n for m in manifests for n in list(m.nodes) if ".generated_" in n)
+        time.sleep(0.01)
+        try:
+            return get_rendered(*args, **kwargs)
+        finally:
+            with lock:
+                active -= 1
+
+    def _generate(i):
+        model = "customers" if i % 2 == 0 else "orders"
+        base = i % 3 == 0
+        sql = adapter.generate_sql(f'select {i} as i from {{{{ ref("{model}") }}}}', base=base)
+        return i, model, base, sql
+
+    with patch.object(jinja, "get_rendered", side_effect=_get_rendered):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_generate, range(64)))
+
+    assert leaked == []
+    assert max_active > 1
+
+    for i, model, base, sql in results:
+        schema = dbt_test_helper.base_schema if base else dbt_test_helper.curr_schema
+        assert f"select {i} as i from" in sql
+        assert model in sql
+        assert schema in sql
+    # No generated node is left in the shared manifests
+    assert [len(m.nodes) for m in manifests] == num_nodes
+
+
+def test_query_cache(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    dbt_test_helper.create_model("customers", curr_csv="customer_id\n1\n2\n", base_csv="customer_id\n1\n")
+    sql = f"select count(*) from {dbt_test_helper.curr_schema}.customers"
+
+    def _execute(sql):
+        with adapter.connection_named("test"):
+            return adapter.execute(sql, fetch=True)
+
+    # Disabled by default
+    _execute(sql)
+    assert adapter._query_cache is None
+
+    adapter.query_cache_ttl = 60
+    with patch.object(adapter.adapter, "execute", wraps=adapter.adapter.execute) as mock_execute:
+        _, table = _execute(sql)
+        _, cached = _execute(sql)
+        assert cached is table
+        assert mock_execute.call_count == 1
+
+        # Statements that are not queries are never cached
+        _execute(f"create table {dbt_test_helper.curr_schema}.t as select 1 as a")
+        _execute(f"create table {dbt_test_helper.curr_schema}.t2 as select 1 as a")
+        assert mock_execute.call_count == 3
+        assert len(adapter._query_cache) == 1
+
+        # Reloading the artifacts drops the cached results
+        dbt_test_helper.create_model("orders", curr_csv="order_id\n1\n")
+        call_count = mock_execute.call_count
+        _execute(sql)
+        assert mock_execute.call_count == call_count + 1
+
+        # Unless the invalidation is disabled
+        adapter.query_cache_invalidate_on_refresh = False
+        dbt_test_helper.create_model("payments", curr_csv="payment_id\n1\n")
+        call_count = mock_execute.call_count
+        _execute(sql)
+        assert mock_execute.call_count == call_count
+
+
+def test_max_concurrent_statements(dbt_test_helper):
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    sql = "select 1"
+
+    # No limit by default
+    with adapter.connection_named("test"):
+        adapter.execute(sql, fetch=True)
+    assert adapter._statement_semaphore is None
+
+    adapter.max_concurrent_statements = 1
+    with adapter.connection_named("test"):
+        adapter.execute(sql, fetch=True)
+    semaphore = adapter._statement_semaphore
+    assert semaphore is not None
+
+    # The statement waits for a free slot
+    semaphore.acquire()
+    try:
+        assert not semaphore.acquire(blocking=False)
+    finally:
+        semaphore.release()
+    with adapter.connection_named("test"):
+        adapter.execute(sql, fetch=True)
@@ -1,3 +1,8 @@
+import os
+from unittest.mock import patch
+
+from dbt.contracts.files import FileHash
+
 from recce.adapter.dbt_adapter import DbtAdapter
 from recce.models.types import CllData
 from recce.util.lineage import build_column_key
@@ -715,3 +720,181 @@ def test_impact_radius_by_node_with_cll_2(dbt_test_helper):
     assert_column(result, "model.model4", "y", transformation_type="passthrough", parents=[("model.model2", "y")])
     assert_cll_contain_nodes(result, ["model.model2", "model.model3", "model.model4"])
     assert_cll_contain_columns(result, [("model.model2", "d"), ("model.model2", "y"), ("model.model4", "y")])
+
+
+def test_cll_parallel(dbt_test_helper, monkeypatch):
+    dbt_test_helper.create_model(
+        "model1", unique_id="model.model1", curr_sql="select 1 as c", curr_columns={"c": "int"}
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c, 2025 as y from {{ ref("model1") }}',
+        curr_columns={"c": "int", "y": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3",
+        unique_id="model.model3",
+        curr_sql="this is not a valid sql",
+        curr_columns={"c": "int"},
+        depends_on=["model.model2"],
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    node_ids = ["model.model1", "model.model2", "model.model3"]
+    serial = {node_id: adapter.get_cll_cached(node_id) for node_id in node_ids}
+
+    adapter._cll_cache.clear()
+    monkeypatch.setattr("recce.adapter.dbt_adapter.PROCESS_POOL_MIN_NODES", 1)
+    adapter.cll_workers = 2
+    try:
+        parallel = adapter.get_cll_cached_many(node_ids)
+    finally:
+        adapter._shutdown_process_pool()
+
+    assert parallel == serial
+    assert adapter.get_cll_cached("model.model2") is parallel["model.model2"]
+    assert_column(parallel["model.model2"], "model.model2", "c", "passthrough", parents=[("model.model1", "c")])
+    assert_column(parallel["model.model3"], "model.model3", "c", "unknown", parents=[])
+
+
+def test_analyze_modified_nodes_parallel(dbt_test_helper, monkeypatch):
+    dbt_test_helper.create_model(
+        "model1",
+        unique_id="model.model1",
+        curr_sql="select 1 as c, 2 as d",
+        base_sql="select 1 as c",
+        curr_columns={"c": "int", "d": "int"},
+        base_columns={"c": "int"},
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c from {{ ref("model1") }} where c > 0',
+        base_sql='select c from {{ ref("model1") }}',
+        curr_columns={"c": "int"},
+        base_columns={"c": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3",
+        unique_id="model.model3",
+        curr_sql="this is not a valid sql",
+        base_sql="select 1 as c",
+        curr_columns={"c": "int"},
+        base_columns={"c": "int"},
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    serial = adapter.analyze_modified_nodes()
+    serial = {node_id: (nd.change.category, nd.change.columns) for node_id, nd in serial.items()}
+    assert serial["model.model1"] == ("non_breaking", {"d": "added"})
+    assert serial["model.model2"][0] == "breaking"
+    assert serial["model.model3"][0] == "unknown"
+
+    adapter._change_analysis_cache.clear()
+    monkeypatch.setattr("recce.adapter.dbt_adapter.PROCESS_POOL_MIN_NODES", 1)
+    adapter.cll_workers = 2
+    try:
+        parallel = adapter.analyze_modified_nodes()
+    finally:
+        adapter._shutdown_process_pool()
+
+    assert {node_id: (nd.change.category, nd.change.columns) for node_id, nd in parallel.items()} == serial
+    assert adapter.get_change_analysis_cached("model.model2") is parallel["model.model2"]
+
+
+def test_cll_disk_cache(dbt_test_helper, tmp_path):
+    dbt_test_helper.create_model(
+        "model1", unique_id="model.model1", curr_sql="select 1 as c", curr_columns={"c": "int"}
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c from {{ ref("model1") }}',
+        curr_columns={"c": "int"},
+        depends_on=["model.model1"],
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    adapter.cache_dir = str(tmp_path)
+    result = adapter.get_cll_cached("model.model2")
+    assert os.listdir(tmp_path / "cll")
+
+    # A new process would only have the disk cache
+    adapter._cll_cache.clear()
+    with patch("recce.adapter.dbt_adapter.cll_worker") as mock_cll_worker:
+        cached = adapter.get_cll_cached("model.model2")
+        mock_cll_worker.assert_not_called()
+    assert cached == result
+    assert_column(cached, "model.model2", "c", "passthrough", parents=[("model.model1", "c")])
+
+
+def test_cll_refresh_invalidates_changed_nodes(dbt_test_helper, tmp_path):
+    dbt_test_helper.create_model(
+        "model1", unique_id="model.model1", curr_sql="select 1 as c", curr_columns={"c": "int"}
+    )
+    dbt_test_helper.create_model(
+        "model2",
+        unique_id="model.model2",
+        curr_sql='select c from {{ ref("model1") }}',
+        curr_columns={"c": "int"},
+        depends_on=["model.model1"],
+    )
+    dbt_test_helper.create_model(
+        "model3", unique_id="model.model3", curr_sql="select 3 as c", curr_columns={"c": "int"}
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    for node_id in ["model.model1", "model.model2", "model.model3"]:
+        adapter.get_cll_cached(node_id)
+
+    # Only model1 changes in the new manifest
+    node = dbt_test_helper.curr_manifest.nodes["model.model1"]
+    node.raw_code = "select 1 as c, 2 as d"
+    node.checksum = FileHash(name="sha256", checksum="changed")
+    target_path = tmp_path / "target"
+    target_path.mkdir()
+    manifest_path = str(target_path / "manifest.json")
+    dbt_test_helper.curr_manifest.writable_manifest().write(manifest_path)
+
+    adapter.target_path = str(target_path)
+    adapter.refresh(manifest_path)
+
+    assert ("model.model1", False) not in adapter._cll_cache
+    assert ("model.model2", False) not in adapter._cll_cache
+    assert ("model.model3", False) in adapter._cll_cache
+    assert adapter.curr_manifest.nodes["model.model1"].raw_code == "select 1 as c, 2 as d"
+
+
+def test_replacing_artifacts_drops_node_caches(dbt_test_helper):
+    dbt_test_helper.create_model(
+        "model1", unique_id="model.model1", curr_sql="select 1 as c", curr_columns={"c": "int"}
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    cll = adapter.get_cll_cached("model.model1")
+    adapter.get_change_analysis_cached("model.model1")
+    assert ("model.model1", False) in adapter._cll_cache
+    assert "model.model1" in adapter._change_analysis_cache
+
+    # Replacing the artifacts, rather than refreshing a single artifact file, drops the cached CLL and change analysis
+    dbt_test_helper.create_model(
+        "model2", unique_id="model.model2", curr_sql="select 2 as c", curr_columns={"c": "int"}
+    )
+    assert ("model.model1", False) not in adapter._cll_cache
+    assert "model.model1" not in adapter._change_analysis_cache
+    assert adapter.get_cll_cached("model.model1") is not cll
+
+
+def test_cll_disk_cache_is_opt_in(dbt_test_helper, tmp_path):
+    dbt_test_helper.create_model(
+        "model1", unique_id="model.model1", curr_sql="select 1 as c", curr_columns={"c": "int"}
+    )
+
+    adapter: DbtAdapter = dbt_test_helper.context.adapter
+    adapter.target_path = str(tmp_path)
+    assert adapter.cache_dir is None
+    adapter.get_cll_cached("model.model1")
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,55 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from recce.apis.run_api import get_run_result_handler
+from recce.models import Run, RunType
+from recce.tasks.dataframe import DataFrame
+from recce.tasks.query import QueryDiffResult
+
+
+def run_async(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def _find_run(run):
+    return patch("recce.apis.run_api.RunDAO.find_run_by_id", return_value=run)
+
+
+def test_get_run_result():
+    df = DataFrame.from_data(columns={"id": "integer"}, data=[(1,), (2,)])
+    run = Run(type=RunType.QUERY_DIFF, result=QueryDiffResult(base=df, current=df).model_dump())
+
+    with _find_run(run):
+        result = run_async(get_run_result_handler(run.run_id, format="columnar", part="base"))
+        assert result["data"] == [[1, 2]]
+
+        # The result is not a data frame
+        with pytest.raises(HTTPException) as e:
+            run_async(get_run_result_handler(run.run_id, format="columnar", part=None))
+        assert e.value.status_code == 400
+
+    # The result of a run that just finished is the task's model
+    run.result = QueryDiffResult(base=df, current=df)
+    with _find_run(run):
+        result = run_async(get_run_result_handler(run.run_id, format="columnar", part="current"))
+        assert result["data"] == [[1, 2]]
+
+    with _find_run(None):
+        with pytest.raises(HTTPException) as e:
+            run_async(get_run_result_handler(run.run_id, format="columnar", part=None))
+        assert e.value.status_code == 404
+
+
+def test_get_run_result_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    df = DataFrame.from_data(columns={"id": "integer"}, data=[(1,), (2,)])
+    run = Run(type=RunType.QUERY, result=df.model_dump())
+    with _find_run(run):
+        response = run_async(get_run_result_handler(run.run_id, format="arrow", part=None))
+    assert response.media_type == "application/vnd.apache.arrow.stream"
+    assert pyarrow.ipc.open_stream(response.body).read_all().column("id").to_pylist() == [1, 2]
@@ -1,7 +1,24 @@
+import asyncio
 import os
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
 from uuid import UUID
 
-from recce.apis.run_func import materialize_run_results
+import pytest
+
+from recce.apis.run_func import (
+    add_run_listener,
+    cancel_run,
+    inflight_runs,
+    materialize_run_results,
+    remove_run_listener,
+    run_events,
+    submit_run,
+    wait_run,
+)
+from recce.core import RecceContext, default_context, set_default_context
+from recce.models.types import RunStatus
 from recce.state import RecceState
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,3 +36,129 @@ def test_materialize_run_results():
 
     result = materialize_run_results(state.runs, nodes=["xyz"])
     assert result == {}
+
+
+class _BlockingTask:
+    def __init__(self, release: threading.Event):
+        self.release = release
+        self.executed = 0
+        self.progress_listener = None
+
+    def execute(self):
+        self.executed += 1
+        self.release.wait(5)
+        return {"base": 1, "curr": 2}
+
+    def cancel(self):
+        pass
+
+
+@pytest.fixture
+def run_context():
+    original = default_context()
+    context = RecceContext(adapter=MagicMock(artifacts_version=0))
+    set_default_context(context)
+    yield context
+    set_default_context(original)
+    inflight_runs.clear()
+    run_events.clear()
+
+
+def test_submit_run_coalesces_identical_runs(run_context):
+    release = threading.Event()
+    task = _BlockingTask(release)
+
+    async def _test():
+        with patch("recce.apis.run_func.create_task", return_value=task):
+            params = {"node_names": ["customers"]}
+            run1, future1 = submit_run("row_count_diff", params)
+            check_id = uuid.uuid4()
+            run2, future2 = submit_run("row_count_diff", dict(params), check_id=check_id)
+            # Different params execute separately
+            run3, future3 = submit_run("row_count_diff", {"node_names": ["orders"]})
+
+            assert future1 is future2
+            assert future1 is not future3
+            assert run1.run_id != run2.run_id
+            assert run2.check_id == check_id
+
+            release.set()
+            await asyncio.gather(future1, future3)
+
+        assert task.executed == 2
+        assert run1.result == run2.result == {"base": 1, "curr": 2}
+        assert run2.status == RunStatus.FINISHED
+        assert inflight_runs == {}
+        assert len(run_context.runs) == 3
+
+        # The same run after the artifacts change executes again
+        with patch("recce.apis.run_func.create_task", return_value=task):
+            run_context.adapter.artifacts_version += 1
+            _, future4 = submit_run("row_count_diff", params)
+            await future4
+        assert task.executed == 3
+
+    asyncio.run(_test())
+
+
+def test_cancel_coalesced_run(run_context):
+    release = threading.Event()
+    task = _BlockingTask(release)
+
+    async def _test():
+        with patch("recce.apis.run_func.create_task", return_value=task):
+            run1, future = submit_run("row_count_diff", {"node_names": ["customers"]})
+            run2, _ = submit_run("row_count_diff", {"node_names": ["customers"]})
+
+            # The other run still waits for the result, so the task keeps running
+            with patch.object(task, "cancel") as task_cancel:
+                cancel_run(run1.run_id)
+                task_cancel.assert_not_called()
+            assert run1.status == RunStatus.CANCELLED
+
+            release.set()
+            await future
+
+        assert run1.result is None
+        assert run1.status == RunStatus.CANCELLED
+        assert run2.status == RunStatus.FINISHED
+
+    asyncio.run(_test())
+
+
+def test_wait_run(run_context):
+    release = threading.Event()
+    task = _BlockingTask(release)
+    events = []
+
+    async def listener(event, run):
+        events.append((event, run.status))
+
+    async def _test():
+        add_run_listener(listener)
+        try:
+            with patch("recce.apis.run_func.create_task", return_value=task):
+                run, future = submit_run("row_count_diff", {"node_names": ["customers"]})
+
+            # Times out while the run is running
+            assert (await wait_run(run, timeout=0.05)).result is None
+
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, release.set)
+            start = loop.time()
+            await wait_run(run, timeout=5)
+            # Returns on completion rather than on the next poll
+            assert loop.time() - start < 1
+            assert run.result == {"base": 1, "curr": 2}
+            assert run.run_id not in run_events
+
+            # A completed run returns right away
+            assert await wait_run(run) is run
+            await future
+            await asyncio.sleep(0)
+        finally:
+            remove_run_listener(listener)
+
+        assert events[-1] == ("completed", RunStatus.FINISHED)
+
+    asyncio.run(_test())
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+
+from recce.apis.run_scheduler import RunPriority, RunScheduler, get_run_priority
+from recce.models import Run, RunType
+
+
+def _blocker():
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        return "blocker"
+
+    return fn, started, release
+
+
+def test_get_run_priority():
+    assert get_run_priority(RunType.QUERY_DIFF) == RunPriority.INTERACTIVE
+    assert get_run_priority(RunType.ROW_COUNT_DIFF) == RunPriority.BATCH
+
+
+def test_run_scheduler_priority_and_queue_position():
+    async def _test():
+        scheduler = RunScheduler(max_workers=1)
+        order = []
+
+        blocker, started, release = _blocker()
+        first = scheduler.submit(Run(type=RunType.QUERY), blocker)
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        batch_run = Run(type=RunType.ROW_COUNT_DIFF)
+        interactive_run = Run(type=RunType.QUERY)
+        batch = scheduler.submit(batch_run, lambda: order.append("batch"), RunPriority.BATCH)
+        interactive = scheduler.submit(interactive_run, lambda: order.append("interactive"))
+
+        # The interactive run jumps ahead of the batch run
+        assert scheduler.queued() == [interactive_run, batch_run]
+        assert batch_run.started_at is None
+        assert interactive_run.queue_position == 1
+        assert batch_run.queue_position == 2
+        assert batch_run.progress["message"] == "Queued at position 2"
+
+        release.set()
+        assert await first == "blocker"
+        await asyncio.gather(batch, interactive)
+        assert order == ["interactive", "batch"]
+        assert batch_run.queue_position is None
+        assert batch_run.started_at >= interactive_run.started_at
+        assert scheduler.queued() == []
+
+    asyncio.run(_test())
+
+
+def test_run_scheduler_keeps_a_worker_for_interactive_runs():
+    async def _test():
+        scheduler = RunScheduler(max_workers=2)
+        assert scheduler.max_batch_workers == 1
+
+        blocker, started, release = _blocker()
+        batch = scheduler.submit(Run(type=RunType.VALUE_DIFF), blocker, RunPriority.BATCH)
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        # The second batch run waits, but an interactive run starts right away
+        second_batch = scheduler.submit(Run(type=RunType.VALUE_DIFF), lambda: "second", RunPriority.BATCH)
+        interactive = scheduler.submit(Run(type=RunType.QUERY), lambda: "interactive")
+        assert await asyncio.wait_for(interactive, 5) == "interactive"
+        assert not second_batch.done()
+
+        release.set()
+        assert await batch == "blocker"
+        assert await second_batch == "second"
+
+    asyncio.run(_test())
+
+
+def test_run_scheduler_cancel_queued_run():
+    async def _test():
+        scheduler = RunScheduler(max_workers=1)
+        blocker, started, release = _blocker()
+        first_run = Run(type=RunType.QUERY)
+        first = scheduler.submit(first_run, blocker)
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        queued_run = Run(type=RunType.QUERY)
+        executed = []
+        queued = scheduler.submit(queued_run, lambda: executed.append(True))
+
+        # A started run cannot be removed from the queue
+        assert not scheduler.cancel(first_run.run_id)
+        assert scheduler.cancel(queued_run.run_id)
+        assert await queued is None
+        assert queued_run.queue_position is None
+
+        release.set()
+        await first
+        assert executed == []
+
+    asyncio.run(_test())
+
+
+def test_run_scheduler_single_worker_runs_batch_runs():
+    async def _test():
+        scheduler = RunScheduler(max_workers=1)
+        # The only worker is not kept for interactive runs, or the batch runs would never start
+        assert scheduler.max_batch_workers == 1
+
+        blocker, started, release = _blocker()
+        batch = scheduler.submit(Run(type=RunType.VALUE_DIFF), blocker, RunPriority.BATCH)
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        # An interactive run waits for the running batch run
+        interactive_run = Run(type=RunType.QUERY)
+        interactive = scheduler.submit(interactive_run, lambda: "interactive")
+        assert interactive_run.queue_position == 1
+        assert not interactive.done()
+
+        release.set()
+        assert await batch == "blocker"
+        assert await asyncio.wait_for(interactive, 5) == "interactive"
+
+    asyncio.run(_test())
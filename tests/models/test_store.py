@@ -0,0 +1,119 @@
+import copy
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from recce.core import RecceContext, set_default_context
+from recce.models import Check, CheckDAO, Run, RunDAO, RunType
+from recce.models.store import RunStore
+
+
+def _runs():
+    check_id = uuid.uuid4()
+    return [
+        Run(type=RunType.QUERY, check_id=check_id),
+        Run(type=RunType.ROW_COUNT_DIFF),
+        Run(type=RunType.QUERY, check_id=check_id),
+    ], check_id
+
+
+def test_run_store_lookups():
+    runs, check_id = _runs()
+    store = RunStore(runs)
+
+    assert store.find("run_id", runs[1].run_id) is runs[1]
+    assert store.find("run_id", str(runs[1].run_id)) is runs[1]
+    assert store.find("run_id", uuid.uuid4()) is None
+    assert store.find_all("check_id", check_id) == [runs[0], runs[2]]
+    assert store.find_all("type", RunType.QUERY) == [runs[0], runs[2]]
+    assert store.find_all("type", "row_count_diff") == [runs[1]]
+
+
+def test_run_store_mutations():
+    runs, check_id = _runs()
+    store = RunStore(runs)
+
+    store.remove(runs[0])
+    assert store.find("run_id", runs[0].run_id) is None
+    assert store.find_all("check_id", check_id) == [runs[2]]
+
+    # Reordering keeps the lookups in list order
+    store.insert(0, runs[0])
+    store.reverse()
+    assert store.find_all("check_id", check_id) == [runs[2], runs[0]]
+
+    del store[0]
+    assert store.find_all("check_id", check_id) == [runs[0]]
+    store.pop()
+    assert store.find_all("type", RunType.QUERY) == []
+
+    store.extend(runs)
+    run = Run(type=RunType.QUERY)
+    store.append(run)
+    run.check_id = check_id
+    assert run not in store.find_all("check_id", check_id)
+    store.reindex("check_id")
+    assert store.find_all("check_id", check_id) == [runs[0], runs[2], run]
+
+    copied = copy.deepcopy(store)
+    assert isinstance(copied, RunStore)
+    assert len(copied.find_all("check_id", check_id)) == 3
+
+    store.clear()
+    assert store.find("run_id", runs[0].run_id) is None
+
+
+def test_dao_use_the_indexes():
+    runs, check_id = _runs()
+    context = RecceContext(runs=runs, checks=[Check(name="check", type=RunType.QUERY, check_id=check_id)])
+    set_default_context(context)
+    try:
+        dao = RunDAO()
+        assert dao.find_run_by_id(runs[1].run_id) is runs[1]
+        assert dao.list_by_check_id(check_id) == [runs[0], runs[2]]
+        assert dao.list(type_filter=RunType.ROW_COUNT_DIFF) == [runs[1]]
+        # A plain list assigned to the context is indexed on first use
+        assert isinstance(context.runs, RunStore)
+
+        dao.set_check_id(runs[1], check_id)
+        assert dao.list_by_check_id(check_id) == runs
+
+        assert dao.delete(runs[0].run_id)
+        assert not dao.delete(runs[0].run_id)
+        assert dao.list_by_check_id(check_id) == [runs[1], runs[2]]
+
+        assert CheckDAO().find_check_by_id(str(check_id)).name == "check"
+        assert CheckDAO().delete(check_id)
+        assert CheckDAO().find_check_by_id(check_id) is None
+    finally:
+        set_default_context(None)
+
+
+def test_run_store_keeps_the_indexes_without_rebuilding():
+    runs, check_id = _runs()
+    store = RunStore(runs)
+
+    with patch.object(store, "reindex", side_effect=AssertionError("rebuilt")):
+        # Removal finds the item by identity, without scanning the list
+        store.remove(runs[1])
+        assert list(store) == [runs[0], runs[2]]
+        with pytest.raises(ValueError):
+            store.remove(runs[1])
+
+        # A moved item goes to its new bucket in list order
+        store.set_attribute(runs[2], "check_id", None)
+        assert store.find_all("check_id", check_id) == [runs[0]]
+        store.set_attribute(runs[2], "check_id", check_id)
+        assert store.find_all("check_id", check_id) == [runs[0], runs[2]]
+        store.set_attribute(runs[0], "check_id", None)
+        store.set_attribute(runs[0], "check_id", check_id)
+        assert store.find_all("check_id", check_id) == [runs[0], runs[2]]
+
+        # An insert takes an order key between its neighbours
+        store.insert(1, runs[1])
+        store.insert(0, Run(type=RunType.QUERY, check_id=check_id))
+        assert list(store)[1:] == [runs[0], runs[1], runs[2]]
+        assert store.find_all("check_id", check_id)[1:] == [runs[0], runs[2]]
+        assert store.pop(0).check_id == check_id
+        assert store.find_all("type", RunType.QUERY) == [runs[0], runs[2]]
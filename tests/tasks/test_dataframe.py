@@ -0,0 +1,132 @@
+import math
+
+import pytest
+
+from recce.tasks.dataframe import DataFrame, DataFrameColumnType
+
+
+def test_to_columnar():
+    df = DataFrame.from_data(
+        columns={"id": "integer", "name": "text"},
+        data=[(1, "Alice"), (2, None)],
+        limit=2,
+        more=True,
+    )
+    df.next_page_token = "token"
+
+    columnar = df.to_columnar()
+    assert columnar["columns"] == [
+        {"key": "id", "name": "id", "type": "integer"},
+        {"key": "name", "name": "name", "type": "text"},
+    ]
+    assert columnar["data"] == [[1, 2], ["Alice", None]]
+    assert columnar["limit"] == 2
+    assert columnar["more"] is True
+    assert columnar["next_page_token"] == "token"
+
+    empty = DataFrame.from_data(columns={"id": "integer"}, data=[])
+    assert empty.to_columnar()["data"] == [[]]
+
+
+def test_from_pandas():
+    pd = pytest.importorskip("pandas")
+
+    pandas_df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "score": [1.5, math.nan],
+            "name": pd.Series(["Alice", None], dtype=object),
+            "active": [True, False],
+            "created_at": pd.to_datetime(["2024-01-01", "2024-02-01"]),
+        }
+    )
+    df = DataFrame.from_pandas(pandas_df, limit=10, more=False)
+    assert [column.type for column in df.columns] == [
+        DataFrameColumnType.INTEGER,
+        DataFrameColumnType.NUMBER,
+        DataFrameColumnType.TEXT,
+        DataFrameColumnType.BOOLEAN,
+        DataFrameColumnType.UNKNOWN,
+    ]
+    # The JSON values of pandas, whether or not pyarrow is installed
+    assert df.data[0] == (1, 1.5, "Alice", True, 1704067200000)
+    assert df.data[1] == (2, None, None, False, 1706745600000)
+    assert df.limit == 10
+    assert df.more is False
+
+
+def test_from_pandas_matches_the_json_values():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    import datetime
+    import json
+    from decimal import Decimal
+
+    pandas_df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, math.nan, math.inf],
+            "nullable_int": pd.array([1, None, 3], dtype="Int64"),
+            "text": pd.Series(["a", None, "c"], dtype=object),
+            "string": pd.Series(["x", "y", None], dtype="string"),
+            "nulls": pd.Series([None, None, None], dtype=object),
+            "timestamp": pd.to_datetime(["1969-12-31 23:59:59.9995", "2024-01-02 03:04:05.123999", None]),
+            "timestamp_tz": pd.to_datetime(["2024-01-01", "2024-01-02", None]).tz_localize("UTC"),
+            "date": pd.Series([datetime.date(2024, 1, 1), None, datetime.date(1969, 12, 31)], dtype=object),
+            "duration": pd.to_timedelta(["-1.0005ms", "1.9995ms", None]),
+            "decimal": pd.Series([Decimal("1.25"), None, Decimal("3")], dtype=object),
+            "mixed": pd.Series([1, "a", None], dtype=object),
+        }
+    )
+    df = DataFrame.from_pandas(pandas_df)
+    assert df.data == [tuple(row) for row in json.loads(pandas_df.to_json(orient="values"))]
+
+    # Decimals and mixed values are converted by pandas, so there is no Arrow table to reuse
+    assert df._get_arrow_table() is None
+    df = DataFrame.from_pandas(pandas_df.drop(columns=["decimal", "mixed"]))
+    assert df._get_arrow_table() is not None
+
+
+def test_to_arrow_ipc():
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+
+    df = DataFrame.from_data(
+        columns={"id": "integer", "name": "text", "value": "unknown"},
+        data=[(1, "Alice", 1), (2, None, "a")],
+        limit=2,
+        more=True,
+    )
+
+    table = pyarrow.ipc.open_stream(df.to_arrow_ipc()).read_all()
+    assert table.column_names == ["id", "name", "value"]
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("name").to_pylist() == ["Alice", None]
+    # Values of mixed types are sent as text
+    assert table.column("value").to_pylist() == ["1", "a"]
+    assert table.schema.metadata == {b"limit": b"2", b"more": b"true"}
+
+
+def _buffer_address(table):
+    return table.column(0).chunk(0).buffers()[1].address
+
+
+def test_to_arrow_reuses_the_table():
+    pytest.importorskip("pyarrow")
+
+    df = DataFrame.from_data(columns={"id": "integer"}, data=[(1,), (2,)])
+    table = df.to_arrow()
+    assert _buffer_address(df.to_arrow()) == _buffer_address(table)
+
+    # The table is rebuilt once the rows change
+    df.data = [(3,)]
+    assert df.to_arrow().column("id").to_pylist() == [3]
+
+    # The table built by from_pandas is used as is
+    pd = pytest.importorskip("pandas")
+    df = DataFrame.from_pandas(pd.DataFrame({"id": [1, 2]}))
+    df.next_page_token = "token"
+    table = df.to_arrow()
+    assert _buffer_address(table) == _buffer_address(df.to_arrow())
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.schema.metadata == {b"next_page_token": b'"token"'}
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from recce.tasks.histogram import (
@@ -98,6 +100,117 @@ def test_histogram_emtpy(dbt_test_helper):
     assert run_result["bin_edges"][-1] == 51
 
 
+def test_histogram_single_query(dbt_test_helper):
+    csv_data_base = """
+        customer_id,age,score,signup
+        1,30,1.5,2024-01-05
+        2,25,2.5,2024-02-10
+        3,35,3.5,2024-03-15
+        """
+
+    csv_data_curr = """
+        customer_id,age,score,signup
+        1,30,1.5,2024-01-05
+        2,25,2.5,2024-02-10
+        3,35,4.5,2024-03-15
+        4,50,9.5,2024-06-20
+        """
+
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    with dbt_test_helper.adapter.connection_named("alter"):
+        for schema in [dbt_test_helper.base_schema, dbt_test_helper.curr_schema]:
+            dbt_test_helper.adapter.execute(f"ALTER TABLE {schema}.customers ALTER signup TYPE DATE")
+    execute = dbt_test_helper.adapter.execute
+
+    def run(column_name, column_type):
+        params = {"model": "customers", "column_name": column_name, "column_type": column_type}
+        with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+            run_result = HistogramDiffTask(params).execute()
+        return run_result, mock_execute.call_count
+
+    # The bounds and the bins of both environments come from one statement
+    run_result, call_count = run("age", "int")
+    assert call_count == 1
+    assert run_result["min"] == 25
+    assert run_result["max"] == 50
+    assert run_result["base"]["total"] == 3
+    assert run_result["current"]["total"] == 4
+    assert sum(run_result["base"]["counts"]) == 3
+    assert run_result["current"]["counts"][-1] == 1
+
+    run_result, call_count = run("score", "double")
+    assert call_count == 1
+    assert len(run_result["base"]["counts"]) == 50
+    assert run_result["base"]["counts"][0] == 1
+    assert run_result["current"]["counts"][-1] == 1
+    assert sum(run_result["current"]["counts"]) == 4
+
+    # The bins of a datetime histogram depend on the bounds, which are queried first
+    run_result, call_count = run("signup", "date")
+    assert call_count == 2
+    assert run_result["base"]["counts"][:3] == [1, 1, 1]
+    assert run_result["current"]["counts"] == [1, 1, 1, 0, 0, 1]
+    assert run_result["current"]["total"] == 4
+
+
+def test_histogram_fallback(dbt_test_helper):
+    csv_data = """
+        customer_id,age
+        1,30
+        2,25
+        3,35
+        """
+
+    dbt_test_helper.create_model("customers", csv_data, csv_data)
+    params = {"model": "customers", "column_name": "age", "column_type": "int"}
+    run_result = HistogramDiffTask(params).execute()
+
+    # If the union of both environments fails, each environment is queried on its own
+    with patch("recce.tasks.histogram.HISTOGRAM_NUMERIC_JINJA_TEMPLATE", "select * from missing_table"):
+        assert HistogramDiffTask(params).execute() == run_result
+
+    # If the per-environment query fails as well, the error is raised rather than returning empty bins
+    with patch("recce.tasks.histogram.HISTOGRAM_NUMERIC_JINJA_TEMPLATE", "select * from missing_table"), patch(
+        "recce.tasks.histogram.generate_histogram_sql_integer", return_value=("select * from missing_table", 1)
+    ):
+        with pytest.raises(Exception, match="missing_table"):
+            HistogramDiffTask(params).execute()
+
+
+def test_histogram_approximate(dbt_test_helper):
+    csv_data = "customer_id,age\n" + "".join(f"{i},{i % 50}\n" for i in range(1000))
+    dbt_test_helper.create_model("customers", csv_data, csv_data)
+    params = {"model": "customers", "column_name": "age", "column_type": "int", "approximate": True}
+
+    run_result = HistogramDiffTask(params).execute()
+    assert run_result["method"] == "exact"
+    assert run_result["current"]["counts"] == [20] * 50
+
+    with patch("recce.tasks.histogram.APPROX_SAMPLE_MIN_ROWS", 100):
+        run_result = HistogramDiffTask(params).execute()
+    assert run_result["method"] == "sample"
+    assert run_result["sample_percent"] == 10
+    assert run_result["current"]["total"] == 1000
+    assert all(count % 10 == 0 for count in run_result["current"]["counts"])
+
+
+def test_histogram_approximate_view(dbt_test_helper):
+    csv_data = "customer_id,age\n" + "".join(f"{i},{i % 50}\n" for i in range(1000))
+
+    def as_view(node):
+        node["config"]["materialized"] = "view"
+
+    # Only the current model is a view, but the sample clause applies to both relations
+    dbt_test_helper.create_model("customers", csv_data, None)
+    dbt_test_helper.create_model("customers", None, csv_data, patch_func=as_view)
+    params = {"model": "customers", "column_name": "age", "column_type": "int", "approximate": True}
+
+    with patch("recce.tasks.histogram.APPROX_SAMPLE_MIN_ROWS", 100):
+        run_result = HistogramDiffTask(params).execute()
+    assert run_result["method"] == "exact"
+    assert run_result["current"]["counts"] == [20] * 50
+
+
 def test_validator():
     def validate(params: dict = {}, view_options: dict = {}):
         HistogramDiffCheckValidator().validate(
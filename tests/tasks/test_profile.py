@@ -1,9 +1,15 @@
+from unittest.mock import patch
+
 import pytest
 from jinja2 import Template
 from sqlglot import parse_one
 
+import recce.tasks.profile as profile
 from recce.tasks import ProfileDiffTask, ProfileTask
-from recce.tasks.profile import PROFILE_COLUMN_JINJA_TEMPLATE
+from recce.tasks.profile import (
+    PROFILE_COLUMN_JINJA_TEMPLATE,
+    PROFILE_COLUMNS_JINJA_TEMPLATE,
+)
 
 csv_data_curr = """
         customer_id,name,age
@@ -56,6 +62,70 @@ def test_profile_diff_with_selected_columns(dbt_test_helper):
     assert len(run_result.base.data) == 2
 
 
+def test_profile_diff_batched(dbt_test_helper):
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    params = dict(model="customers")
+
+    execute = dbt_test_helper.adapter.execute
+    with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+        batched = ProfileDiffTask(params).execute()
+    # One scan per environment
+    assert mock_execute.call_count == 2
+
+    with patch.object(profile, "PROFILE_BATCH_SIZE", 2):
+        with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+            chunked = ProfileDiffTask(params).execute()
+    assert mock_execute.call_count == 4
+
+    with patch.object(profile, "PROFILE_BATCH_SIZE", 1):
+        per_column = ProfileDiffTask(params).execute()
+
+    assert batched == per_column
+    assert chunked == per_column
+    assert [row[0] for row in batched.current.data] == ["customer_id", "name", "age"]
+
+
+def test_profile_batched_fallback(dbt_test_helper):
+    DbtDatabaseError = profile._get_database_error()
+
+    dbt_test_helper.create_model("customers", None, csv_data_curr)
+    params = dict(model="customers")
+    expected = ProfileTask(params).execute()
+
+    execute = dbt_test_helper.adapter.execute
+
+    def _execute(sql, **kwargs):
+        if "c0__column_name" in sql:
+            raise DbtDatabaseError("batched query is not supported")
+        return execute(sql, **kwargs)
+
+    with patch.object(dbt_test_helper.adapter, "execute", side_effect=_execute) as mock_execute:
+        run_result = ProfileTask(params).execute()
+    # The failed batch and then one query per column
+    assert mock_execute.call_count == 4
+    assert run_result == expected
+
+
+def test_profile_approximate(dbt_test_helper):
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    exact = ProfileDiffTask(dict(model="customers")).execute()
+    assert exact.method == "exact"
+
+    execute = dbt_test_helper.adapter.execute
+    with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+        run_result = ProfileDiffTask(dict(model="customers", approximate=True)).execute()
+    assert run_result.method == "approximate"
+    assert all("approx_count_distinct" in call.args[0] for call in mock_execute.call_args_list)
+
+    columns = [column.key for column in run_result.current.columns]
+    for approx_row, exact_row in zip(run_result.current.data, exact.current.data):
+        approx_row = dict(zip(columns, approx_row))
+        exact_row = dict(zip(columns, exact_row))
+        assert approx_row["distinct_count"] == exact_row["distinct_count"]
+        assert approx_row["row_count"] == exact_row["row_count"]
+        assert approx_row["is_unique"] is None
+
+
 def test_validator():
     from recce.tasks.profile import ProfileCheckValidator
 
@@ -395,3 +465,18 @@ def test_profile_column_jinja_template():
             sql = Template(PROFILE_COLUMN_JINJA_TEMPLATE).render(context)
             dialect = db_type if db_type != "sqlserver" else "tsql"
             parse_one(sql, read=dialect)
+
+        context = {
+            "columns": [{"name": f"column_{i}", "type": column_type} for i, column_type in enumerate(column_types)],
+            "db_type": db_type,
+            "relation": "test_table",
+            "adapter": DummyAdapter(),
+            "dbt": DummyDbt(),
+        }
+        sql = Template(PROFILE_COLUMNS_JINJA_TEMPLATE).render(context)
+        dialect = db_type if db_type != "sqlserver" else "tsql"
+        assert len(parse_one(sql, read=dialect).expressions) == len(column_types) * len(profile.PROFILE_METRICS)
+
+        context.update(approximate=True, approx_db_types=profile.PROFILE_APPROX_DB_TYPES)
+        sql = Template(PROFILE_COLUMNS_JINJA_TEMPLATE).render(context)
+        assert len(parse_one(sql, read=dialect).expressions) == len(column_types) * len(profile.PROFILE_METRICS)
@@ -1,6 +1,11 @@
+import threading
+from unittest.mock import patch
+
 import pytest
 
-from recce.tasks import QueryDiffTask, QueryTask
+from recce.exceptions import RecceCancelException, RecceException
+from recce.tasks import QueryBaseTask, QueryDiffTask, QueryTask
+from recce.tasks.query import decode_page_token, encode_page_token
 
 
 def test_query_diff_in_client(dbt_test_helper):
@@ -88,6 +93,148 @@ def test_query_diff_in_warehouse(dbt_test_helper):
     assert len(run_result.diff.data) == 4
 
 
+def test_query_diff_runs_base_and_current_concurrently(dbt_test_helper):
+    csv_data = """
+        customer_id,name,age
+        1,Alice,30
+        2,Bob,25
+        """
+    dbt_test_helper.create_model("customers", csv_data, csv_data)
+
+    # Both sides have to reach the barrier at the same time, which is impossible if they run one after the other
+    barrier = threading.Barrier(2, timeout=10)
+    connection_names = set()
+    execute_sql_with_limit = QueryDiffTask.execute_sql_with_limit
+
+    def _execute_sql_with_limit(sql_template, base=False, limit=None, offset=0):
+        connection_names.add(dbt_test_helper.adapter.get_thread_connection().name)
+        barrier.wait()
+        return execute_sql_with_limit(sql_template, base=base, limit=limit, offset=offset)
+
+    task = QueryDiffTask(dict(sql_template='select * from {{ ref("customers") }}'))
+    with patch.object(task, "execute_sql_with_limit", side_effect=_execute_sql_with_limit):
+        run_result = task.execute()
+    assert len(run_result.base.data) == 2
+    assert len(run_result.current.data) == 2
+    assert connection_names == {"query (base)", "query (current)"}
+
+
+def test_query_diff_cancel_closes_both_connections(dbt_test_helper):
+    csv_data = """
+        customer_id,name,age
+        1,Alice,30
+        """
+    dbt_test_helper.create_model("customers", csv_data, csv_data)
+
+    barrier = threading.Barrier(3, timeout=10)
+    released = threading.Event()
+    closed = []
+
+    def _execute_sql_with_limit(sql_template, base=False, limit=None, offset=0):
+        barrier.wait()
+        released.wait(10)
+        return None, False
+
+    task = QueryDiffTask(dict(sql_template='select * from {{ ref("customers") }}'))
+
+    def _close_connection(connection):
+        closed.append(connection.name)
+        if len(closed) == 3:
+            released.set()
+
+    def _cancel():
+        barrier.wait()
+        task.cancel()
+
+    canceller = threading.Thread(target=_cancel)
+    canceller.start()
+    with patch.object(task, "execute_sql_with_limit", side_effect=_execute_sql_with_limit), patch.object(
+        task, "close_connection", side_effect=_close_connection
+    ):
+        with pytest.raises(RecceCancelException):
+            task.execute()
+    canceller.join()
+    assert sorted(closed) == ["query", "query (base)", "query (current)"]
+
+
+def test_query_pagination(dbt_test_helper):
+    csv_data_base = "customer_id,age\n" + "".join(f"{i},{i % 50}\n" for i in range(25))
+    csv_data_curr = "customer_id,age\n" + "".join(f"{i},{i % 50}\n" for i in range(30))
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    sql_template = 'select * from {{ ref("customers") }} order by customer_id'
+
+    def fetch_all(task_class, **params):
+        pages = []
+        page_token = None
+        while True:
+            page = task_class(dict(sql_template=sql_template, page_size=10, page_token=page_token, **params)).execute()
+            pages.append(page)
+            page_token = page.next_page_token
+            if page_token is None:
+                return pages
+
+    pages = fetch_all(QueryTask)
+    assert [len(page.data) for page in pages] == [10, 10, 10]
+    assert [page.more for page in pages] == [True, True, False]
+    assert [row[0] for page in pages for row in page.data] == list(range(30))
+
+    pages = fetch_all(QueryBaseTask)
+    assert [len(page.data) for page in pages] == [10, 10, 5]
+    assert [row[0] for page in pages for row in page.data] == list(range(25))
+
+    # The same token selects the same page of both environments
+    page_token = encode_page_token(20)
+    run_result = QueryDiffTask(dict(sql_template=sql_template, page_size=10, page_token=page_token)).execute()
+    assert [row[0] for row in run_result.base.data] == list(range(20, 25))
+    assert [row[0] for row in run_result.current.data] == list(range(20, 30))
+    assert run_result.base.next_page_token is None
+    assert run_result.current.next_page_token is None
+
+    # Without a page size, a page holds QUERY_LIMIT rows
+    run_result = QueryTask(dict(sql_template=sql_template)).execute()
+    assert len(run_result.data) == 30
+    assert run_result.next_page_token is None
+
+    # A query without page params is limited, but does not return a page token
+    with patch("recce.tasks.query.QUERY_LIMIT", 10):
+        run_result = QueryTask(dict(sql_template=sql_template)).execute()
+        assert len(run_result.data) == 10
+        assert run_result.more is True
+        assert run_result.next_page_token is None
+
+        run_result = QueryDiffTask(dict(sql_template=sql_template)).execute()
+        assert run_result.current.more is True
+        assert run_result.current.next_page_token is None
+
+
+def test_query_diff_join_pagination(dbt_test_helper):
+    csv_data_base = "customer_id,age\n" + "".join(f"{i},{i}\n" for i in range(30))
+    csv_data_curr = "customer_id,age\n" + "".join(f"{i},{i + 1 if i % 2 else i}\n" for i in range(30))
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    params = dict(sql_template='select * from {{ ref("customers") }}', primary_keys=["customer_id"], page_size=12)
+
+    # 15 changed rows, each as a removed and an added record
+    first = QueryDiffTask(params).execute()
+    assert len(first.diff.data) == 12
+    assert first.diff.more is True
+    assert decode_page_token(first.diff.next_page_token) == 12
+
+    rows = list(first.diff.data)
+    page_token = first.diff.next_page_token
+    while page_token is not None:
+        page = QueryDiffTask(dict(params, page_token=page_token)).execute()
+        rows.extend(page.diff.data)
+        page_token = page.diff.next_page_token
+    assert len(rows) == 30
+    assert rows == QueryDiffTask(dict(params, page_size=None)).execute().diff.data
+
+
+def test_query_invalid_page_token(dbt_test_helper):
+    dbt_test_helper.create_model("customers", "customer_id\n1\n", "customer_id\n1\n")
+    with pytest.raises(RecceException):
+        QueryTask(dict(sql_template='select * from {{ ref("customers") }}', page_token="not-a-token")).execute()
+
+
 def test_validator():
     from recce.tasks.query import QueryCheckValidator, QueryDiffCheckValidator
 
@@ -1,6 +1,12 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
+from recce.exceptions import RecceCancelException
 from recce.tasks import RowCountDiffTask
+from recce.tasks.rowcount import _string_literal
 
 
 def test_row_count(dbt_test_helper):
@@ -133,3 +139,148 @@ def test_validator():
                 "view_mode": "abc",
             }
         )
+
+
+def test_row_count_concurrent(dbt_test_helper):
+    csv_data_1 = """
+        customer_id,name,age
+        1,Alice,30
+        2,Bob,25
+        3,Charlie,35
+        """
+
+    csv_data_2 = """
+        customer_id,name,age
+        1,Alice,35
+        """
+
+    names = [f"model_{i}" for i in range(6)]
+    for i, name in enumerate(names):
+        dbt_test_helper.create_model(name, csv_data_1, csv_data_1 if i % 2 else csv_data_2)
+
+    progress = []
+    task = RowCountDiffTask(dict(node_names=names))
+    task.progress_listener = lambda message=None, percentage=None: progress.append(percentage)
+    with patch.object(RowCountDiffTask, "get_max_connections", return_value=3):
+        with patch("recce.tasks.query.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            run_result = task.execute()
+    assert mock_pool.call_args.kwargs["max_workers"] == 3
+
+    # Results keep the order of the nodes
+    assert list(run_result.keys()) == names
+    for i, name in enumerate(names):
+        assert run_result[name]["base"] == 3
+        assert run_result[name]["curr"] == (3 if i % 2 else 1)
+    assert sorted(progress) == [(i + 1) / len(names) for i in range(len(names))]
+
+
+def test_row_count_concurrent_cancel(dbt_test_helper):
+    csv_data = """
+        customer_id,name,age
+        1,Alice,30
+        """
+    names = [f"model_{i}" for i in range(6)]
+    for name in names:
+        dbt_test_helper.create_model(name, csv_data, csv_data)
+
+    barrier = threading.Barrier(3, timeout=10)
+    released = threading.Event()
+    queried = []
+    closed = []
+    task = RowCountDiffTask(dict(node_names=names))
+
+    def _query_row_count(dbt_adapter, model_name, base=False):
+        queried.append(model_name)
+        barrier.wait()
+        released.wait(10)
+        return 1
+
+    def _close_connection(connection):
+        closed.append(connection.name)
+        if len(closed) == 3:
+            released.set()
+
+    def _cancel():
+        barrier.wait()
+        task.cancel()
+
+    canceller = threading.Thread(target=_cancel)
+    canceller.start()
+    with patch.object(RowCountDiffTask, "get_max_connections", return_value=2), patch.object(
+        task, "_query_row_count", side_effect=_query_row_count
+    ), patch.object(task, "close_connection", side_effect=_close_connection):
+        with pytest.raises(RecceCancelException):
+            task.execute()
+    canceller.join()
+
+    # The in-flight statements are cancelled and the pending nodes are never queried
+    assert sorted(set(closed)) == ["diff: model_0", "diff: model_1", "query"]
+    assert sorted(queried) == ["model_0", "model_1"]
+
+
+def test_row_count_metadata_strategy(dbt_test_helper):
+    csv_data_1 = """
+        customer_id,name,age
+        1,Alice,30
+        2,Bob,25
+        3,Charlie,35
+        """
+
+    csv_data_2 = """
+        customer_id,name,age
+        1,Alice,35
+        """
+
+    def _as_view(node_dict):
+        node_dict["config"]["materialized"] = "view"
+
+    dbt_test_helper.create_model("model_1", csv_data_1, csv_data_2)
+    dbt_test_helper.create_model("model_2", csv_data_2, csv_data_1)
+    dbt_test_helper.create_model("model_3", csv_data_1, csv_data_1, patch_func=_as_view)
+    names = ["model_1", "model_2", "model_3"]
+
+    expected = RowCountDiffTask(dict(node_names=names)).execute()
+
+    execute = dbt_test_helper.adapter.execute
+    with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+        run_result = RowCountDiffTask(dict(node_names=names, strategy="metadata")).execute()
+    assert {node: dict(base=r["base"], curr=r["curr"]) for node, r in run_result.items()} == expected
+
+    # The counts from the metadata are marked as estimated
+    assert run_result["model_1"]["method"] == dict(base="metadata", curr="metadata")
+    assert run_result["model_1"]["estimated"] is True
+    assert run_result["model_3"]["method"] == dict(base="count", curr="count")
+    assert run_result["model_3"]["estimated"] is False
+
+    # One metadata query per schema, and count(*) only for the view
+    sqls = [call.args[0] for call in mock_execute.call_args_list]
+    assert len([sql for sql in sqls if "duckdb_tables()" in sql]) == 2
+    assert len([sql for sql in sqls if "count(*)" in sql]) == 2
+    assert all("model_3" in sql for sql in sqls if "count(*)" in sql)
+
+
+def test_row_count_metadata_sql_escapes_names(dbt_test_helper):
+    dbt_test_helper.create_model("model_1", "id\n1\n", "id\n1\n")
+    task = RowCountDiffTask(dict(node_names=["model_1"], strategy="metadata"))
+    adapter = dbt_test_helper.adapter
+
+    create_relation = adapter.create_relation
+
+    def _create_relation(model, base=False):
+        return create_relation(model, base=base).incorporate(path=dict(schema="it's"))
+
+    execute = adapter.execute
+    with patch.object(adapter, "create_relation", side_effect=_create_relation), patch.object(
+        adapter, "execute", side_effect=execute
+    ) as mock_execute, adapter.connection_named("query"):
+        assert task._query_metadata_row_counts(adapter, ["model_1"]) == {}
+
+    sql = mock_execute.call_args_list[0].args[0]
+    assert "schema_name = 'it''s'" in sql
+
+
+def test_string_literal():
+    assert _string_literal(None, "postgres") is None
+    assert _string_literal("it's", "postgres") == "'it''s'"
+    assert _string_literal(r"a\b", "postgres") == r"'a\b'"
+    assert _string_literal(r"a\b'", "snowflake") == r"'a\\b'''"
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from recce.tasks import TopKDiffTask
+from recce.tasks.sampling import scale_sample_count
 from recce.tasks.top_k import TopKDiffCheckValidator
 
 
@@ -54,6 +57,53 @@ def test_top_k(dbt_test_helper):
     assert run_result["base"]["total"] == 4
 
 
+def test_top_k_approximate(dbt_test_helper):
+    csv_data = "customer_id,name\n" + "".join(f"{i},{'Alice' if i % 3 else 'Bob'}\n" for i in range(1000))
+    dbt_test_helper.create_model("customers", csv_data, csv_data)
+    params = dict(model="customers", column_name="name", approximate=True)
+
+    # Small relations are always read in full
+    run_result = TopKDiffTask(params).execute()
+    assert run_result["method"] == "exact"
+    assert run_result["current"]["counts"] == [666, 334]
+
+    execute = dbt_test_helper.adapter.execute
+    with patch("recce.tasks.top_k.APPROX_SAMPLE_MIN_ROWS", 100):
+        with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+            run_result = TopKDiffTask(params).execute()
+    assert run_result["method"] == "sample"
+    assert run_result["sample_percent"] == 10
+    # The row counts come from the metadata, and every query on the relations reads the sample only
+    sqls = [c.args[0] for c in mock_execute.call_args_list]
+    assert len([sql for sql in sqls if "duckdb_tables()" in sql]) == 2
+    assert all("tablesample 10 percent" in sql for sql in sqls if "duckdb_tables()" not in sql)
+    # The totals, the valid values and the counts are scaled up from the sample, with the interval of the totals
+    current = run_result["current"]
+    assert all(count % 10 == 0 for count in current["counts"] + [current["total"], current["valids"]])
+    lower, upper = current["total_interval"]
+    assert lower <= current["total"] <= upper
+    assert "valids_interval" in run_result["base"]
+
+
+def test_top_k_approximate_view(dbt_test_helper):
+    csv_data = "customer_id,name\n" + "".join(f"{i},{'Alice' if i % 3 else 'Bob'}\n" for i in range(1000))
+
+    def as_view(node):
+        node["config"]["materialized"] = "view"
+
+    dbt_test_helper.create_model("customers", csv_data, csv_data, patch_func=as_view)
+    params = dict(model="customers", column_name="name", approximate=True)
+
+    # Views cannot be sampled, so they are read in full
+    execute = dbt_test_helper.adapter.execute
+    with patch("recce.tasks.top_k.APPROX_SAMPLE_MIN_ROWS", 100):
+        with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+            run_result = TopKDiffTask(params).execute()
+    assert run_result["method"] == "exact"
+    assert run_result["current"]["counts"] == [666, 334]
+    assert all("tablesample" not in c.args[0] for c in mock_execute.call_args_list)
+
+
 def test_validator():
     def validate(params: dict = {}, view_options: dict = {}):
         TopKDiffCheckValidator().validate(
@@ -75,3 +125,10 @@ def test_validator():
 
     with pytest.raises(ValueError):
         validate({})
+
+
+def test_scale_sample_count():
+    assert scale_sample_count(100, 10) == (1000, (814, 1186))
+    assert scale_sample_count(0, 10) == (0, (0, 0))
+    # All the rows are read, so the count is exact
+    assert scale_sample_count(100, 100) == (100, (100, 100))
@@ -1,8 +1,15 @@
+from unittest.mock import patch
+
 import pytest
 
+import recce.tasks.valuediff as valuediff
 from recce.tasks import ValueDiffDetailTask, ValueDiffTask
 
 
+def _diff_statements(mock_execute):
+    return len([c for c in mock_execute.call_args_list if "INVALIDS" not in c.args[0]])
+
+
 def test_value_diff(dbt_test_helper):
     csv_data_curr = """
         customer_id,name,age
@@ -21,9 +28,13 @@ def test_value_diff(dbt_test_helper):
     dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
     params = dict(model="customers", primary_key=["customer_id"])
     task = ValueDiffTask(params)
-    run_result = task.execute()
+    execute = dbt_test_helper.adapter.execute
+    with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+        run_result = task.execute()
     assert len(run_result.data.columns) == 3
     assert len(run_result.data.data) == 3
+    # The primary key is verified through the adapter, like the other statements of the task
+    assert len([c for c in mock_execute.call_args_list if "INVALIDS" in c.args[0]]) == 2
 
     params = dict(model="customers", primary_key=["customer_id"])
     task = ValueDiffDetailTask(params)
@@ -32,6 +43,80 @@ def test_value_diff(dbt_test_helper):
     assert len(run_result.data) == 2
 
 
+def test_value_diff_single_join(dbt_test_helper):
+    csv_data_curr = """
+        customer_id,name,age
+        1,Alice,30
+        2,Bob,25
+        4,Dan,
+        5,Eve,40
+        """
+
+    csv_data_base = """
+        customer_id,name,age
+        1,Alice,35
+        2,Bob,25
+        3,Charlie,35
+        4,Dan,
+        """
+
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+    params = dict(model="customers", primary_key="customer_id")
+
+    execute = dbt_test_helper.adapter.execute
+    with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+        run_result = ValueDiffTask(params).execute()
+    # Besides the primary key checks of both environments
+    assert _diff_statements(mock_execute) == 1
+    assert run_result.summary.total == 5
+    assert run_result.summary.added == 1
+    assert run_result.summary.removed == 1
+    assert [tuple(row[:2]) for row in run_result.data.data] == [("customer_id", 3), ("name", 3), ("age", 2)]
+    assert run_result.scans_saved == 4
+
+    with patch.object(valuediff, "VALUE_DIFF_BATCH_SIZE", 2):
+        with patch.object(dbt_test_helper.adapter, "execute", side_effect=execute) as mock_execute:
+            chunked = ValueDiffTask(params).execute()
+    assert _diff_statements(mock_execute) == 2
+    assert chunked.summary == run_result.summary
+    assert chunked.data == run_result.data
+    assert chunked.scans_saved == 2
+
+
+def test_value_diff_sample(dbt_test_helper):
+    csv_data_base = "customer_id,name,age\n" + "".join(f"{i},name{i},{i % 7}\n" for i in range(2000))
+    csv_data_curr = "customer_id,name,age\n" + "".join(f"{i},name{i},{i % 7 if i % 4 else -1}\n" for i in range(2000))
+    dbt_test_helper.create_model("customers", csv_data_base, csv_data_curr)
+
+    exact = ValueDiffTask(dict(model="customers", primary_key="customer_id")).execute()
+    assert exact.method == "exact"
+    assert exact.sample_percent is None
+
+    params = dict(model="customers", primary_key="customer_id", sample_percent=25)
+    run_result = ValueDiffTask(params).execute()
+    assert run_result.method == "sample"
+    assert run_result.sample_percent == 25
+    # Roughly a quarter of the keys are sampled, and the same keys are picked in both relations
+    assert 300 < run_result.sampled_rows < 700
+    assert run_result.summary.added == 0
+    assert run_result.summary.removed == 0
+    assert run_result.summary.total == run_result.sampled_rows * 4
+
+    assert run_result.data.columns[3].key == "matched_p_low"
+    assert run_result.data.columns[4].key == "matched_p_high"
+    rows = {row[0]: row for row in run_result.data.data}
+    assert rows["customer_id"][2] == 1
+    assert rows["name"][2] == 1
+    _, _, age_p, age_p_low, age_p_high = rows["age"]
+    assert age_p_low < age_p < age_p_high
+    assert age_p_low < 0.75 < age_p_high
+
+    # The detail only shows the changed rows of the sampled keys, and the same keys are sampled on every run
+    detail = ValueDiffDetailTask(params).execute()
+    assert len(detail.data) == 2 * round(run_result.sampled_rows * (1 - age_p))
+    assert ValueDiffDetailTask(params).execute().data == detail.data
+
+
 def test_validator():
     from recce.tasks.valuediff import ValueDiffCheckValidator
 
@@ -57,6 +142,21 @@ def test_validator():
             "primary_key": ["customer_id"],
         }
     )
+    validate(
+        {
+            "model": "customers",
+            "primary_key": "customer_id",
+            "sample_percent": 1,
+        }
+    )
+    with pytest.raises(ValueError):
+        validate(
+            {
+                "model": "customers",
+                "primary_key": "customer_id",
+                "sample_percent": 0,
+            }
+        )
     validate(
         {
             "model": "customers",
@@ -2,8 +2,11 @@
 import os
 import unittest
 from datetime import datetime
+from unittest.mock import MagicMock
 
-from recce.core import RecceContext
+import pytest
+
+from recce.core import RecceContext, set_default_context
 from recce.models import Check, Run, RunType
 from recce.state import ArtifactsRoot, FileStateLoader, RecceState
 from tests.adapter.dbt_adapter.conftest import dbt_test_helper  # noqa: F401
@@ -172,3 +175,23 @@ def test_lineage_diff(dbt_test_helper):
     assert nodediff is None
     nodediff2 = result.diff.get("model2")
     assert nodediff2 is not None and nodediff2.change_status == "modified"
+
+
+def test_close_shuts_down_the_process_pool(dbt_test_helper):
+    context = dbt_test_helper.context
+    adapter = context.adapter
+    adapter.cll_workers = 2
+    pool = adapter._get_process_pool()
+
+    context.close()
+    assert adapter._process_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(print)
+
+
+def test_replacing_the_default_context_closes_the_previous_one():
+    previous = RecceContext(adapter=MagicMock())
+    set_default_context(previous)
+    set_default_context(RecceContext(adapter=MagicMock()))
+    previous.adapter.close.assert_called_once()
+    set_default_context(None)
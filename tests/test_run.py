@@ -0,0 +1,98 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+from recce.models.types import RunType
+from recce.run import execute_preset_checks
+
+
+def _submit_run(delays, errors=(), queued=None):
+    """
+    A fake submit_run whose run takes the delay of its model, and fails if the model is in `errors`. A run waits for
+    the delay in `queued` of its model before it starts.
+    """
+    running = []
+    max_running = [0]
+    queued = queued or {}
+
+    def submit_run(check_type, params, check_id=None):
+        model = params["model"]
+        run = MagicMock(run_id=model, type=RunType(check_type), error=None, started_at=None)
+
+        async def _run():
+            await asyncio.sleep(queued.get(model, 0))
+            run.started_at = time.time()
+            running.append(model)
+            max_running[0] = max(max_running[0], len(running))
+            await asyncio.sleep(delays[model])
+            running.remove(model)
+            if model in errors:
+                run.error = f"{model} failed"
+                raise Exception(run.error)
+            return {}
+
+        return run, asyncio.ensure_future(_run())
+
+    return submit_run, max_running
+
+
+def _preset_checks(models):
+    return [dict(name=f"check {model}", type="query", params=dict(model=model)) for model in models]
+
+
+def _execute(preset_checks, submit_run, concurrency):
+    with patch("recce.run.submit_run", side_effect=submit_run), patch("recce.run.purge_preset_checks"), patch(
+        "recce.run.create_check_from_run"
+    ) as create_check_from_run, patch("recce.run.Table") as table:
+        start = time.time()
+        rc, failed_checks = asyncio.run(execute_preset_checks(preset_checks, False, concurrency))
+        elapsed = time.time() - start
+    rows = [c.args for c in table.return_value.add_row.call_args_list]
+    created = [c.args[1] for c in create_check_from_run.call_args_list]
+    return rc, failed_checks, rows, created, elapsed
+
+
+def test_execute_preset_checks_concurrently():
+    delays = {"a": 0.3, "b": 0.1, "c": 0.2, "d": 0.1}
+    submit_run, max_running = _submit_run(delays)
+
+    rc, failed_checks, rows, created, elapsed = _execute(_preset_checks(delays.keys()), submit_run, 4)
+    assert rc == 0
+    assert failed_checks == []
+    assert max_running[0] == 4
+    # The wall time approaches the slowest check rather than the total
+    assert elapsed < 0.6
+
+    # The checks are created and reported in order, each with its own execution time
+    assert created == ["check a", "check b", "check c", "check d"]
+    assert [row[1] for row in rows] == ["check a", "check b", "check c", "check d"]
+    times = [float(row[3].split()[0]) for row in rows]
+    assert times[0] >= 0.3
+    assert times[1] < 0.3
+
+
+def test_execute_preset_checks_concurrency_limit():
+    delays = {"a": 0.05, "b": 0.05, "c": 0.05, "d": 0.05, "e": 0.05}
+    submit_run, max_running = _submit_run(delays, errors={"c"})
+
+    rc, failed_checks, rows, created, _ = _execute(_preset_checks(delays.keys()), submit_run, 2)
+    assert max_running[0] == 2
+    assert rc == 1
+    assert [row[1] for row in rows] == ["check a", "check b", "check c", "check d", "check e"]
+    assert rows[2][0] == "[[red]Failed[/red]]"
+    assert failed_checks[0]["check_name"] == "check c"
+    assert failed_checks[0]["failed_reason"] == "c failed"
+
+    # One check at a time by default
+    submit_run, max_running = _submit_run(delays)
+    _execute(_preset_checks(delays.keys()), submit_run, 1)
+    assert max_running[0] == 1
+
+
+def test_execute_preset_checks_time_excludes_the_queue():
+    delays = {"a": 0.1}
+    submit_run, _ = _submit_run(delays, queued={"a": 0.3})
+
+    _, _, rows, _, elapsed = _execute(_preset_checks(delays.keys()), submit_run, 1)
+    assert elapsed >= 0.4
+    assert float(rows[0][3].split()[0]) < 0.3
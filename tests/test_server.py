@@ -139,3 +139,27 @@ def test_keep_alive_with_idle_timeout():
 
     # Cleanup
     app.state.last_activity = None
+
+
+@pytest.mark.asyncio
+async def test_broadcast_run_event_sends_the_progress_as_json():
+    import json
+    from unittest.mock import AsyncMock
+
+    from recce.models.types import Run, RunProgress, RunStatus, RunType
+    from recce.server import broadcast_run_event, clients
+
+    client = AsyncMock()
+    clients.add(client)
+    try:
+        run = Run(type=RunType.QUERY, status=RunStatus.RUNNING)
+        run.progress = RunProgress(message="Querying the base environment", percentage=0.5)
+        await broadcast_run_event("progress", run)
+    finally:
+        clients.discard(client)
+
+    message = json.loads(client.send_text.call_args.args[0])
+    assert message["command"] == "run_progress"
+    assert message["event"]["runId"] == str(run.run_id)
+    assert message["event"]["status"] == "running"
+    assert message["event"]["progress"] == {"message": "Querying the base environment", "percentage": 0.5}
@@ -0,0 +1,88 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlglot import parse_one
+from sqlglot.errors import ParseError
+
+from recce.util.ast_cache import AstCache
+
+
+def test_parse_returns_copies():
+    cache = AstCache()
+    a = cache.parse("select a from t", dialect="duckdb")
+    b = cache.parse("select a from t", dialect="duckdb")
+    assert a == b
+    assert a is not b
+    assert cache.misses == 1
+    assert cache.hits == 1
+
+    # mutating a copy does not affect the cached expression
+    a.set("expressions", [])
+    assert cache.parse("select a from t", dialect="duckdb") == b
+
+
+def test_qualify_keyed_by_schema():
+    cache = AstCache()
+    sql = "select * from t"
+    q1 = cache.qualify(sql, schema={"t": {"a": "int"}})
+    q2 = cache.qualify(sql, schema={"t": {"a": "int", "b": "int"}})
+    assert len(q1.expressions) == 1
+    assert len(q2.expressions) == 2
+    # the parse result is shared by both
+    assert cache.hits == 1
+
+
+def test_errors_are_cached():
+    cache = AstCache()
+    with pytest.raises(ParseError):
+        cache.parse("select (")
+    with pytest.raises(ParseError):
+        cache.qualify("select (", schema={})
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+
+def test_qualify_allow_partial():
+    cache = AstCache()
+    sql = "select x from t1 join t2 on t1.id = t2.id"
+    schema = {"t1": {"id": "int", "x": "int"}, "t2": {"id": "int", "x": "int"}}
+    with pytest.raises(Exception):
+        cache.qualify(sql, schema=schema)
+    assert cache.qualify(sql, schema=schema, allow_partial=True) is not None
+
+
+def test_capacity():
+    cache = AstCache(capacity=1)
+    cache.parse("select 1")
+    cache.parse("select 2")
+    cache.parse("select 1")
+    assert cache.misses == 3
+
+
+def test_cached_errors_are_raised_as_new_exceptions():
+    cache = AstCache()
+    with pytest.raises(ParseError) as first:
+        cache.parse("select (")
+    with pytest.raises(ParseError) as second:
+        cache.parse("select (")
+    assert first.value is not second.value
+    assert str(first.value) == str(second.value)
+    assert first.value.errors == second.value.errors
+
+
+def test_each_key_is_computed_once():
+    cache = AstCache()
+    calls = []
+
+    def _compute():
+        calls.append(True)
+        time.sleep(0.05)
+        return parse_one("select 1"), None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache._get_or_compute("key", _compute), range(8)))
+    assert len(calls) == 1
+    assert cache.misses == 1
+    assert cache.hits == 7
+    assert len({id(result) for result in results}) == 8
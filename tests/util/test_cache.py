@@ -0,0 +1,92 @@
+import os
+from unittest.mock import patch
+
+from recce.util.cache import DiskCache, LRUCache, TTLCache
+
+
+def test_lru_cache():
+    cache = LRUCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", None)
+    assert "b" in cache
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(str(tmp_path), "cll", salt="v1")
+    key = ("select 1 as c", {"t": {"c": "int"}}, "duckdb")
+    assert cache.get(key) is None
+
+    cache.put(key, {"m2c": []})
+    assert cache.get(key) == {"m2c": []}
+    assert DiskCache(str(tmp_path), "cll", salt="v1").get(key) == {"m2c": []}
+
+    # Other salt or namespace do not share the entries
+    assert DiskCache(str(tmp_path), "cll", salt="v2").get(key) is None
+    assert DiskCache(str(tmp_path), "change_analysis", salt="v1").get(key) is None
+
+
+def test_disk_cache_corrupted_entry(tmp_path):
+    cache = DiskCache(str(tmp_path), "cll")
+    cache.put("key", {"a": 1})
+    path = cache._path(cache._hash("key"))
+    assert os.path.isfile(path)
+
+    with open(path, "w") as f:
+        f.write("{not json")
+    assert cache.get("key") is None
+
+
+def test_disk_cache_prune(tmp_path):
+    now = [1000.0]
+    cache = DiskCache(str(tmp_path), "cll", salt="v1", max_age=100, timer=lambda: now[0])
+    cache.put("old", 1)
+    cache.put("used", 2)
+    stale = DiskCache(str(tmp_path), "cll", salt="v0")
+    stale.put("key", 3)
+
+    old_path, used_path = cache._path(cache._hash("old")), cache._path(cache._hash("used"))
+    stale_path = stale._path(stale._hash("key"))
+    for path in [old_path, used_path, stale_path]:
+        os.utime(path, (800, 800))
+
+    # A hit keeps the entry
+    assert cache.get("used") == 2
+    assert cache.prune() == 2
+    assert not os.path.exists(old_path)
+    assert not os.path.exists(stale_path)
+    assert cache.get("used") == 2
+
+
+def test_disk_cache_prunes_on_first_write(tmp_path):
+    cache = DiskCache(str(tmp_path), "cll", max_age=0)
+    with patch.object(DiskCache, "prune") as mock_prune:
+        cache.put("a", 1)
+        cache.put("b", 2)
+        DiskCache(str(tmp_path), "cll").put("c", 3)
+    mock_prune.assert_called_once()
+
+
+def test_ttl_cache():
+    now = [0.0]
+    cache = TTLCache(capacity=2, ttl=10, timer=lambda: now[0])
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    # The least recently used entry is evicted
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now[0] = 5
+    cache.put("c", 4)
+    now[0] = 10
+    assert cache.get("a") is None
+    assert cache.get("c") == 4
+    now[0] = 15
+    assert cache.get("c") is None
+    assert len(cache) == 0
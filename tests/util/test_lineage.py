@@ -1,4 +1,4 @@
-from recce.util.lineage import find_downstream, find_upstream
+from recce.util.lineage import GraphIndex, find_downstream, find_upstream
 
 
 class TestFindUpstreamDownstream:
@@ -120,3 +120,33 @@ class TestFindUpstreamDownstream:
         # Cross-component queries should find nothing
         upstream_cross = find_upstream(["a1"], {"a2": ["b2"]})
         assert upstream_cross == set()
+
+
+class TestGraphIndex:
+    """Test that GraphIndex returns the same closures as find_upstream/find_downstream"""
+
+    parent_map = {"a": ["b"], "b": ["d", "e"], "c": ["e", "f"], "d": ["g"], "e": ["g"], "f": ["h"], "x": ["x"]}
+    child_map = {
+        "g": ["d", "e"],
+        "d": ["b"],
+        "e": ["b", "c"],
+        "b": ["a"],
+        "f": ["c"],
+        "h": ["f"],
+        "x": ["x"],
+    }
+
+    def _assert_same_closures(self, index):
+        for start in [[], ["a"], ["g"], ["e"], ["a", "h"], ["x"], ["unknown"]]:
+            assert index.find_upstream(start) == find_upstream(start, self.parent_map)
+            assert index.find_downstream(start) == find_downstream(start, self.child_map)
+
+    def test_closures(self):
+        self._assert_same_closures(GraphIndex(self.parent_map, self.child_map))
+
+    def test_child_map_derived_from_parent_map(self):
+        self._assert_same_closures(GraphIndex(self.parent_map))
+
+    def test_closures_without_numpy(self, monkeypatch):
+        monkeypatch.setattr("recce.util.lineage.np", None)
+        self._assert_same_closures(GraphIndex(self.parent_map, self.child_map))